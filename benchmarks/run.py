@@ -0,0 +1,252 @@
+"""
+Time each documentation stage on synthetic projects of several sizes.
+
+Run as ``python -m benchmarks.run --sizes small,medium --output results.json``
+and compare two result files with ``python -m benchmarks.run --compare
+BASELINE.json RESULTS.json``.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .synthetic import SIZES, generate_project
+
+RESULTS_VERSION = 1
+
+def _time(function: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Run a stage ``repeat`` times and summarize its wall-clock times."""
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - started)
+    return {'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+def _measure(project: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Time every stage on one project.
+
+    Runs in a fresh process per project, since django.setup() can only
+    configure one project per process.
+    """
+    from django_autodoc.core.analyzer import ProjectAnalyzer
+    from django_autodoc.core.generator import DocumentationGenerator
+    from django_autodoc.core.static_analyzer import StaticProjectAnalyzer
+    from django_autodoc.utils.profiling import Profiler
+    from django_autodoc.utils.settings_discovery import search_settings_module
+
+    repeat = options['repeat']
+    workdir = tempfile.mkdtemp(prefix='autodoc-bench-')
+    output = os.path.join(workdir, 'docs')
+    cache_dir = os.path.join(workdir, 'cache')
+    stages = {}
+    try:
+        # Cold start: a fresh interpreter importing the CLI and printing its help
+        stages['cli_startup'] = _time(lambda: subprocess.run(
+            [sys.executable, '-m', 'django_autodoc.cli.main', '--help'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.DEVNULL, check=True,
+        ), repeat)
+        # The walk used when neither --settings nor manage.py names the settings
+        stages['settings_discovery'] = _time(lambda: search_settings_module(project['path']), repeat)
+        stages['static_analysis'] = _time(lambda: StaticProjectAnalyzer(project['path']).analyze(), repeat)
+
+        info = {}
+        def analyze() -> None:
+            info.update(ProjectAnalyzer(project['path'], project['settings_module']).analyze())
+        # The first run includes django.setup(); later runs measure analysis alone
+        stages['analysis_cold'] = _time(analyze, 1)
+        stages['analysis'] = _time(analyze, repeat)
+
+        ProjectAnalyzer(project['path'], project['settings_module'], cache_dir=cache_dir).analyze()
+        stages['analysis_cached'] = _time(
+            lambda: ProjectAnalyzer(project['path'], project['settings_module'], cache_dir=cache_dir).analyze(),
+            repeat,
+        )
+
+        def clean_output() -> None:
+            shutil.rmtree(output, ignore_errors=True)
+        profiler = Profiler()
+        for format in ('md', 'html'):
+            stages[f'generate_{format}'] = _time(
+                lambda: DocumentationGenerator(output, info, format=format, profiler=profiler).generate(),
+                repeat,
+                setup=clean_output,
+            )
+        stages['markdown_to_html'] = {
+            'min': profiler.summary()['phases'].get('markdown_to_html', {}).get('total', 0.0) / repeat,
+        }
+        stages['rebuild_unchanged'] = _time(lambda: DocumentationGenerator(output, info, format='html').generate(), repeat)
+
+        if options['capture'] or options['selenium']:
+            stages.update(_measure_capture(project, info, options, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return stages
+
+def _measure_capture(
+    project: Dict[str, Any],
+    info: Dict[str, Any],
+    options: Dict[str, Any],
+    workdir: str,
+) -> Dict[str, Dict[str, Any]]:
+    """Time capture stages against the project served by benchmarks.server."""
+    from django_autodoc.core.backends import HTTPSnapshotBackend
+    from django_autodoc.core.url_sampler import resolve_parameterized_urls
+    from .server import ADMIN_PASSWORD, ADMIN_USERNAME, start_server
+
+    stages = {}
+    process, base_url = start_server(project['path'])
+    try:
+        urls = info['urls'] + resolve_parameterized_urls(info['urls'])
+        stages['capture_http'] = _time(
+            lambda: HTTPSnapshotBackend(base_url, ADMIN_USERNAME, ADMIN_PASSWORD).capture(urls),
+            options['repeat'],
+        )
+        if options['selenium']:
+            from selenium.common.exceptions import WebDriverException
+            from django_autodoc.core.capturer import ScreenshotCapturer
+            try:
+                capturer = ScreenshotCapturer(
+                    base_url, os.path.join(workdir, 'screenshots'), ADMIN_USERNAME, ADMIN_PASSWORD,
+                    workers=options['workers'], use_cache=False,
+                )
+            except WebDriverException as e:
+                print(f"Skipping Selenium capture: {str(e).splitlines()[0]}")
+            else:
+                try:
+                    stages['capture_selenium'] = _time(lambda: capturer.capture(urls), 1)
+                finally:
+                    capturer.close()
+    finally:
+        process.terminate()
+        process.wait()
+    return stages
+
+def _git_revision() -> Optional[str]:
+    """Return the checked-out commit of the source tree, if it is a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(sizes: List[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Benchmark every stage at each size.
+
+    Returns:
+        Results document with run metadata and per-size stage timings
+    """
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for size in sizes:
+        config = SIZES[size]
+        project_dir = tempfile.mkdtemp(prefix=f'autodoc-{size}-')
+        try:
+            project = generate_project(project_dir, **config)
+            print(f"{size}: {project['apps']} apps, {project['models']} models, {project['urls']} URLs")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                stages = executor.submit(_measure, project, options).result()
+        finally:
+            shutil.rmtree(project_dir, ignore_errors=True)
+        for stage, timing in stages.items():
+            print(f"  {stage:<20} {timing['min']:>8.3f}s")
+        results.append({'size': size, 'config': config, 'stages': stages})
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'repeat': options['repeat'],
+        'results': results,
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1) -> List[str]:
+    """
+    Compare two results documents stage by stage.
+
+    Args:
+        baseline: Earlier results
+        current: Results to check
+        threshold: Relative slowdown above which a stage counts as a regression
+
+    Returns:
+        Descriptions of the regressed stages
+    """
+    baseline_stages = {
+        (result['size'], stage): timing['min']
+        for result in baseline['results'] for stage, timing in result['stages'].items()
+    }
+    regressions = []
+    print(f"{'Size':<8} {'Stage':<20} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    for result in current['results']:
+        for stage, timing in result['stages'].items():
+            before = baseline_stages.get((result['size'], stage))
+            if before is None:
+                continue
+            change = (timing['min'] - before) / before if before else 0.0
+            flag = ''
+            if change > threshold:
+                flag = '  regression'
+                regressions.append(f"{result['size']}/{stage}: {before:.3f}s -> {timing['min']:.3f}s ({change:+.0%})")
+            print(f"{result['size']:<8} {stage:<20} {before:>9.3f}s {timing['min']:>9.3f}s {change:>+7.0%}{flag}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='small,medium', help=f"Comma-separated sizes ({', '.join(SIZES)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage')
+    parser.add_argument('--output', help='File to write the results JSON to')
+    parser.add_argument('--capture', action='store_true', help='Also time HTTP capture against a local server')
+    parser.add_argument('--selenium', action='store_true', help='Also time Selenium screenshot capture (needs Chrome)')
+    parser.add_argument('--workers', type=int, default=1, help='WebDriver workers for --selenium')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='Compare two results files')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        sys.exit(1 if regressions else 0)
+
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+    results = run(sizes, {
+        'repeat': max(1, args.repeat),
+        'capture': args.capture,
+        'selenium': args.selenium,
+        'workers': args.workers,
+    })
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == '__main__':
+    main()
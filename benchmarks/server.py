@@ -0,0 +1,92 @@
+"""
+Serve a synthetic benchmark project over HTTP.
+
+Run as ``python -m benchmarks.server PROJECT_DIR [--port PORT]``. The database
+is created and seeded, a superuser ``admin``/``admin`` is added, and the bound
+port is printed as ``PORT <n>`` once the server accepts connections.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+ADMIN_USERNAME = 'admin'
+ADMIN_PASSWORD = 'admin'
+
+def _seed(objects: int) -> None:
+    """Create the schema, a superuser and ``objects`` rows per synthetic model."""
+    from django.apps import apps
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    User = get_user_model()
+    if not User.objects.filter(username=ADMIN_USERNAME).exists():
+        User.objects.create_superuser(ADMIN_USERNAME, 'admin@example.com', ADMIN_PASSWORD)
+
+    for app_config in apps.get_app_configs():
+        if not app_config.name.startswith('app'):
+            continue
+        for model in app_config.get_models():
+            missing = objects - model._default_manager.count()
+            if missing > 0:
+                model._default_manager.bulk_create([model() for _ in range(missing)])
+
+def serve(project_path: str, port: int = 0, objects: int = 3) -> None:
+    """Seed the project's database and serve it until interrupted."""
+    sys.path.insert(0, project_path)
+    os.environ['DJANGO_SETTINGS_MODULE'] = 'benchsite.settings'
+    import django
+    django.setup()
+    _seed(objects)
+
+    from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = ThreadedWSGIServer(('127.0.0.1', port), QuietHandler)
+    server.set_app(get_wsgi_application())
+    print(f"PORT {server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def start_server(project_path: str, objects: int = 3) -> Tuple[subprocess.Popen, str]:
+    """
+    Start the server for a project in a subprocess.
+
+    Returns:
+        Tuple of (server process, base URL); terminate the process when done
+
+    Raises:
+        RuntimeError: If the server exits before reporting its port
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.server', project_path, '--objects', str(objects)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline()
+    if not line.startswith('PORT '):
+        process.kill()
+        raise RuntimeError(f"Benchmark server failed to start: {line!r}")
+    return process, f"http://127.0.0.1:{int(line.split()[1])}"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('project', help='Synthetic project directory')
+    parser.add_argument('--port', type=int, default=0, help='Port to listen on (default: any free port)')
+    parser.add_argument('--objects', type=int, default=3, help='Rows to create per model')
+    args = parser.parse_args()
+    serve(os.path.abspath(args.project), args.port, args.objects)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Generate synthetic Django projects of configurable size for benchmarking."""
+import os
+import textwrap
+from typing import Any, Dict
+
+# Field declarations cycled through for each model, as (field class, arguments).
+_FIELD_TYPES = [
+    ('CharField', "max_length=100"),
+    ('IntegerField', "default=0"),
+    ('TextField', "blank=True"),
+    ('BooleanField', "default=False"),
+    ('DateTimeField', "auto_now_add=True"),
+    ('DecimalField', "max_digits=10, decimal_places=2, default=0"),
+    ('SlugField', "blank=True"),
+    ('EmailField', "blank=True"),
+]
+
+SIZES = {
+    'small': {'apps': 2, 'models_per_app': 5, 'fields_per_model': 5, 'include_depth': 1, 'node_packages': 20},
+    'medium': {'apps': 10, 'models_per_app': 10, 'fields_per_model': 8, 'include_depth': 2, 'node_packages': 200},
+    'large': {'apps': 30, 'models_per_app': 20, 'fields_per_model': 12, 'include_depth': 3, 'node_packages': 1000},
+}
+
+PROJECT_PACKAGE = 'benchsite'
+
+def _write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(textwrap.dedent(content).lstrip())
+
+def _model_source(app: int, model: int, fields_per_model: int, url_prefix: str) -> str:
+    """Source of one model class; every model after the first has a foreign key to its predecessor."""
+    lines = [f"class Model{model}(models.Model):"]
+    for field in range(fields_per_model):
+        field_class, arguments = _FIELD_TYPES[field % len(_FIELD_TYPES)]
+        lines.append(f"    field{field} = models.{field_class}({arguments})")
+    if model > 0:
+        lines.append(
+            f"    parent = models.ForeignKey('Model{model - 1}', on_delete=models.CASCADE, "
+            f"null=True, blank=True, related_name='children')"
+        )
+    lines += [
+        "",
+        "    class Meta:",
+        f"        verbose_name = 'model {model} of app {app}'",
+        "        ordering = ['id']",
+        "",
+        "    def __str__(self):",
+        f"        return f'Model{model} {{self.pk}}'",
+        "",
+        "    def get_absolute_url(self):",
+        f"        return f'/{url_prefix}model{model}/{{self.pk}}/'",
+    ]
+    return '\n'.join(lines)
+
+def generate_project(
+    directory: str,
+    apps: int = 2,
+    models_per_app: int = 5,
+    fields_per_model: int = 5,
+    include_depth: int = 1,
+    node_packages: int = 0,
+) -> Dict[str, Any]:
+    """
+    Write a synthetic Django project.
+
+    Every app has models with a chain of foreign keys between them, an admin
+    registration, a list and detail view per model, and URL patterns reached
+    through ``include_depth`` levels of nested include()s.
+
+    Args:
+        directory: Directory to create the project in
+        apps: Number of apps
+        models_per_app: Number of models per app
+        fields_per_model: Number of concrete fields per model, besides the
+            primary key and foreign key
+        include_depth: Number of nested include() levels in front of each
+            app's URL patterns
+        node_packages: Number of packages in a node_modules directory, the
+            kind of tree settings discovery has to skip
+
+    Returns:
+        Dict describing the project: its 'path', 'settings_module' and
+        expected 'apps', 'models' and 'urls' counts
+    """
+    app_names = [f'app{app}' for app in range(apps)]
+    _write(os.path.join(directory, 'manage.py'), f"""
+        #!/usr/bin/env python
+        import os
+        import sys
+
+        if __name__ == '__main__':
+            os.environ.setdefault('DJANGO_SETTINGS_MODULE', '{PROJECT_PACKAGE}.settings')
+            from django.core.management import execute_from_command_line
+            execute_from_command_line(sys.argv)
+    """)
+    _write(os.path.join(directory, PROJECT_PACKAGE, '__init__.py'), "")
+    _write(os.path.join(directory, PROJECT_PACKAGE, 'settings.py'), f"""
+        import os
+
+        BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        SECRET_KEY = 'benchmark-not-secret'
+        DEBUG = False
+        ALLOWED_HOSTS = ['*']
+        INSTALLED_APPS = [
+            'django.contrib.admin',
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'django.contrib.sessions',
+            'django.contrib.messages',
+            'django.contrib.staticfiles',
+        ] + {app_names!r}
+        MIDDLEWARE = [
+            'django.contrib.sessions.middleware.SessionMiddleware',
+            'django.middleware.common.CommonMiddleware',
+            'django.middleware.csrf.CsrfViewMiddleware',
+            'django.contrib.auth.middleware.AuthenticationMiddleware',
+            'django.contrib.messages.middleware.MessageMiddleware',
+        ]
+        ROOT_URLCONF = '{PROJECT_PACKAGE}.urls'
+        TEMPLATES = [{{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [],
+            'APP_DIRS': True,
+            'OPTIONS': {{'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ]}},
+        }}]
+        DATABASES = {{'default': {{
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        }}}}
+        DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+        STATIC_URL = '/static/'
+        USE_TZ = True
+    """)
+    _write(os.path.join(directory, PROJECT_PACKAGE, 'urls.py'), (
+        "from django.contrib import admin\n"
+        "from django.urls import include, path\n\n"
+        "urlpatterns = [\n"
+        "    path('admin/', admin.site.urls),\n"
+    ) + ''.join(
+        f"    path('{name}/', include('{name}.urls')),\n" for name in app_names
+    ) + "]\n")
+
+    for app, name in enumerate(app_names):
+        app_dir = os.path.join(directory, name)
+        url_prefix = ''.join(f'{part}/' for part in [name] + [f'level{level}' for level in range(1, include_depth)])
+        _write(os.path.join(app_dir, '__init__.py'), "")
+        _write(os.path.join(app_dir, 'models.py'), "from django.db import models\n\n\n" + '\n\n\n'.join(
+            _model_source(app, model, fields_per_model, url_prefix) for model in range(models_per_app)
+        ) + '\n')
+        model_names = ', '.join(f'Model{model}' for model in range(models_per_app))
+        _write(os.path.join(app_dir, 'admin.py'), f"""
+            from django.contrib import admin
+            from .models import {model_names}
+
+            for model in ({model_names},):
+                admin.site.register(model)
+        """)
+        _write(os.path.join(app_dir, 'views.py'), "from django.views.generic import DetailView, ListView\nfrom . import models\n\n" + ''.join(
+            f"\nclass Model{model}List(ListView):\n"
+            f"    model = models.Model{model}\n"
+            f"    template_name = 'bench/list.html'\n"
+            f"\nclass Model{model}Detail(DetailView):\n"
+            f"    model = models.Model{model}\n"
+            f"    template_name = 'bench/detail.html'\n"
+            for model in range(models_per_app)
+        ))
+        _write(os.path.join(app_dir, 'templates', 'bench', 'list.html'), """
+            <html><head><title>{{ request.path }}</title></head>
+            <body><h1>{{ request.path }}</h1>
+            <ul>{% for object in object_list %}<li><a href="{{ object.get_absolute_url }}">{{ object }}</a></li>{% endfor %}</ul>
+            <form method="get"><input type="text" name="q"><input type="submit" value="Search"></form>
+            </body></html>
+        """)
+        _write(os.path.join(app_dir, 'templates', 'bench', 'detail.html'), """
+            <html><head><title>{{ object }}</title></head>
+            <body><h1>{{ object }}</h1><h2>Details</h2><p>{{ object.pk }}</p></body></html>
+        """)
+
+        # Chain of include() levels in front of the app's own patterns
+        levels = [f'{name}.urls'] + [f'{name}.urls_level{level}' for level in range(1, include_depth)]
+        for level, module in enumerate(levels):
+            filename = module.split('.', 1)[1].replace('.', os.sep) + '.py'
+            if level + 1 < len(levels):
+                _write(os.path.join(app_dir, filename), f"""
+                    from django.urls import include, path
+
+                    urlpatterns = [
+                        path('level{level + 1}/', include('{levels[level + 1]}')),
+                    ]
+                """)
+            else:
+                _write(os.path.join(app_dir, filename), "from django.urls import path\nfrom . import views\n\nurlpatterns = [\n" + ''.join(
+                    f"    path('model{model}/', views.Model{model}List.as_view(), name='model{model}-list'),\n"
+                    f"    path('model{model}/<int:pk>/', views.Model{model}Detail.as_view(), name='model{model}-detail'),\n"
+                    for model in range(models_per_app)
+                ) + "]\n")
+
+    for package in range(node_packages):
+        package_dir = os.path.join(directory, 'node_modules', f'package{package}')
+        _write(os.path.join(package_dir, 'package.json'), f'{{"name": "package{package}", "main": "lib/index.js"}}\n')
+        _write(os.path.join(package_dir, 'lib', 'index.js'), "module.exports = {};\n")
+        _write(os.path.join(package_dir, 'lib', 'settings.py'), "# Not a Django settings module\n")
+
+    return {
+        'path': os.path.abspath(directory),
+        'settings_module': f'{PROJECT_PACKAGE}.settings',
+        'apps': apps,
+        'models': apps * models_per_app,
+        'urls': apps * models_per_app * 2,
+    }
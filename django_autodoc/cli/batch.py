@@ -0,0 +1,168 @@
+import json
+import os
+import re
+import sys
+import click
+from typing import Any, Dict, List, Optional, TextIO
+
+from ..core.batch import run_batch
+from ..core.schema import write_analysis
+
+def _read_jobs(stream: TextIO) -> List[Dict[str, Any]]:
+    """
+    Read job descriptions, one JSON object per line.
+
+    Blank lines and lines starting with '#' are skipped.
+    """
+    jobs = []
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            raise click.BadParameter(f"line {number}: {e}", param_hint='JOBS')
+        if not isinstance(job, dict) or not isinstance(job.get('project'), str):
+            raise click.BadParameter(f"line {number}: expected an object with a 'project' path", param_hint='JOBS')
+        jobs.append(job)
+    return jobs
+
+def _job_name(job: Dict[str, Any]) -> str:
+    """Name a job after its project directory and, if given, its settings module."""
+    name = os.path.basename(os.path.abspath(job['project']))
+    if job.get('settings'):
+        name = f"{name}-{job['settings']}"
+    return re.sub(r'[^\w.-]+', '_', name)
+
+@click.command()
+@click.argument('jobs_file', metavar='JOBS', type=click.File('r'))
+@click.option(
+    '--jobs', 'parallel',
+    default=os.cpu_count() or 1,
+    type=click.IntRange(min=1),
+    help='Number of projects analyzed concurrently (default: CPU count)'
+)
+@click.option(
+    '--output-root',
+    default='docs',
+    type=click.Path(file_okay=False, dir_okay=True),
+    help='Directory for the documentation of jobs without an "output" (one subdirectory per job)'
+)
+@click.option(
+    '--format',
+    type=click.Choice(['md', 'html'], case_sensitive=False),
+    default='md',
+    help='Output format'
+)
+@click.option(
+    '--shard',
+    type=click.Choice(['none', 'app', 'model'], case_sensitive=False),
+    default='none',
+    help='Split the models reference and admin guide into one page per app or model'
+)
+@click.option(
+    '--static',
+    is_flag=True,
+    help='Analyze project sources with ast instead of importing the projects'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Disable incremental caches and analyze everything'
+)
+@click.option(
+    '--timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    help='Seconds after which a project\'s analysis is abandoned'
+)
+@click.option(
+    '--results',
+    type=click.File('w'),
+    help='Also write the JSON result lines to this file'
+)
+def main(
+    jobs_file: TextIO,
+    parallel: int,
+    output_root: str,
+    format: str,
+    shard: str,
+    static: bool,
+    no_cache: bool,
+    timeout: Optional[float],
+    results: Optional[TextIO]
+) -> None:
+    """
+    Generate documentation for several Django projects or settings variants.
+
+    JOBS is a file (or - for stdin) with one JSON object per line, e.g.
+    {"project": "services/billing", "settings": "billing.settings.prod"}.
+    Besides "project" and "settings", a job may set "output", "static",
+    "cache_dir" and "dump_analysis" (a file to also write the analysis to).
+
+    Each project is analyzed in its own process, since Django can only be
+    set up once per process. Documentation is generated as analyses finish,
+    and one JSON result line per job is written to stdout. The exit code is
+    1 if any job failed.
+    """
+    jobs = _read_jobs(jobs_file)
+    for job in jobs:
+        job.setdefault('static', static)
+        job.setdefault('output', os.path.join(output_root, _job_name(job)))
+        if no_cache:
+            job['cache_dir'] = None
+        else:
+            job.setdefault('cache_dir', os.path.join(job['project'], '.autodoc_cache'))
+
+    from ..core.generator import DocumentationGenerator
+    click.echo(f"Analyzing {len(jobs)} projects, {min(parallel, len(jobs))} at a time...", err=True)
+    failed = 0
+    for result in run_batch(jobs, parallel=parallel, timeout=timeout):
+        job = result['job']
+        summary = {
+            'project': job['project'],
+            'settings': job.get('settings'),
+            'output': job['output'],
+            'status': result['status'],
+            'error': result['error'],
+            'analysis_seconds': round(result['elapsed'], 3),
+        }
+        if result['status'] == 'ok':
+            project_info = result['project']
+            try:
+                if job.get('dump_analysis'):
+                    write_analysis(job['dump_analysis'], project_info, result['capture_urls'])
+                generator = DocumentationGenerator(
+                    output_dir=job['output'],
+                    project_info=project_info,
+                    format=format,
+                    cache_dir=job['cache_dir'],
+                    shard=shard.lower(),
+                )
+                generator.generate()
+            except Exception as e:
+                summary.update(status='failed', error=f"{e.__class__.__name__}: {e}")
+            else:
+                summary.update(
+                    models=len(project_info.models),
+                    urls=len(project_info.urls),
+                    pages=generator.stats,
+                    generation_seconds=round(sum(generator.timings.values()), 3),
+                )
+
+        if summary['status'] == 'ok':
+            click.echo(f"{_job_name(job)}: documentation generated in {job['output']}", err=True)
+        else:
+            failed += 1
+            click.echo(f"{_job_name(job)}: failed: {summary['error']}", err=True)
+        line = json.dumps(summary)
+        click.echo(line)
+        if results:
+            results.write(line + '\n')
+            results.flush()
+
+    click.echo(f"{len(jobs) - failed} of {len(jobs)} projects documented", err=True)
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,19 @@
 import os
+import time
 import click
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..core.analyzer import ProjectAnalyzer
-from ..core.capturer import ScreenshotCapturer
-from ..core.generator import DocumentationGenerator
+# Subsystems (Django, Selenium, Jinja2, Markdown) are imported where they
+# are used, so runs only pay for the ones they need
+from ..core.schema import ProjectInfo, URLInfo, read_analysis, write_analysis
+from ..utils.profiling import Profiler
 
 @click.command()
 @click.option(
     '--project',
-    required=True,
+    required=False,
     type=click.Path(exists=True, file_okay=False, dir_okay=True),
-    help='Path to Django project'
+    help='Path to Django project (not needed with --load-analysis)'
 )
 @click.option(
     '--settings',
@@ -45,42 +47,416 @@ from ..core.generator import DocumentationGenerator
     required=False,
     help='Admin password for authenticated views'
 )
+@click.option(
+    '--workers',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of parallel browser workers for screenshot capture'
+)
+@click.option(
+    '--force-recapture',
+    is_flag=True,
+    help='Recapture every screenshot even if the page is unchanged'
+)
+@click.option(
+    '--cache-max-age',
+    default=30.0,
+    type=click.FloatRange(min=0),
+    help='Days after which unused cached screenshots are evicted'
+)
+@click.option(
+    '--cache-dir',
+    required=False,
+    type=click.Path(file_okay=False, dir_okay=True),
+    help='Directory for incremental build caches (default: <project>/.autodoc_cache)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Disable incremental caches and analyze/capture everything'
+)
+@click.option(
+    '--static',
+    is_flag=True,
+    help='Analyze project sources with ast instead of importing the project'
+)
+@click.option(
+    '--shard',
+    type=click.Choice(['none', 'app', 'model'], case_sensitive=False),
+    default='none',
+    help='Split the models reference and admin guide into one page per app or model'
+)
+@click.option(
+    '--resolve-params',
+    is_flag=True,
+    help='Capture parameterized URLs using objects sampled from the database'
+)
+@click.option(
+    '--samples',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Objects to sample per model with --resolve-params'
+)
+@click.option(
+    '--readiness',
+    type=click.Choice(['load', 'network-idle', 'dom-stable'], case_sensitive=False),
+    default='load',
+    help='When a page is considered ready for its screenshot'
+)
+@click.option(
+    '--ready-selector',
+    multiple=True,
+    metavar='PATTERN=SELECTOR',
+    help='Wait for a CSS selector on URLs matching PATTERN (repeatable)'
+)
+@click.option(
+    '--backend',
+    type=click.Choice(['selenium', 'http'], case_sensitive=False),
+    default='selenium',
+    help='Capture screenshots with Chrome, or only page HTML metadata over HTTP'
+)
+@click.option(
+    '--viewports',
+    default='desktop',
+    metavar='LIST',
+    help='Comma-separated viewports to capture each page at, e.g. '
+         '"desktop,tablet,mobile" or "desktop,phone=390x844"; the first is the primary screenshot'
+)
+@click.option(
+    '--no-postprocess',
+    is_flag=True,
+    help='Keep screenshots as captured instead of deduplicating and recompressing them'
+)
+@click.option(
+    '--thumbnail-width',
+    type=click.IntRange(min=16),
+    help='Also write thumbnails of this width and show them in the docs (requires Pillow)'
+)
+@click.option(
+    '--profile',
+    is_flag=False,
+    flag_value='autodoc-trace.json',
+    default=None,
+    metavar='TRACE_FILE',
+    help='Time every phase and URL, print a summary and write a Chrome trace '
+         '(default file: autodoc-trace.json)'
+)
+@click.option(
+    '--watch',
+    is_flag=True,
+    help='Keep running, and regenerate the documentation whenever project sources or templates change'
+)
+@click.option(
+    '--dump-analysis',
+    metavar='FILE',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write the project analysis, with the URLs to capture, to FILE as JSON lines '
+         '(gzip-compressed for .gz) and exit without capturing or generating'
+)
+@click.option(
+    '--load-analysis',
+    metavar='FILE',
+    type=click.Path(exists=True, dir_okay=False),
+    help='Capture and generate from an analysis written with --dump-analysis instead of analyzing the project'
+)
 def main(
-    project: str,
+    project: Optional[str],
     settings: Optional[str],
     url: Optional[str],
     output: str,
     format: str,
     username: Optional[str],
-    password: Optional[str]
+    password: Optional[str],
+    workers: int,
+    force_recapture: bool,
+    cache_max_age: float,
+    cache_dir: Optional[str],
+    no_cache: bool,
+    static: bool,
+    shard: str,
+    resolve_params: bool,
+    samples: int,
+    readiness: str,
+    ready_selector: Tuple[str, ...],
+    backend: str,
+    viewports: str,
+    no_postprocess: bool,
+    thumbnail_width: Optional[int],
+    profile: Optional[str],
+    watch: bool,
+    dump_analysis: Optional[str],
+    load_analysis: Optional[str]
 ) -> None:
     """Generate user documentation for Django projects."""
     
-    click.echo("Analyzing Django project...")
-    analyzer = ProjectAnalyzer(project, settings)
-    project_info = analyzer.analyze()
+    if not project and not load_analysis:
+        raise click.UsageError("Missing option '--project'")
+    if load_analysis and (dump_analysis or watch):
+        raise click.UsageError("--load-analysis cannot be combined with --dump-analysis or --watch")
+    if dump_analysis and watch:
+        raise click.UsageError("--dump-analysis cannot be combined with --watch")
+    
+    if not no_cache and not cache_dir:
+        cache_dir = os.path.join(project or '.', '.autodoc_cache')
+    
+    profiler = Profiler(enabled=profile is not None)
+    analysis_options = {
+        'project': project,
+        'settings': settings,
+        'static': static,
+        'cache_dir': None if no_cache else cache_dir,
+        'resolve_params': bool(url or dump_analysis) and resolve_params,
+        'samples': samples,
+    }
+    if static and resolve_params and (url or dump_analysis):
+        click.echo("Warning: --resolve-params needs the database and is ignored with --static")
     
-    screenshots = {}
+    capturer = None
+    snapshot_backend = None
     if url:
-        click.echo("Capturing screenshots...")
-        capturer = ScreenshotCapturer(
-            base_url=url,
-            output_dir=os.path.join(output, 'screenshots'),
-            username=username,
-            password=password
+        from ..core.session import default_session_file
+        session_file = None if no_cache else default_session_file(url, username)
+        if backend.lower() == 'http':
+            from ..core.backends import HTTPSnapshotBackend
+            snapshot_backend = HTTPSnapshotBackend(
+                base_url=url,
+                username=username,
+                password=password,
+                session_file=session_file,
+                profiler=profiler
+            )
+        else:
+            from ..core.capturer import ScreenshotCapturer, parse_viewports
+            from ..core.postprocess import ScreenshotProcessor
+            from ..core.readiness import STRATEGIES, ReadinessPolicy
+            selectors = {}
+            for option in ready_selector:
+                pattern, separator, selector = option.partition('=')
+                if not separator:
+                    raise click.BadParameter(f"expected PATTERN=SELECTOR, got {option!r}", param_hint='--ready-selector')
+                selectors[pattern] = selector
+            try:
+                viewport_sizes = parse_viewports(viewports)
+            except ValueError as e:
+                raise click.BadParameter(str(e), param_hint='--viewports')
+            screenshots_dir = os.path.join(output, 'screenshots')
+            postprocessor = None
+            if not no_postprocess:
+                postprocessor = ScreenshotProcessor(screenshots_dir, thumbnail_width=thumbnail_width)
+            capturer_options = dict(
+                base_url=url,
+                output_dir=screenshots_dir,
+                username=username,
+                password=password,
+                workers=workers,
+                use_cache=not no_cache,
+                session_file=session_file,
+                readiness=ReadinessPolicy(STRATEGIES[readiness.lower()](), selectors),
+                force_recapture=force_recapture,
+                cache_max_age=cache_max_age * 86400,
+                viewports=viewport_sizes,
+                postprocessor=postprocessor,
+                profiler=profiler,
+                driver_cache_file=None if no_cache else os.path.join(cache_dir, 'chromedriver.json')
+            )
+    
+    # Results of the last successful build, reused by watch-mode rebuilds for
+    # the pages of apps a change cannot affect
+    previous: Dict[str, Any] = {}
+    
+    def build(changed: Optional[Set[str]] = None) -> None:
+        """
+        Analyze, capture and generate once.
+        
+        Args:
+            changed: Files changed since the last successful build, in watch
+                mode; pages of the apps they cannot affect are neither
+                recaptured nor rendered again
+        """
+        nonlocal capturer
+        if load_analysis:
+            click.echo(f"Loading analysis from {load_analysis}...")
+            with profiler.span('analysis.load'):
+                try:
+                    project_info, capture_urls = read_analysis(load_analysis)
+                except ValueError as e:
+                    raise click.ClickException(str(e))
+        else:
+            click.echo("Analyzing Django project...")
+            with profiler.span('analysis'):
+                if watch and not static:
+                    from ..core.watcher import run_isolated
+                    # Analyze in a fork of this process, so that changed models
+                    # and URLconfs are imported afresh on every rebuild
+                    project_info, capture_urls, events = run_isolated(_analyze_isolated, analysis_options, profiler.enabled)
+                    profiler.events.extend(events)
+                else:
+                    project_info, capture_urls = _analyze(analysis_options, profiler)
+        
+        if dump_analysis:
+            with profiler.span('analysis.dump'):
+                count = write_analysis(dump_analysis, project_info, capture_urls)
+            click.echo(f"Analysis written to {dump_analysis} ({count} records)")
+            return
+        
+        apps = None
+        targets = capture_urls
+        if changed and previous:
+            from ..core.watcher import affected_apps, url_affected
+            apps = affected_apps(changed, project_info, previous['project_info'])
+            if apps is not None:
+                click.echo(f"Affected apps: {', '.join(sorted(apps)) or 'none'}")
+                targets = [
+                    url_info for url_info in capture_urls
+                    if url_affected(url_info, project_info, apps, project)
+                ]
+        
+        # Results of the previous build for the pages that are not recaptured
+        reused = {url_info['pattern'] for url_info in capture_urls} - {url_info['pattern'] for url_info in targets}
+        
+        def reuse(name: str) -> Dict[str, Any]:
+            return {pattern: value for pattern, value in previous.get(name, {}).items() if pattern in reused}
+        
+        screenshots = {}
+        screenshot_variants = {}
+        thumbnails = {}
+        pages = {}
+        if snapshot_backend:
+            click.echo("Capturing page snapshots...")
+            with profiler.span('capture'):
+                pages = {**reuse('pages'), **snapshot_backend.capture(targets)}
+        elif url:
+            click.echo("Capturing screenshots...")
+            with profiler.span('capture'):
+                if capturer is None:
+                    capturer = ScreenshotCapturer(**capturer_options)
+                kept = reuse('variants')
+                screenshots = {
+                    **reuse('screenshots'),
+                    **capturer.capture_screenshots(
+                        targets, keep=[path for variants in kept.values() for path in variants.values()]
+                    ),
+                }
+                screenshot_variants = {**kept, **capturer.variants}
+                thumbnails = {**reuse('thumbnails'), **capturer.thumbnails}
+        
+        click.echo("Generating documentation...")
+        from ..core.generator import DocumentationGenerator
+        generator = DocumentationGenerator(
+            output_dir=output,
+            project_info=project_info,
+            screenshots=screenshots,
+            format=format,
+            cache_dir=None if no_cache else cache_dir,
+            shard=shard.lower(),
+            pages=pages,
+            screenshot_variants=screenshot_variants,
+            thumbnails=thumbnails,
+            profiler=profiler,
+            apps=apps
+        )
+        with profiler.span('generate'):
+            generator.generate()
+        previous.update(
+            project_info=project_info,
+            screenshots=screenshots,
+            variants=screenshot_variants,
+            thumbnails=thumbnails,
+            pages=pages,
         )
-        screenshots = capturer.capture_screenshots(project_info['urls'])
+        click.echo(
+            f"Pages: {generator.stats['written']} written, {generator.stats['skipped']} unchanged, "
+            f"{generator.stats['deleted']} deleted"
+        )
+        for section, elapsed in sorted(generator.timings.items(), key=lambda item: -item[1]):
+            click.echo(f"  {section}: {elapsed:.2f}s")
+    
+    try:
+        if watch:
+            from ..core.watcher import ProjectWatcher, preload_django
+            preload_django()
+        build()
+        if not dump_analysis:
+            click.echo(f"Documentation generated in {output} directory")
+        
+        if watch:
+            watcher = ProjectWatcher(project, ignore=[output, cache_dir])
+            click.echo(f"Watching {watcher.root} for changes (Ctrl+C to stop)...")
+            # Changes since the last successful build; a failed rebuild's
+            # changes are carried over to the next one
+            pending: Set[str] = set()
+            while True:
+                changed = watcher.wait_for_changes()
+                names = sorted(os.path.relpath(path, watcher.root) for path in changed)
+                click.echo(f"Changed: {', '.join(names[:3])}" + (f" (+{len(names) - 3} more)" if len(names) > 3 else ''))
+                pending |= changed
+                started = time.monotonic()
+                try:
+                    build(pending)
+                except Exception as e:
+                    # Keep watching; the next save may well fix the error
+                    click.echo(f"Rebuild failed: {e.__class__.__name__}: {e}", err=True)
+                    continue
+                pending = set()
+                click.echo(f"Rebuilt in {time.monotonic() - started:.1f}s")
+    except KeyboardInterrupt:
+        click.echo("Stopped watching")
+    finally:
+        if capturer:
+            capturer.close()
+    
+    if profile:
+        profiler.report(click.echo)
+        profiler.write_trace(profile, metadata={
+            'project': os.path.abspath(project) if project else load_analysis,
+            'backend': backend.lower() if url else None,
+            'workers': workers,
+            'static': static,
+        })
+        click.echo(f"Trace written to {profile}")
+
+def _analyze(options: Dict[str, Any], profiler: Profiler) -> Tuple[ProjectInfo, List[URLInfo]]:
+    """
+    Analyze the project and list the URLs to capture.
     
-    click.echo("Generating documentation...")
-    generator = DocumentationGenerator(
-        output_dir=output,
-        project_info=project_info,
-        screenshots=screenshots,
-        format=format
-    )
-    generator.generate()
+    Args:
+        options: Analysis options collected from the command line
+        profiler: Profiler to record analysis phases with
+        
+    Returns:
+        Tuple of (project information, capture targets)
+    """
+    if options['static']:
+        from ..core.static_analyzer import StaticProjectAnalyzer
+        analyzer = StaticProjectAnalyzer(options['project'], options['settings'], profiler=profiler)
+    else:
+        from ..core.analyzer import ProjectAnalyzer
+        analyzer = ProjectAnalyzer(
+            options['project'], options['settings'], cache_dir=options['cache_dir'], profiler=profiler
+        )
+    project_info = ProjectInfo.from_dict(analyzer.analyze())
+    if getattr(analyzer, 'cache', None):
+        click.echo(f"Analysis cache: {analyzer.cache.hits} partitions reused, "
+                   f"{analyzer.cache.misses} re-analyzed")
     
-    click.echo(f"Documentation generated in {output} directory")
+    capture_urls = project_info.urls
+    if options['resolve_params'] and not options['static']:
+        from ..core.url_sampler import resolve_parameterized_urls
+        with profiler.span('resolve_params'):
+            capture_urls = capture_urls + [
+                URLInfo.from_dict(target)
+                for target in resolve_parameterized_urls(capture_urls, options['samples'])
+            ]
+    return project_info, capture_urls
+
+def _analyze_isolated(
+    options: Dict[str, Any],
+    profile: bool,
+) -> Tuple[ProjectInfo, List[URLInfo], List[Dict[str, Any]]]:
+    """Run _analyze() in a forked process, returning its profiling spans along with the result."""
+    profiler = Profiler(enabled=profile)
+    project_info, capture_urls = _analyze(options, profiler)
+    return project_info, capture_urls, profiler.events
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+from typing import Any, Callable, Iterable, Optional
+
+# Bump whenever the shape of cached analysis results changes.
+CACHE_VERSION = 6
+
+# Directories that never contain Python sources relevant to analysis.
+_SKIP_DIRS = {'__pycache__', 'templates', 'static', 'locale', 'node_modules', '.git'}
+
+class AnalysisCache:
+    """On-disk cache of analysis results, partitioned per installed app."""
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the analysis cache.
+        
+        Args:
+            directory: Directory to store cached analysis results in
+        """
+        self.directory = os.path.join(directory, 'analysis')
+        self.hits = 0
+        self.misses = 0
+        
+    @staticmethod
+    def source_digest(path: str) -> str:
+        """
+        Fingerprint the Python sources under a file or directory.
+        
+        Files are fingerprinted by relative path, mtime and size, so no source
+        has to be read.
+        
+        Args:
+            path: Module file or package/app directory
+            
+        Returns:
+            Hex digest of the sources' stat signatures
+        """
+        digest = hashlib.sha256()
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+            return digest.hexdigest()
+            
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS)
+            for filename in sorted(files):
+                if not filename.endswith('.py'):
+                    continue
+                file_path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                relative_path = os.path.relpath(file_path, path)
+                digest.update(f"{relative_path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        return digest.hexdigest()
+        
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Combine digests and identifiers into a single cache key."""
+        digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for part in parts:
+            digest.update(b'\0')
+            digest.update(str(part).encode())
+        return digest.hexdigest()
+        
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+        
+    def load(self, name: str, key: str, validate: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """
+        Load a cached partition if it was stored under the same key.
+        
+        Args:
+            name: Partition name (an app label, or 'urls')
+            key: Cache key the partition must match
+            validate: Further check of the cached data, for inputs only
+                known once the data was computed (optional)
+            
+        Returns:
+            Cached data, or None on a cache miss
+        """
+        try:
+            with open(self._path(name), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+            
+        if entry and entry.get('key') == key and (validate is None or validate(entry['data'])):
+            self.hits += 1
+            return entry['data']
+        self.misses += 1
+        return None
+        
+    def store(self, name: str, key: str, data: Any) -> None:
+        """Store a partition under the given key."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': key, 'data': data}, f, default=str)
+        os.replace(tmp_path, path)
+        
+    def prune(self, names: Iterable[str]) -> None:
+        """Remove cached partitions that are not in ``names``."""
+        keep = {f"{name}.json" for name in names}
+        try:
+            filenames = os.listdir(self.directory)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename.endswith('.json') and filename not in keep:
+                os.remove(os.path.join(self.directory, filename))
@@ -1,45 +1,280 @@
 import os
 import sys
+import inspect
 import importlib
-from typing import Dict, List, Any, Optional
+from functools import partialmethod
+from typing import Dict, List, Any, Optional, Set, Tuple
 from django.apps import apps
 from django.urls import URLPattern, URLResolver
+from django.urls.resolvers import RegexPattern
 from django.core.management import execute_from_command_line
 from django.conf import settings
 
+from .analysis_cache import AnalysisCache
+from .template_index import TemplateIndex
+from .url_tree import flatten_urlconf, route_segment
+from ..utils.profiling import Profiler
+from ..utils.settings_discovery import find_settings_module
+
+# Public methods defined directly on each class, shared by every model whose
+# MRO contains that class (django.db.models.Model, abstract bases, mixins).
+_class_methods_cache: Dict[type, Tuple[Dict[str, str], Set[str]]] = {}
+
+def _is_method(value: Any) -> bool:
+    """Check whether a class __dict__ entry is a method."""
+    if isinstance(value, (staticmethod, classmethod, partialmethod)):
+        return True
+    return callable(value) and not isinstance(value, type)
+
+def _class_methods(cls: type) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Resolve the public methods defined directly on a class.
+    
+    Only the class __dict__ is inspected, so descriptors and managers are
+    never triggered. Results are memoized per class.
+    
+    Returns:
+        Tuple of (method name -> defining class path, public non-method names)
+    """
+    cached = _class_methods_cache.get(cls)
+    if cached is None:
+        origin = f"{cls.__module__}.{cls.__qualname__}"
+        methods, other = {}, set()
+        for name, value in vars(cls).items():
+            if name.startswith('_'):
+                continue
+            if _is_method(value):
+                methods[name] = origin
+            else:
+                other.add(name)
+        cached = _class_methods_cache[cls] = (methods, other)
+    return cached
+
+def model_methods(model: type) -> List[Dict[str, str]]:
+    """
+    List the public methods of a model with the class each is defined on.
+    
+    The MRO is walked from the most generic class down, so overrides and
+    attributes that shadow inherited methods take precedence.
+    """
+    resolved: Dict[str, str] = {}
+    for cls in reversed(model.__mro__):
+        if cls is object:
+            continue
+        methods, other = _class_methods(cls)
+        for name in other:
+            resolved.pop(name, None)
+        resolved.update(methods)
+    return [{'name': name, 'defined_in': resolved[name]} for name in sorted(resolved)]
+
+def _view_model_label(callback: Any) -> Optional[str]:
+    """
+    Return the label of the model a view operates on, if it declares one.
+    
+    Class-based views are inspected for a ``model`` attribute or a
+    ``queryset``; function views are not associated with a model.
+    """
+    view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+    model = getattr(view_class, 'model', None)
+    if model is None:
+        model = getattr(getattr(view_class, 'queryset', None), 'model', None)
+    meta = getattr(model, '_meta', None)
+    return meta.label_lower if meta is not None else None
+
+def _dotted_path(obj: Any) -> str:
+    """Return the dotted import path of a class or function."""
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+def _description(obj: Any) -> Optional[str]:
+    """Return the first paragraph of an object's own docstring."""
+    doc = obj.__dict__.get('__doc__') if isinstance(obj, type) else getattr(obj, '__doc__', None)
+    if not doc:
+        return None
+    return ' '.join(inspect.cleandoc(doc).split('\n\n', 1)[0].split())
+
+# Form descriptions, shared by every view and app that uses the form class
+_form_info_cache: Dict[type, Dict[str, Any]] = {}
+
+def form_info(form_class: type) -> Dict[str, Any]:
+    """
+    Describe a form class and its fields.
+    
+    ``base_fields`` holds the declared fields and, for model forms, the
+    generated model fields, so no form has to be instantiated. Results are
+    memoized per class.
+    """
+    cached = _form_info_cache.get(form_class)
+    if cached is None:
+        meta = getattr(form_class, '_meta', None)
+        model = getattr(meta, 'model', None)
+        cached = _form_info_cache[form_class] = {
+            'name': form_class.__name__,
+            'model': model._meta.label_lower if model is not None else None,
+            'description': _description(form_class),
+            'fields': [
+                {
+                    'name': name,
+                    'type': field.__class__.__name__,
+                    'widget': field.widget.__class__.__name__,
+                    'required': field.required,
+                    'label': str(field.label) if field.label else name.replace('_', ' ').capitalize(),
+                    'help_text': str(field.help_text) if field.help_text else None,
+                }
+                for name, field in getattr(form_class, 'base_fields', {}).items()
+            ],
+        }
+    return cached
+
+def _is_form_class(value: Any) -> bool:
+    """Check whether a value is a Django form class."""
+    from django.forms import BaseForm
+    return isinstance(value, type) and issubclass(value, BaseForm)
+
+# View descriptions, memoized per view callback
+_view_info_cache: Dict[Any, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+def view_info(callback: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Describe the view behind a URL pattern without calling it.
+    
+    Class-based views are read from their class attributes, overridden by
+    the keyword arguments given to ``as_view()``. The template names are
+    the candidates the view would try, most specific first.
+    
+    Returns:
+        Tuple of (view information, forms the view uses keyed by dotted path)
+    """
+    cached = _view_info_cache.get(callback)
+    if cached is not None:
+        return cached
+        
+    view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+    if not isinstance(view_class, type):
+        cached = _view_info_cache[callback] = ({
+            'view': _dotted_path(callback) if hasattr(callback, '__qualname__') else repr(callback),
+            'type': 'function',
+            'base': None,
+            'description': _description(callback),
+            'methods': [],
+            'login_required': bool(getattr(callback, 'login_required', False)),
+            'template_names': [],
+            'form': None,
+            'model': None,
+            'context_object_name': None,
+            'paginate_by': None,
+        }, {})
+        return cached
+        
+    initkwargs = getattr(callback, 'view_initkwargs', None) or {}
+    
+    def attribute(name: str) -> Any:
+        return initkwargs[name] if name in initkwargs else getattr(view_class, name, None)
+        
+    from django.views import View
+    path = _dotted_path(view_class)
+    mro_paths = [_dotted_path(cls) for cls in view_class.__mro__]
+    model = attribute('model') or getattr(attribute('queryset'), 'model', None)
+    meta = getattr(model, '_meta', None)
+    
+    template_names = []
+    if isinstance(attribute('template_name'), str):
+        template_names.append(attribute('template_name'))
+    suffix = attribute('template_name_suffix')
+    if meta is not None and isinstance(suffix, str):
+        template_names.append(f"{meta.app_label}/{meta.model_name}{suffix}.html")
+        
+    forms = {}
+    form, form_class = None, attribute('form_class')
+    if _is_form_class(form_class):
+        form = _dotted_path(form_class)
+    elif model is not None and attribute('fields') is not None and hasattr(view_class, 'get_form_class'):
+        # Generic editing views build a model form from ``fields``
+        from django.forms import modelform_factory
+        try:
+            form_class = modelform_factory(model, fields=attribute('fields'))
+        except Exception as e:
+            print(f"Warning: Could not build the form of {path}: {e}")
+        else:
+            form = f"{path}.form"
+    if form:
+        forms[form] = form_info(form_class)
+        
+    cached = _view_info_cache[callback] = ({
+        'view': path,
+        'type': 'class',
+        'base': next((
+            _dotted_path(cls) for cls in view_class.__mro__[1:]
+            if cls.__module__.startswith('django.') and issubclass(cls, View)
+        ), None),
+        'description': _description(view_class),
+        'methods': [
+            method.upper() for method in getattr(view_class, 'http_method_names', [])
+            if method != 'options' and hasattr(view_class, method)
+        ],
+        'login_required': 'django.contrib.auth.mixins.AccessMixin' in mro_paths,
+        'template_names': template_names,
+        'form': form,
+        'model': meta.label_lower if meta is not None else None,
+        'context_object_name': attribute('context_object_name'),
+        'paginate_by': attribute('paginate_by'),
+    }, forms)
+    return cached
+
+def _view_class_path(callback: Any) -> Optional[str]:
+    """
+    Return the dotted path of a class-based view, or None for function views.
+    """
+    view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+    if not isinstance(view_class, type):
+        return None
+    return _dotted_path(view_class)
+
 class ProjectAnalyzer:
     """Analyzes Django project structure and extracts relevant information."""
     
-    def __init__(self, project_path: str, settings_module: Optional[str] = None):
+    def __init__(
+        self,
+        project_path: str,
+        settings_module: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         """
         Initialize the project analyzer.
         
         Args:
             project_path: Path to the Django project
             settings_module: Django settings module name (optional)
+            cache_dir: Directory for the incremental analysis cache (optional)
+            profiler: Profiler to record analysis phases with (optional)
         """
         self.project_path = os.path.abspath(project_path)
         self.settings_module = settings_module
+        self.cache_dir = cache_dir
+        self.cache = AnalysisCache(cache_dir) if cache_dir else None
+        self.profiler = profiler or Profiler(enabled=False)
+        self._partitions: Optional[Dict[str, Dict[str, Any]]] = None
+        self._url_partition: Optional[Dict[str, Any]] = None
+        self._template_index: Optional[TemplateIndex] = None
+        self._app_digests: Dict[str, str] = {}
+        self._settings_digest_value = ''
         self._setup_django_environment()
         
     def _setup_django_environment(self) -> None:
         """Set up Django environment for analysis."""
         sys.path.insert(0, self.project_path)
         
-        if self.settings_module:
-            os.environ['DJANGO_SETTINGS_MODULE'] = self.settings_module
-        else:
-            # Try to detect settings module
-            for root, dirs, files in os.walk(self.project_path):
-                if 'settings.py' in files:
-                    relative_path = os.path.relpath(root, self.project_path)
-                    module_path = relative_path.replace(os.sep, '.') + '.settings'
-                    os.environ['DJANGO_SETTINGS_MODULE'] = module_path
-                    break
+        settings_module = self.settings_module
+        if not settings_module:
+            with self.profiler.span('settings.discover'):
+                settings_module = find_settings_module(self.project_path, self.cache_dir)
+        if settings_module:
+            os.environ['DJANGO_SETTINGS_MODULE'] = settings_module
         
         # Initialize Django
         import django
-        django.setup()
+        with self.profiler.span('django.setup'):
+            django.setup()
     
     def analyze(self) -> Dict[str, Any]:
         """
@@ -48,31 +283,132 @@ class ProjectAnalyzer:
         Returns:
             Dict containing project structure information
         """
-        return {
-            'apps': self._analyze_apps(),
-            'urls': self._analyze_urls(),
-            'models': self._analyze_models(),
-            'views': self._analyze_views(),
-            'forms': self._analyze_forms(),
-            'templates': self._analyze_templates(),
-        }
+        info = {}
+        for section, analyze_section in (
+            ('apps', self._analyze_apps),
+            ('urls', self._analyze_urls),
+            ('models', self._analyze_models),
+            ('views', self._analyze_views),
+            ('forms', self._analyze_forms),
+            ('templates', self._analyze_templates),
+        ):
+            with self.profiler.span(f'analyze.{section}'):
+                info[section] = analyze_section()
+        return info
+    
+    def _settings_digest(self) -> str:
+        """Fingerprint the settings module sources."""
+        module = sys.modules.get(os.environ.get('DJANGO_SETTINGS_MODULE', ''))
+        module_file = getattr(module, '__file__', None)
+        if not module_file:
+            return ''
+        if os.path.basename(module_file) == '__init__.py':
+            module_file = os.path.dirname(module_file)
+        return AnalysisCache.source_digest(module_file)
+    
+    def _project_file(self, module_name: str) -> Optional[str]:
+        """Return the source file of a loaded module if it lives inside the project."""
+        module_file = getattr(sys.modules.get(module_name), '__file__', None)
+        if not module_file:
+            return None
+        module_file = os.path.abspath(module_file)
+        if os.path.commonpath([module_file, self.project_path]) != self.project_path:
+            return None
+        return module_file
+    
+    def _app_key(self, app_config) -> str:
+        """
+        Build the cache key for an app partition.
+        
+        Besides the app's own sources and the settings, the key covers every
+        app whose models relate to this app's models, since reverse relations
+        show up in this app's model fields, and every project module defining
+        a base class, mixin or manager of this app's models.
+        """
+        related_labels = set()
+        inherited_files = set()
+        app_path = os.path.abspath(app_config.path)
+        for model in app_config.get_models():
+            for field in model._meta.get_fields():
+                if field.is_relation and field.related_model and not isinstance(field.related_model, str):
+                    related_labels.add(field.related_model._meta.app_label)
+            classes = list(model.__mro__)
+            for manager in model._meta.managers:
+                classes.extend(type(manager).__mro__)
+            for cls in classes:
+                module_file = self._project_file(cls.__module__)
+                if module_file and os.path.commonpath([module_file, app_path]) != app_path:
+                    inherited_files.add(module_file)
+        related_labels.discard(app_config.label)
+        
+        return AnalysisCache.make_key(
+            self._settings_digest_value,
+            self._app_digests[app_config.label],
+            *(f"{label}:{self._app_digests.get(label, '')}" for label in sorted(related_labels)),
+            *(AnalysisCache.source_digest(path) for path in sorted(inherited_files))
+        )
+    
+    def _app_partitions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze each installed app, reusing cached partitions of unchanged apps.
+        
+        Returns:
+            Dict mapping app labels to {'app': ..., 'models': ..., 'forms': ...} partitions
+        """
+        if self._partitions is not None:
+            return self._partitions
+            
+        app_configs = list(apps.get_app_configs())
+        if self.cache:
+            self._settings_digest_value = self._settings_digest()
+            self._app_digests = {
+                app_config.label: AnalysisCache.source_digest(app_config.path)
+                for app_config in app_configs
+            }
+        
+        partitions = {}
+        for app_config in app_configs:
+            key = self._app_key(app_config) if self.cache else None
+            partition = self.cache.load(app_config.label, key) if self.cache else None
+            if partition is None:
+                partition = {
+                    'app': self._analyze_app(app_config),
+                    'models': self._analyze_app_models(app_config),
+                    'forms': self._analyze_app_forms(app_config),
+                }
+                if self.cache:
+                    self.cache.store(app_config.label, key, partition)
+            partitions[app_config.label] = partition
+            
+        if self.cache:
+            self.cache.prune(list(partitions) + ['urls', 'templates'])
+        self._partitions = partitions
+        return partitions
     
     def _analyze_apps(self) -> List[Dict[str, Any]]:
         """Analyze installed Django apps."""
-        app_configs = []
-        for app_config in apps.get_app_configs():
-            app_configs.append({
-                'name': app_config.name,
-                'label': app_config.label,
-                'path': app_config.path,
-                'models': [model._meta.model_name for model in app_config.get_models()],
-            })
-        return app_configs
+        return [partition['app'] for partition in self._app_partitions().values()]
+    
+    def _analyze_app(self, app_config) -> Dict[str, Any]:
+        """Analyze a single installed Django app."""
+        return {
+            'name': app_config.name,
+            'label': app_config.label,
+            'path': app_config.path,
+            'models': [model._meta.model_name for model in app_config.get_models()],
+        }
     
     def _analyze_models(self) -> Dict[str, Any]:
         """Analyze Django models."""
         models_info = {}
-        for model in apps.get_models():
+        for partition in self._app_partitions().values():
+            models_info.update(partition['models'])
+        return models_info
+    
+    def _analyze_app_models(self, app_config) -> Dict[str, Any]:
+        """Analyze the models of a single Django app."""
+        models_info = {}
+        for model in app_config.get_models():
             model_info = {
                 'fields': [],
                 'methods': [],
@@ -89,16 +425,14 @@ class ProjectAnalyzer:
                 model_info['fields'].append(field_info)
             
             # Analyze methods
-            for attr in dir(model):
-                if not attr.startswith('_') and callable(getattr(model, attr)):
-                    model_info['methods'].append(attr)
+            model_info['methods'] = model_methods(model)
             
             # Get meta options
             if model._meta:
                 model_info['meta'] = {
-                    'verbose_name': model._meta.verbose_name,
-                    'verbose_name_plural': model._meta.verbose_name_plural,
-                    'ordering': model._meta.ordering,
+                    'verbose_name': str(model._meta.verbose_name),
+                    'verbose_name_plural': str(model._meta.verbose_name_plural),
+                    'ordering': [str(order) for order in model._meta.ordering],
                 }
             
             models_info[f"{model._meta.app_label}.{model._meta.model_name}"] = model_info
@@ -106,40 +440,183 @@ class ProjectAnalyzer:
         return models_info
     
     def _analyze_urls(self) -> List[Dict[str, Any]]:
-        """Analyze URL patterns."""
+        """Analyze URL patterns, reusing the cached result if no source changed."""
+        return self._url_views()['urls']
+        
+    def _url_views(self) -> Dict[str, Any]:
+        """
+        Walk the URL patterns and describe their views, or load both from the cache.
+        
+        Besides the root urlconf, the settings and the apps, a cached result
+        is only reused while every project module it was built from (included
+        urlconfs and view modules, e.g. in the project package) is unchanged.
+        
+        Returns:
+            Dict with the 'urls', the 'views' keyed by URL pattern and the
+            'forms' those views use
+        """
+        if self._url_partition is not None:
+            return self._url_partition
+        if not getattr(settings, 'ROOT_URLCONF', None):
+            self._url_partition = {'urls': [], 'views': {}, 'forms': {}}
+            return self._url_partition
+            
+        key = None
+        if self.cache:
+            self._app_partitions()
+            root_module = importlib.import_module(settings.ROOT_URLCONF)
+            key = AnalysisCache.make_key(
+                self._settings_digest_value,
+                AnalysisCache.source_digest(root_module.__file__),
+                *(f"{label}:{digest}" for label, digest in sorted(self._app_digests.items()))
+            )
+            self._url_partition = self.cache.load('urls', key, validate=lambda data: all(
+                AnalysisCache.source_digest(path) == digest for path, digest in data['sources'].items()
+            ))
+            if self._url_partition is not None:
+                return self._url_partition
+                
+        urls, modules = self._walk_url_patterns()
+        views, forms = {}, {}
+        for url in urls:
+            view, view_forms = url.pop('_view')
+            views[url['pattern']] = view
+            forms.update(view_forms)
+        sources = {}
+        for module_name in sorted(modules):
+            module_file = self._project_file(module_name)
+            if module_file:
+                sources[module_file] = AnalysisCache.source_digest(module_file)
+        self._url_partition = {'urls': urls, 'views': views, 'forms': forms, 'sources': sources}
+        if self.cache:
+            self.cache.store('urls', key, self._url_partition)
+        return self._url_partition
+    
+    def _walk_url_patterns(self) -> Tuple[List[Dict[str, Any]], Set[str]]:
+        """
+        Collect URL patterns from the root URL resolver.
+
+        Patterns carry their full path from the site root and their
+        namespaced name, e.g. '/blog/<int:pk>/' and 'blog:detail'.
+        
+        Returns:
+            Tuple of (URL patterns, names of the urlconf and view modules
+            the walk visited)
+        """
         from django.urls import get_resolver
         
-        def _process_url_pattern(pattern: URLPattern) -> Dict[str, Any]:
+        # Included urlconfs are keyed by their pattern list, which Django
+        # shares between every include() of the same module
+        pattern_lists: Dict[int, Any] = {}
+        modules: Set[str] = set()
+        
+        def _segment(pattern: Any) -> str:
+            language_prefix = getattr(pattern, 'language_prefix', None)
+            if language_prefix is not None:
+                return language_prefix
+            return route_segment(str(pattern), isinstance(pattern, RegexPattern))
+        
+        def _include(pattern: Any) -> Optional[Tuple[int, str, Optional[str]]]:
+            if not isinstance(pattern, URLResolver):
+                return None
+            patterns = pattern.url_patterns
+            pattern_lists[id(patterns)] = patterns
+            module_name = getattr(pattern.urlconf_module, '__name__', None)
+            if module_name:
+                modules.add(module_name)
+            return id(patterns), _segment(pattern.pattern), pattern.namespace
+        
+        def _leaf(pattern: URLPattern) -> Dict[str, Any]:
+            callback = pattern.callback
+            view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+            module_name = getattr(view_class if isinstance(view_class, type) else callback, '__module__', None)
+            if module_name:
+                modules.add(module_name)
             return {
-                'pattern': str(pattern.pattern),
+                'pattern': _segment(pattern.pattern),
                 'name': pattern.name,
-                'view_name': pattern.callback.__name__ if pattern.callback else None,
-                'view_class': pattern.callback.__class__.__name__ if pattern.callback and hasattr(pattern.callback, '__class__') else None,
+                'view_name': getattr(callback, '__name__', None),
+                'view_class': _view_class_path(callback),
+                'model': _view_model_label(callback),
+                '_view': view_info(callback),
             }
         
-        def _process_url_patterns(patterns) -> List[Dict[str, Any]]:
-            urls = []
-            for pattern in patterns:
-                if isinstance(pattern, URLResolver):
-                    urls.extend(_process_url_patterns(pattern.url_patterns))
-                else:
-                    urls.append(_process_url_pattern(pattern))
-            return urls
-        
-        resolver = get_resolver()
-        return _process_url_patterns(resolver.url_patterns)
+        root = _include(get_resolver())[0]
+        return flatten_urlconf(root, pattern_lists.__getitem__, _include, _leaf), modules
+    
+    def _templates(self) -> TemplateIndex:
+        """Build the project's template index once for all analyzers."""
+        if self._template_index is None:
+            cache_key = ''
+            if self.cache:
+                self._app_partitions()
+                cache_key = AnalysisCache.make_key(
+                    self._settings_digest_value,
+                    *(
+                        AnalysisCache.source_digest(os.path.join(app_config.path, 'templatetags'))
+                        for app_config in apps.get_app_configs()
+                        if os.path.isdir(os.path.join(app_config.path, 'templatetags'))
+                    )
+                )
+            self._template_index = TemplateIndex(self.cache, cache_key).build()
+        return self._template_index
     
     def _analyze_views(self) -> Dict[str, Any]:
-        """Analyze views."""
-        # This will be implemented to extract view information
-        return {}
+        """
+        Analyze the views of the URL patterns, keyed by URL pattern.
+        
+        Each view's template is resolved against the template index, adding
+        the templates it extends and includes.
+        """
+        templates = self._templates()
+        views_info = {}
+        for pattern, view in self._url_views()['views'].items():
+            view = dict(view)
+            template = next(
+                (name for name in view['template_names'] if templates.get(name)),
+                view['template_names'][0] if view['template_names'] else None
+            )
+            view['template'] = template
+            view['template_exists'] = bool(template and templates.get(template))
+            view['template_chain'] = templates.ancestors(template) if template else []
+            view['includes'] = templates.includes(template) if template else []
+            views_info[pattern] = view
+        return views_info
+    
+    def _analyze_app_forms(self, app_config) -> Dict[str, Any]:
+        """
+        Analyze the forms defined in an app's forms module.
+        
+        Only apps inside the project are inspected, so forms shipped with
+        Django and third-party apps are documented only where views use them.
+        """
+        from django.utils.module_loading import module_has_submodule
+        
+        app_path = os.path.abspath(app_config.path)
+        if os.path.commonpath([app_path, self.project_path]) != self.project_path:
+            return {}
+        if not module_has_submodule(app_config.module, 'forms'):
+            return {}
+        try:
+            module = importlib.import_module(f"{app_config.name}.forms")
+        except Exception as e:
+            print(f"Warning: Could not import {app_config.name}.forms: {e}")
+            return {}
+            
+        return {
+            _dotted_path(value): form_info(value)
+            for value in vars(module).values()
+            if _is_form_class(value) and value.__module__ == module.__name__
+        }
     
     def _analyze_forms(self) -> Dict[str, Any]:
-        """Analyze forms."""
-        # This will be implemented to extract form information
-        return {}
+        """Analyze the project's forms and the forms its views use, keyed by dotted path."""
+        forms_info = {}
+        for partition in self._app_partitions().values():
+            forms_info.update(partition['forms'])
+        forms_info.update(self._url_views()['forms'])
+        return dict(sorted(forms_info.items()))
     
     def _analyze_templates(self) -> Dict[str, Any]:
-        """Analyze templates."""
-        # This will be implemented to extract template information
-        return {} 
\ No newline at end of file
+        """Analyze templates, keyed by template name."""
+        return self._templates().templates
@@ -0,0 +1,165 @@
+/*
+ * Search box of the HTML documentation generated by django-autodoc.
+ *
+ * Looks queries up in the prebuilt index under search/ (see
+ * django_autodoc/core/search_index.py). Only the manifest, the term shards
+ * of the query words and the document shards of the best matches are
+ * fetched, and every file is fetched at most once per page.
+ */
+(function () {
+    'use strict';
+
+    var INDEX_VERSION = 1;
+    var MAX_RESULTS = 50;
+
+    var input = document.getElementById('autodoc-search');
+    var list = document.getElementById('autodoc-results');
+    if (!input || !list || !window.fetch) {
+        return;
+    }
+    var root = input.getAttribute('data-root') || '';
+    var files = {};
+    var latest = 0;
+
+    function load(name) {
+        if (!files[name]) {
+            files[name] = fetch(root + 'search/' + name).then(function (response) {
+                if (!response.ok) {
+                    throw new Error(name + ': ' + response.status);
+                }
+                return response.json();
+            });
+        }
+        return files[name];
+    }
+
+    // Must match search_index.tokenize()
+    function tokenize(text) {
+        return text.toLowerCase().match(/[\p{L}\p{N}\p{M}]+/gu) || [];
+    }
+
+    // Must match search_index.shard_name()
+    function shardName(prefix) {
+        if (/^[a-z0-9]+$/.test(prefix)) {
+            return prefix;
+        }
+        var hex = 'x';
+        new TextEncoder().encode(prefix).forEach(function (byte) {
+            hex += (byte < 16 ? '0' : '') + byte.toString(16);
+        });
+        return hex;
+    }
+
+    // Documents containing a term that starts with word, with a higher
+    // score for exact matches
+    function lookup(manifest, word) {
+        var prefix = Array.from(word).slice(0, manifest.prefix_length).join('');
+        var name = shardName(prefix);
+        var shards = manifest.shards.filter(function (shard) {
+            return prefix.length < manifest.prefix_length ? shard.indexOf(name) === 0 : shard === name;
+        });
+        return Promise.all(shards.map(function (shard) {
+            return load('terms-' + shard + '.json');
+        })).then(function (loaded) {
+            var scores = new Map();
+            loaded.forEach(function (terms) {
+                Object.keys(terms).forEach(function (term) {
+                    if (term.indexOf(word) !== 0) {
+                        return;
+                    }
+                    var score = term === word ? 2 : 1;
+                    var id = 0;
+                    terms[term].forEach(function (gap) {
+                        id += gap;
+                        scores.set(id, Math.max(scores.get(id) || 0, score));
+                    });
+                });
+            });
+            return scores;
+        });
+    }
+
+    function search(query) {
+        var words = Array.from(new Set(tokenize(query)));
+        if (!words.length) {
+            return Promise.resolve([]);
+        }
+        return load('index.json').then(function (manifest) {
+            if (manifest.version !== INDEX_VERSION) {
+                throw new Error('Unsupported search index version ' + manifest.version);
+            }
+            return Promise.all(words.map(function (word) {
+                return lookup(manifest, word);
+            })).then(function (perWord) {
+                perWord.sort(function (a, b) { return a.size - b.size; });
+                var matches = [];
+                perWord[0].forEach(function (score, id) {
+                    for (var i = 1; i < perWord.length; i++) {
+                        if (!perWord[i].has(id)) {
+                            return;
+                        }
+                        score += perWord[i].get(id);
+                    }
+                    matches.push([score, id]);
+                });
+                matches.sort(function (a, b) { return b[0] - a[0] || a[1] - b[1]; });
+                matches = matches.slice(0, MAX_RESULTS);
+
+                var shards = Array.from(new Set(matches.map(function (match) {
+                    return Math.floor(match[1] / manifest.docs_per_shard);
+                })));
+                return Promise.all(shards.map(function (shard) {
+                    return load('docs-' + shard + '.json');
+                })).then(function (loaded) {
+                    var documents = {};
+                    shards.forEach(function (shard, i) {
+                        documents[shard] = loaded[i];
+                    });
+                    return matches.map(function (match) {
+                        var shard = Math.floor(match[1] / manifest.docs_per_shard);
+                        return documents[shard][match[1] - shard * manifest.docs_per_shard];
+                    });
+                });
+            });
+        });
+    }
+
+    function show(documents, query) {
+        list.textContent = '';
+        if (query && !documents.length) {
+            var empty = document.createElement('li');
+            empty.textContent = 'No results';
+            list.appendChild(empty);
+        }
+        documents.forEach(function (doc) {
+            var item = document.createElement('li');
+            var link = document.createElement('a');
+            link.href = root + doc[1];
+            link.textContent = doc[0];
+            var details = document.createElement('small');
+            details.textContent = ' ' + doc[2] + ' · ' + doc[3];
+            item.appendChild(link);
+            item.appendChild(details);
+            list.appendChild(item);
+        });
+    }
+
+    var timer = null;
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () {
+            var query = input.value;
+            var current = ++latest;
+            search(query).then(function (documents) {
+                if (current === latest) {
+                    show(documents, query.trim());
+                }
+            }, function (error) {
+                if (current === latest) {
+                    show([], '');
+                }
+                console.error('Search failed:', error);
+            });
+        }, 100);
+    });
+})();
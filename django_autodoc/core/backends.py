@@ -0,0 +1,396 @@
+import asyncio
+import re
+import ssl
+import time
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .session import SessionStore
+from ..utils.profiling import Profiler
+
+class CaptureBackend(ABC):
+    """Interface for capturing the pages of a running application."""
+
+    @abstractmethod
+    def capture(self, urls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Capture the provided URLs.
+
+        Args:
+            urls: List of URL dictionaries with 'pattern' and 'name' keys, and
+                optionally a concrete 'path' to visit for parameterized patterns
+
+        Returns:
+            Dict mapping URL patterns to captured results
+        """
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+# Errors of a single request: the server is unreachable, too slow, or sends a
+# malformed response
+_REQUEST_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError)
+
+def capturable_urls(urls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop URL patterns whose parameters have not been resolved to a concrete path."""
+    return [
+        url_info for url_info in urls
+        if '<' not in url_info.get('path', url_info['pattern'])
+        and '?' not in url_info.get('path', url_info['pattern'])
+    ]
+
+class _PageParser(HTMLParser):
+    """Extracts the title, headings and forms of an HTML page."""
+
+    HEADINGS = ('h1', 'h2', 'h3')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.headings: List[Dict[str, Any]] = []
+        self.forms: List[Dict[str, Any]] = []
+        self._text_target: Optional[str] = None
+        self._text: List[str] = []
+        self._form: Optional[Dict[str, Any]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        if tag == 'title' or tag in self.HEADINGS:
+            self._text_target = tag
+            self._text = []
+        elif tag == 'form':
+            self._form = {
+                'action': attributes.get('action') or '',
+                'method': (attributes.get('method') or 'get').lower(),
+                'fields': [],
+            }
+            self.forms.append(self._form)
+        elif tag in ('input', 'select', 'textarea') and self._form is not None:
+            name = attributes.get('name')
+            field_type = attributes.get('type') or ('text' if tag == 'input' else tag)
+            if name and name != 'csrfmiddlewaretoken' and field_type not in ('submit', 'button', 'reset'):
+                self._form['fields'].append({
+                    'name': name,
+                    'type': field_type,
+                    'required': 'required' in attributes,
+                })
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == self._text_target:
+            text = ' '.join(''.join(self._text).split())
+            if tag == 'title':
+                self.title = text
+            elif text:
+                self.headings.append({'level': int(tag[1]), 'text': text})
+            self._text_target = None
+        elif tag == 'form':
+            self._form = None
+
+    def handle_data(self, data: str) -> None:
+        if self._text_target:
+            self._text.append(data)
+
+def parse_page(html: str) -> Dict[str, Any]:
+    """
+    Extract page metadata from HTML.
+
+    Returns:
+        Dict with 'title', 'headings' and 'forms' keys
+    """
+    parser = _PageParser()
+    parser.feed(html)
+    parser.close()
+    return {'title': parser.title, 'headings': parser.headings, 'forms': parser.forms}
+
+class _Response:
+    """A buffered HTTP response."""
+
+    def __init__(self, status: int, headers: List[Tuple[str, str]], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key == name:
+                return value
+        return None
+
+class _ConnectionPool:
+    """
+    Minimal HTTP/1.1 client on asyncio streams that keeps connections alive
+    and reuses them across requests.
+    """
+
+    def __init__(self, base_url: str, size: int, timeout: float):
+        parts = urlsplit(base_url)
+        self.secure = parts.scheme == 'https'
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or (443 if self.secure else 80)
+        self.host_header = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore = asyncio.Semaphore(size)
+        self.connections_opened = 0
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b'',
+    ) -> _Response:
+        """Send a request, retrying once on a fresh connection if a kept-alive one went stale."""
+        async with self._semaphore:
+            connection = self._idle.pop() if self._idle else None
+            for attempt in range(2):
+                if connection is None:
+                    connection = await asyncio.wait_for(
+                        asyncio.open_connection(
+                            self.host, self.port, ssl=ssl.create_default_context() if self.secure else None
+                        ),
+                        self.timeout,
+                    )
+                    self.connections_opened += 1
+                    fresh = True
+                else:
+                    fresh = False
+                try:
+                    response, keep_alive = await asyncio.wait_for(
+                        self._send(connection, method, path, headers or {}, body), self.timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    connection[1].close()
+                    connection = None
+                    if fresh or attempt:
+                        raise
+                    continue
+                except BaseException:
+                    connection[1].close()
+                    raise
+                if keep_alive:
+                    self._idle.append(connection)
+                else:
+                    connection[1].close()
+                return response
+        raise ConnectionError(f"Request to {path} failed")
+
+    async def _send(
+        self,
+        connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> Tuple[_Response, bool]:
+        reader, writer = connection
+        if not path.startswith('/'):
+            path = f"/{path}"
+        lines = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "Connection: keep-alive",
+            "Accept-Encoding: identity",
+        ]
+        lines.extend(f"{key}: {value}" for key, value in headers.items())
+        if body or method == 'POST':
+            lines.append(f"Content-Length: {len(body)}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[0].startswith(b'HTTP/') or not parts[1].isdigit():
+            raise ValueError(f"Malformed status line: {status_line[:80]!r}")
+        status = int(parts[1])
+        response_headers = []
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            response_headers.append((key.strip().lower(), value.strip()))
+        response = _Response(status, response_headers, b'')
+
+        keep_alive = (response.header('connection') or '').lower() != 'close'
+        if (response.header('transfer-encoding') or '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    # Skip trailers
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            response.body = b''.join(chunks)
+        elif response.header('content-length') is not None:
+            response.body = await reader.readexactly(int(response.header('content-length')))
+        elif method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            response.body = b''
+        else:
+            response.body = await reader.read()
+            keep_alive = False
+        return response, keep_alive
+
+    def close(self) -> None:
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+class HTTPSnapshotBackend(CaptureBackend):
+    """
+    Captures page HTML metadata (status, title, headings, forms) over plain
+    HTTP, concurrently on a pool of keep-alive connections, without a browser.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        login_url: Optional[str] = None,
+        session_file: Optional[str] = None,
+        session_check_url: Optional[str] = None,
+        concurrency: int = 16,
+        timeout: float = 30.0,
+        profiler: Optional[Profiler] = None,
+    ):
+        """
+        Initialize the HTTP snapshot backend.
+
+        Args:
+            base_url: Base URL of the running Django application
+            username: Admin username for authenticated views (optional)
+            password: Admin password for authenticated views (optional)
+            login_url: URL of the login page (optional)
+            session_file: File holding the session shared with other capture
+                runs and backends (optional)
+            session_check_url: Page that only loads for an authenticated user
+                (defaults to '/admin/')
+            concurrency: Maximum number of concurrent requests and connections
+            timeout: Per-request timeout in seconds
+            profiler: Profiler to record login and per-URL fetch times with (optional)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.login_url = login_url or '/admin/login/'
+        self.session = SessionStore(session_file, self.base_url, username)
+        self.session_check_url = session_check_url or '/admin/'
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.cookies: Dict[str, str] = {}
+        self.elapsed = 0.0
+        self.profiler = profiler or Profiler(enabled=False)
+
+    def capture(self, urls: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch every URL concurrently and extract its page data.
+
+        Returns:
+            Dict mapping URL patterns to page data with 'url', 'status',
+            'title', 'headings', 'forms' and 'elapsed' keys
+        """
+        started = time.monotonic()
+        # Page data is kept per URL pattern, so only the first sample of a
+        # parameterized pattern is fetched
+        targets = [url_info for url_info in capturable_urls(urls) if not url_info.get('sample')]
+        pages = asyncio.run(self._capture_all(targets))
+        self.elapsed = time.monotonic() - started
+        print(f"Fetched {len(pages)} pages in {self.elapsed:.1f}s")
+        return pages
+
+    async def _capture_all(self, urls: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        pool = _ConnectionPool(self.base_url, self.concurrency, self.timeout)
+        try:
+            if self.username and self.password:
+                with self.profiler.span('login'):
+                    try:
+                        logged_in = await self._authenticate(pool)
+                    except _REQUEST_ERRORS as e:
+                        print(f"Login failed: {str(e) or e.__class__.__name__}")
+                        logged_in = False
+                if not logged_in:
+                    print("Warning: Login failed, some pages may be incomplete")
+            results = await asyncio.gather(*(self._capture_url(pool, url_info) for url_info in urls))
+        finally:
+            pool.close()
+        return {pattern: page for pattern, page in results if page is not None}
+
+    async def _capture_url(
+        self,
+        pool: _ConnectionPool,
+        url_info: Dict[str, Any],
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        url_pattern = url_info['pattern']
+        url_path = url_info.get('path', url_pattern)
+        started = time.monotonic()
+        with self.profiler.span(url_pattern, Profiler.URL_CATEGORY, path=url_path) as span:
+            try:
+                response = await pool.request('GET', url_path, self._headers())
+            except _REQUEST_ERRORS as e:
+                print(f"Failed to fetch {url_pattern}: {str(e) or e.__class__.__name__}")
+                span['failed'] = True
+                return url_pattern, None
+            span['status'] = response.status
+
+            page = {'url': f"{self.base_url}{url_path}", 'status': response.status}
+            page.update(parse_page(response.body.decode('utf-8', errors='replace')))
+        page['elapsed'] = time.monotonic() - started
+        return url_pattern, page
+
+    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        headers = dict(extra or {})
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in self.cookies.items())
+        return headers
+
+    def _store_cookies(self, response: _Response) -> None:
+        for key, value in response.headers:
+            if key != 'set-cookie':
+                continue
+            try:
+                cookie = SimpleCookie(value)
+            except CookieError:
+                continue
+            for name, morsel in cookie.items():
+                self.cookies[name] = morsel.value
+
+    async def _authenticate(self, pool: _ConnectionPool) -> bool:
+        """Reuse the saved session if it is still valid, otherwise log in through the form."""
+        saved = self.session.load()
+        if saved:
+            self.cookies = {cookie['name']: cookie['value'] for cookie in saved}
+            response = await pool.request('GET', self.session_check_url, self._headers())
+            if response.status == 200:
+                return True
+            self.cookies = {}
+
+        response = await pool.request('GET', self.login_url, self._headers())
+        self._store_cookies(response)
+        match = re.search(
+            rb'name=["\']csrfmiddlewaretoken["\']\s+value=["\']([^"\']+)', response.body
+        )
+        form = {'username': self.username, 'password': self.password}
+        if match:
+            form['csrfmiddlewaretoken'] = match.group(1).decode()
+
+        response = await pool.request('POST', self.login_url, self._headers({
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Referer': f"{self.base_url}{self.login_url}",
+        }), urlencode(form).encode())
+        self._store_cookies(response)
+        location = response.header('location') or ''
+        if response.status not in (301, 302, 303) or location.rstrip('/').endswith(self.login_url.rstrip('/')):
+            return False
+
+        self.session.save([{'name': name, 'value': value} for name, value in self.cookies.items()])
+        return True
@@ -0,0 +1,166 @@
+import contextlib
+import multiprocessing
+import sys
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from .schema import ProjectInfo, iter_analysis_records, load_analysis_records
+
+# Records sent per message from a worker to the batch process
+CHUNK_SIZE = 500
+
+def _django_configured() -> bool:
+    """Check whether Django's app registry is populated in this process."""
+    django_apps = sys.modules.get('django.apps')
+    return bool(django_apps and django_apps.apps.ready)
+
+def _analyze_job(job: Dict[str, Any], conn: Connection) -> None:
+    """
+    Analyze one project in a worker process and stream the result back.
+
+    Messages are ('records', [...]) chunks of analysis records followed by
+    ('done', stats), or ('error', message) if the analysis failed.
+    """
+    try:
+        # The batch process writes its results to stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            if job.get('static'):
+                from .static_analyzer import StaticProjectAnalyzer
+                analyzer = StaticProjectAnalyzer(job['project'], job.get('settings'))
+            else:
+                from .analyzer import ProjectAnalyzer
+                analyzer = ProjectAnalyzer(job['project'], job.get('settings'), cache_dir=job.get('cache_dir'))
+            project = ProjectInfo.from_dict(analyzer.analyze())
+
+        chunk: List[Dict[str, Any]] = []
+        for record in iter_analysis_records(project):
+            chunk.append(record)
+            if len(chunk) >= CHUNK_SIZE:
+                conn.send(('records', chunk))
+                chunk = []
+        if chunk:
+            conn.send(('records', chunk))
+        cache = getattr(analyzer, 'cache', None)
+        conn.send(('done', {
+            'cache_hits': cache.hits if cache else None,
+            'cache_misses': cache.misses if cache else None,
+        }))
+    except BaseException as e:
+        traceback.print_exc()
+        conn.send(('error', f"{e.__class__.__name__}: {e}"))
+    finally:
+        conn.close()
+
+class _Worker:
+    """A worker process analyzing one job, and what it has sent so far."""
+
+    def __init__(self, index: int, job: Dict[str, Any], context: Any):
+        self.index = index
+        self.job = job
+        self.records: List[Dict[str, Any]] = []
+        self.started = time.monotonic()
+        self.conn, child_conn = context.Pipe(duplex=False)
+        self.process = context.Process(target=_analyze_job, args=(job, child_conn))
+        self.process.start()
+        # Only the child holds the sending end, so its exit ends the stream
+        child_conn.close()
+
+    def result(self, status: str, error: Optional[str] = None, stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Stop the worker and describe the job's outcome."""
+        self.conn.close()
+        if self.process.is_alive() and status != 'ok':
+            self.process.kill()
+        self.process.join()
+        result = {
+            'index': self.index,
+            'job': self.job,
+            'status': status,
+            'error': error,
+            'elapsed': time.monotonic() - self.started,
+            'exitcode': self.process.exitcode,
+            'project': None,
+            'capture_urls': None,
+        }
+        result.update(stats or {})
+        if status == 'ok':
+            try:
+                result['project'], result['capture_urls'] = load_analysis_records(self.records, self.job['project'])
+            except ValueError as e:
+                result.update(status='failed', error=str(e))
+        return result
+
+def run_batch(
+    jobs: Iterable[Dict[str, Any]],
+    parallel: int = 1,
+    timeout: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze several projects, each in its own worker process.
+
+    ``django.setup()`` configures a single settings module per process, so
+    every job runs in a fresh process, with at most ``parallel`` running at a
+    time. Workers stream their analysis back as records; a job whose
+    analysis raises, whose process crashes or which exceeds the timeout is
+    reported as failed without affecting the others.
+
+    Workers are forked while this process has not configured Django itself,
+    and spawned otherwise.
+
+    Args:
+        jobs: Job options with the 'project' path and optionally 'settings',
+            'static' and 'cache_dir'
+        parallel: Maximum number of concurrent workers
+        timeout: Seconds after which a job's worker is killed (optional)
+
+    Yields:
+        Results in completion order, with the job's 'index' and 'job', its
+        'status' ('ok' or 'failed'), 'error', 'elapsed' time and worker
+        'exitcode', and for successful jobs the 'project' information and
+        'capture_urls'
+    """
+    context = multiprocessing.get_context('spawn' if _django_configured() else 'fork')
+    pending: Deque[Any] = deque(enumerate(jobs))
+    running: Dict[Connection, _Worker] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < max(1, parallel):
+                index, job = pending.popleft()
+                worker = _Worker(index, job, context)
+                running[worker.conn] = worker
+
+            wait_timeout = None
+            if timeout is not None:
+                now = time.monotonic()
+                wait_timeout = max(0.0, min(worker.started + timeout - now for worker in running.values()))
+            for conn in wait(list(running), wait_timeout):
+                worker = running[conn]
+                try:
+                    kind, payload = conn.recv()
+                except (EOFError, OSError):
+                    del running[conn]
+                    worker.process.join()
+                    yield worker.result('failed', f"Worker exited with code {worker.process.exitcode}")
+                    continue
+                if kind == 'records':
+                    worker.records.extend(payload)
+                    continue
+                del running[conn]
+                if kind == 'done':
+                    yield worker.result('ok', stats=payload)
+                else:
+                    yield worker.result('failed', payload)
+
+            if timeout is not None:
+                now = time.monotonic()
+                for conn, worker in list(running.items()):
+                    if now - worker.started >= timeout:
+                        del running[conn]
+                        yield worker.result('failed', f"Timed out after {timeout:g}s")
+    finally:
+        for worker in running.values():
+            worker.conn.close()
+            worker.process.kill()
+            worker.process.join()
@@ -1,5 +1,10 @@
+import hashlib
 import os
-from typing import Dict, List, Optional
+import queue
+import threading
+import time
+import urllib.error
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -7,9 +12,62 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
-class ScreenshotCapturer:
+from .backends import CaptureBackend, capturable_urls
+from .chromedriver import CHROMEDRIVER_ENV, resolve_chromedriver
+from .postprocess import ScreenshotProcessor
+from .readiness import ReadinessPolicy
+from .screenshot_cache import ScreenshotCache
+from .session import SessionStore
+from ..utils.http import fetch
+from ..utils.profiling import Profiler
+
+# Window sizes that can be referred to by name in --viewports.
+VIEWPORT_PRESETS = {
+    'desktop': (1920, 1080),
+    'tablet': (768, 1024),
+    'mobile': (375, 812),
+}
+
+# Resolves after the next two animation frames, by which time the layout for
+# a new window size has been recalculated and painted.
+_REFLOW_SCRIPT = """
+    var done = arguments[arguments.length - 1];
+    requestAnimationFrame(function () {
+        requestAnimationFrame(function () { done(window.innerWidth); });
+    });
+"""
+
+def parse_viewports(spec: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse a comma-separated viewport list such as 'desktop,tablet,phone=390x844'.
+    
+    Each item is a preset name from VIEWPORT_PRESETS or NAME=WIDTHxHEIGHT.
+    
+    Returns:
+        Window sizes keyed by viewport name, in the given order
+        
+    Raises:
+        ValueError: If an item is neither a preset nor a valid size
+    """
+    viewports = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, separator, size = item.partition('=')
+        if not separator:
+            if name not in VIEWPORT_PRESETS:
+                raise ValueError(f"Unknown viewport {name!r}; use one of "
+                                 f"{', '.join(VIEWPORT_PRESETS)} or NAME=WIDTHxHEIGHT")
+            viewports[name] = VIEWPORT_PRESETS[name]
+            continue
+        width, _, height = size.lower().partition('x')
+        if not (name and width.isdigit() and height.isdigit()):
+            raise ValueError(f"Invalid viewport {item!r}, expected NAME=WIDTHxHEIGHT")
+        viewports[name] = (int(width), int(height))
+    if not viewports:
+        raise ValueError("No viewports given")
+    return viewports
+
+class ScreenshotCapturer(CaptureBackend):
     """Captures screenshots of Django views using Selenium."""
     
     def __init__(
@@ -19,6 +77,18 @@ class ScreenshotCapturer:
         username: Optional[str] = None,
         password: Optional[str] = None,
         login_url: Optional[str] = None,
+        workers: int = 1,
+        use_cache: bool = True,
+        force_recapture: bool = False,
+        cache_max_age: Optional[float] = None,
+        cache_max_entries: Optional[int] = None,
+        session_file: Optional[str] = None,
+        session_check_url: Optional[str] = None,
+        readiness: Optional[ReadinessPolicy] = None,
+        viewports: Optional[Dict[str, Tuple[int, int]]] = None,
+        postprocessor: Optional[ScreenshotProcessor] = None,
+        profiler: Optional[Profiler] = None,
+        driver_cache_file: Optional[str] = None,
     ):
         """
         Initialize the screenshot capturer.
@@ -29,44 +99,99 @@ class ScreenshotCapturer:
             username: Admin username for authenticated views (optional)
             password: Admin password for authenticated views (optional)
             login_url: URL of the login page (optional)
+            workers: Number of parallel WebDriver instances to capture with
+            use_cache: Skip pages whose content has not changed since the last run
+            force_recapture: Recapture every page, refreshing the cache
+            cache_max_age: Evict cache entries unused for this many seconds (optional)
+            cache_max_entries: Maximum number of cache entries to keep (optional)
+            session_file: File to persist authenticated session cookies in (optional)
+            session_check_url: Page that only loads for an authenticated user,
+                used to revalidate a saved session (defaults to '/admin/')
+            readiness: Policy deciding when each page is ready to capture
+                (defaults to waiting for document.readyState == 'complete')
+            viewports: Window sizes to capture every page at, keyed by name;
+                the first one is the primary screenshot (defaults to desktop)
+            postprocessor: Deduplicates and recompresses screenshots after
+                capture (optional)
+            profiler: Profiler to record driver startup, login and per-URL
+                capture times with (optional)
+            driver_cache_file: File to remember the resolved chromedriver
+                path in, so later runs start without a network lookup (optional)
         """
         self.base_url = base_url.rstrip('/')
         self.output_dir = output_dir
         self.username = username
         self.password = password
         self.login_url = login_url or '/admin/login/'
+        self.session = SessionStore(session_file, self.base_url, username)
+        self.session_check_url = session_check_url or '/admin/'
+        self.readiness = readiness or ReadinessPolicy()
+        self.viewports = dict(viewports or {'desktop': VIEWPORT_PRESETS['desktop']})
+        self.primary_viewport = next(iter(self.viewports))
+        self.variants: Dict[str, Dict[str, str]] = {}
+        self.cookies: List[Dict[str, Any]] = []
+        self.postprocessor = postprocessor
+        self.thumbnails: Dict[str, str] = {}
+        self.profiler = profiler or Profiler(enabled=False)
+        self.workers = max(1, workers)
+        self.worker_stats: List[Dict[str, Any]] = []
+        self.force_recapture = force_recapture
+        self.driver_cache_file = driver_cache_file
+        self.cache = ScreenshotCache(
+            output_dir,
+            max_age=cache_max_age,
+            max_entries=cache_max_entries,
+        ) if use_cache else None
         self.driver = None
         self._setup_driver()
         
     def _setup_driver(self) -> None:
-        """Set up Chrome WebDriver with appropriate options."""
+        """Set up the primary Chrome WebDriver."""
+        with self.profiler.span('driver.start', worker=0):
+            self.driver = self._create_driver()
+        
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a Chrome WebDriver with appropriate options."""
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
+        width, height = self.viewports[self.primary_viewport]
+        chrome_options.add_argument(f'--window-size={width},{height}')
+        chrome_options.page_load_strategy = self.readiness.page_load_strategy
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(resolve_chromedriver(self.driver_cache_file))
+        try:
+            return webdriver.Chrome(service=service, options=chrome_options)
+        except WebDriverException:
+            if os.environ.get(CHROMEDRIVER_ENV):
+                raise
+            # The remembered driver may no longer match the installed Chrome
+            service = Service(resolve_chromedriver(self.driver_cache_file, refresh=True))
+            return webdriver.Chrome(service=service, options=chrome_options)
         
-    def _login(self) -> bool:
+    def _login(self, driver: Optional[webdriver.Chrome] = None) -> bool:
         """
         Perform login if credentials are provided.
         
+        Args:
+            driver: WebDriver to log in with (defaults to the primary driver)
+            
         Returns:
             bool: True if login successful, False otherwise
         """
         if not (self.username and self.password):
             return False
             
+        driver = driver or self.driver
         try:
-            self.driver.get(f"{self.base_url}{self.login_url}")
+            driver.get(f"{self.base_url}{self.login_url}")
             
             # Wait for login form
-            username_field = WebDriverWait(self.driver, 10).until(
+            username_field = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.NAME, "username"))
             )
-            password_field = self.driver.find_element(By.NAME, "password")
+            password_field = driver.find_element(By.NAME, "password")
             
             # Fill in credentials
             username_field.send_keys(self.username)
@@ -74,8 +199,8 @@ class ScreenshotCapturer:
             password_field.submit()
             
             # Wait for redirect
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.current_url != f"{self.base_url}{self.login_url}"
+            WebDriverWait(driver, 10).until(
+                lambda d: d.current_url != f"{self.base_url}{self.login_url}"
             )
             
             return True
@@ -84,56 +209,430 @@ class ScreenshotCapturer:
             print(f"Login failed: {str(e)}")
             return False
             
-    def capture_screenshots(self, urls: List[Dict[str, str]]) -> Dict[str, str]:
+    def _authenticate(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Authenticate the primary driver, reusing a saved session if it is still valid.
+        
+        Falls back to the login form only when there is no saved session or it
+        has expired, and saves the new session afterwards.
+        
+        Returns:
+            Session cookies to share with other drivers, or None if not logged in
+        """
+        if not (self.username and self.password):
+            return None
+            
+        cookies = self.session.load()
+        if cookies and self._session_valid(cookies):
+            self._apply_cookies(self.driver, cookies)
+            return cookies
+            
+        if not self._login():
+            print("Warning: Login failed, some screenshots may be incomplete")
+            return None
+        cookies = self.driver.get_cookies()
+        self.session.save(cookies)
+        return cookies
+        
+    def _session_valid(self, cookies: List[Dict[str, Any]]) -> bool:
+        """Check with a single plain HTTP request that saved cookies are still logged in."""
+        try:
+            status, _, _ = fetch(
+                f"{self.base_url}{self.session_check_url}",
+                cookies=cookies,
+                follow_redirects=False,
+            )
+        except (urllib.error.URLError, OSError):
+            return False
+        return status == 200
+        
+    def _apply_cookies(self, driver: webdriver.Chrome, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Load session cookies into a driver.
+        
+        Cookies are set through the DevTools protocol, which needs no page
+        load; drivers without it visit the site once and use add_cookie.
+        """
+        try:
+            for cookie in cookies:
+                params = {
+                    'name': cookie['name'],
+                    'value': cookie['value'],
+                    'url': self.base_url,
+                    'path': cookie.get('path', '/'),
+                    'secure': cookie.get('secure', False),
+                    'httpOnly': cookie.get('httpOnly', False),
+                }
+                if 'expiry' in cookie:
+                    params['expires'] = cookie['expiry']
+                driver.execute_cdp_cmd('Network.setCookie', params)
+        except (AttributeError, WebDriverException):
+            driver.get(f"{self.base_url}/")
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            
+    def capture_screenshots(self, urls: List[Dict[str, str]], keep: Iterable[str] = ()) -> Dict[str, str]:
         """
         Capture screenshots for the provided URLs.
         
+        When more than one worker is configured, URLs are shared between a
+        pool of WebDriver instances through a queue; the session is
+        established once and shared with every worker, and a failing worker
+        does not abort the others.
+        
         Args:
-            urls: List of URL dictionaries with 'pattern' and 'name' keys
+            urls: List of URL dictionaries with 'pattern' and 'name' keys, and
+                optionally a concrete 'path' to visit and the 'sample' index
+                for parameterized patterns
+            keep: Screenshot paths of pages that are not being recaptured
+                but are still shown, which post-processing must not prune
             
+        Each page is loaded once and captured at every configured viewport;
+        the per-viewport screenshots are left in ``self.variants``, together
+        with those of further samples of a parameterized pattern. With a
+        postprocessor, the returned paths point at the deduplicated files and
+        thumbnails of the primary screenshots are left in ``self.thumbnails``.
+        
         Returns:
-            Dict mapping URL names to screenshot file paths
+            Dict mapping URL patterns to screenshot file paths at the primary viewport
         """
-        screenshots = {}
         os.makedirs(self.output_dir, exist_ok=True)
+        self.worker_stats = []
+        self.variants = {}
+        self.readiness.ready_times = {}
         
-        # Login if credentials provided
-        if self.username and self.password:
-            if not self._login():
-                print("Warning: Login failed, some screenshots may be incomplete")
+        # Skip URL patterns with unresolved parameters
+        targets = capturable_urls(urls)
         
-        for url_info in urls:
-            url_pattern = url_info['pattern']
-            url_name = url_info['name'] or url_pattern.replace('/', '_').strip('_')
+        with self.profiler.span('login'):
+            cookies = self._authenticate()
+        # Pages are fingerprinted with the session itself: a driver that has
+        # not loaded a page of the site yet reports no cookies
+        self.cookies = cookies or []
+        if self.workers > 1 and len(targets) > 1:
+            captured = self._capture_parallel(targets, cookies)
+        else:
+            captured = self._capture_sequential(targets)
+        screenshots = self._merge_samples(captured)
+            
+        if self.postprocessor:
+            with self.profiler.span('screenshots.postprocess'):
+                screenshots = self._postprocess(screenshots)
+            
+        if self.cache:
+            with self.profiler.span('screenshots.cache'):
+                self.cache.evict()
+                self.cache.save()
+            print(f"Screenshot cache: {self.cache.hits} reused, {self.cache.misses} captured")
             
-            # Skip URL patterns with parameters
-            if '<' in url_pattern or '?' in url_pattern:
-                continue
+        if self.postprocessor:
+            referenced = {path for variants in self.variants.values() for path in variants.values()}
+            referenced.update(keep)
+            if self.cache:
+                referenced |= self.cache.paths()
+            self.postprocessor.prune(referenced)
+            
+        self._report_worker_stats()
+        return screenshots
+        
+    def _capture_sequential(self, urls: List[Dict[str, str]]) -> Dict[str, Dict[int, Dict[str, str]]]:
+        """
+        Capture screenshots one after another on the primary driver.
+        
+        Returns:
+            Screenshot paths keyed by viewport, by sample index and by URL pattern
+        """
+        captured = {}
+        stats = self._new_worker_stats(0)
+        
+        for url_info in urls:
+            variants = self._capture_url(self.driver, url_info)
+            if variants:
+                captured.setdefault(url_info['pattern'], {})[url_info.get('sample') or 0] = variants
+                stats['captured'] += 1
+            else:
+                stats['failed'] += 1
                 
+        stats['elapsed'] = time.monotonic() - stats['started']
+        self.worker_stats.append(stats)
+        return captured
+        
+    def _capture_parallel(
+        self,
+        urls: List[Dict[str, str]],
+        cookies: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Dict[int, Dict[str, str]]]:
+        """
+        Capture screenshots with a pool of WebDriver workers.
+        
+        Args:
+            urls: URL dictionaries to capture
+            cookies: Session cookies of the authenticated primary driver (optional)
+            
+        Returns:
+            Screenshot paths keyed by viewport, by sample index and by URL pattern
+        """
+        captured = {}
+        lock = threading.Lock()
+        work = queue.Queue()
+        for url_info in urls:
+            work.put(url_info)
+            
+        def run_worker(worker_id: int) -> None:
+            stats = self._new_worker_stats(worker_id)
+            driver = self.driver if worker_id == 0 else None
             try:
-                full_url = f"{self.base_url}{url_pattern}"
-                self.driver.get(full_url)
-                
-                # Wait for page load
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                )
-                
-                # Take screenshot
-                screenshot_path = os.path.join(self.output_dir, f"{url_name}.png")
-                self.driver.save_screenshot(screenshot_path)
-                screenshots[url_pattern] = screenshot_path
-                
-            except (TimeoutException, WebDriverException) as e:
-                print(f"Failed to capture screenshot for {url_pattern}: {str(e)}")
-                continue
+                if driver is None:
+                    with self.profiler.span('driver.start', worker=worker_id):
+                        driver = self._create_driver()
+                        if cookies:
+                            self._apply_cookies(driver, cookies)
+                while True:
+                    try:
+                        url_info = work.get_nowait()
+                    except queue.Empty:
+                        break
+                    variants = self._capture_url(driver, url_info)
+                    if variants:
+                        with lock:
+                            captured.setdefault(url_info['pattern'], {})[url_info.get('sample') or 0] = variants
+                        stats['captured'] += 1
+                    else:
+                        stats['failed'] += 1
+            except Exception as e:
+                # Leave the remaining queue to the other workers
+                print(f"Worker {worker_id} stopped: {str(e)}")
+            finally:
+                if driver is not None and driver is not self.driver:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                stats['elapsed'] = time.monotonic() - stats['started']
+                with lock:
+                    self.worker_stats.append(stats)
+                    
+        threads = [
+            threading.Thread(target=run_worker, args=(worker_id,), daemon=True)
+            for worker_id in range(min(self.workers, len(urls)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        self.worker_stats.sort(key=lambda stats: stats['worker'])
+        return captured
+        
+    def _merge_samples(self, captured: Dict[str, Dict[int, Dict[str, str]]]) -> Dict[str, str]:
+        """
+        Collect the screenshots of each URL pattern into ``self.variants``.
+        
+        The first captured sample of a pattern provides its screenshot and
+        viewport variants; further samples of a parameterized pattern are
+        added as variants named after their sample, e.g. 'sample 2' or
+        'phone (sample 2)', in sample order whichever worker captured them.
+        
+        Returns:
+            Dict mapping URL patterns to screenshot file paths at the primary viewport
+        """
+        screenshots = {}
+        for pattern, samples in captured.items():
+            first, *others = sorted(samples)
+            variants = dict(samples[first])
+            for index in others:
+                for viewport, path in samples[index].items():
+                    name = f"sample {index + 1}"
+                    if viewport != self.primary_viewport:
+                        name = f"{viewport} ({name})"
+                    variants[name] = path
+            screenshots[pattern] = variants[self.primary_viewport]
+            self.variants[pattern] = variants
+        return screenshots
+        
+    def _capture_url(self, driver: webdriver.Chrome, url_info: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Load a single URL and save a screenshot at each viewport.
+        
+        The page is loaded once at the primary viewport; for every further
+        viewport the window is resized and the page given time to reflow
+        before it is captured again.
+        
+        Returns:
+            Screenshot paths keyed by viewport name, or None if the capture failed
+        """
+        url_path = url_info.get('path', url_info['pattern'])
+        with self.profiler.span(url_info['pattern'], Profiler.URL_CATEGORY, path=url_path) as span:
+            variants = self._capture_page(driver, url_info, span)
+            span['failed'] = variants is None
+        return variants
+        
+    def _capture_page(
+        self,
+        driver: webdriver.Chrome,
+        url_info: Dict[str, str],
+        span: Dict[str, Any],
+    ) -> Optional[Dict[str, str]]:
+        """
+        Capture one page; see _capture_url().
+        
+        Args:
+            driver: WebDriver to capture with
+            url_info: URL dictionary to capture
+            span: Profiling details of the capture, updated with whether it
+                was served from the cache and how long readiness took
+        """
+        url_pattern = url_info['pattern']
+        url_path = url_info.get('path', url_pattern)
+        url_name = (url_info['name'] or url_path.replace('/', '_').strip('_')).replace(':', '-')
+        span['cached'] = False
+        
+        full_url = f"{self.base_url}{url_path}"
+        fingerprint = None
+        if self.cache:
+            fingerprint = self._fingerprint(full_url)
+            if fingerprint:
+                # Captures at a different set of viewports are not reusable
+                fingerprint = hashlib.sha256(
+                    f"{fingerprint}:{sorted(self.viewports.items())}".encode()
+                ).hexdigest()
+            if fingerprint and not self.force_recapture:
+                cached_path = self.cache.lookup(full_url, fingerprint)
+                if cached_path:
+                    variants = self.cache.variants(full_url) or {self.primary_viewport: cached_path}
+                    if all(viewport in variants for viewport in self.viewports):
+                        span['cached'] = True
+                        return variants
+                    
+        try:
+            if len(self.viewports) > 1:
+                # Undo the resizes of the previous page before loading this one
+                driver.set_window_size(*self.viewports[self.primary_viewport])
+            started = time.monotonic()
+            driver.get(full_url)
+            
+            # Wait until the page is ready to capture
+            span['ready'] = round(self.readiness.wait(driver, url_pattern, started, url_path), 3)
+            
+            variants = {}
+            for viewport, size in self.viewports.items():
+                if viewport == self.primary_viewport:
+                    filename = f"{url_name}.png"
+                else:
+                    filename = f"{url_name}@{viewport}.png"
+                    driver.set_window_size(*size)
+                    self._wait_for_reflow(driver, url_pattern)
+                screenshot_path = os.path.join(self.output_dir, filename)
+                driver.save_screenshot(screenshot_path)
+                variants[viewport] = screenshot_path
                 
+            if fingerprint:
+                self.cache.store(full_url, fingerprint, variants[self.primary_viewport], variants)
+            return variants
+            
+        except (TimeoutException, WebDriverException) as e:
+            print(f"Failed to capture screenshot for {url_pattern}: {str(e)}")
+            return None
+            
+    def _postprocess(self, screenshots: Dict[str, str]) -> Dict[str, str]:
+        """
+        Run the postprocessor over every captured screenshot and follow its renames.
+        
+        Returns:
+            The screenshots mapping with deduplicated paths
+        """
+        paths = {path for variants in self.variants.values() for path in variants.values()}
+        path_map = self.postprocessor.process(paths)
+        if self.cache:
+            self.cache.remap_paths(path_map)
+        self.variants = {
+            pattern: {viewport: path_map.get(path, path) for viewport, path in variants.items()}
+            for pattern, variants in self.variants.items()
+        }
+        screenshots = {pattern: path_map.get(path, path) for pattern, path in screenshots.items()}
+        self.thumbnails = {
+            pattern: self.postprocessor.thumbnails[path]
+            for pattern, path in screenshots.items()
+            if path in self.postprocessor.thumbnails
+        }
+        
+        stats = self.postprocessor.stats
+        saved = stats['bytes_before'] - stats['bytes_after']
+        print(
+            f"Screenshot processing: {stats['processed']} processed, "
+            f"{stats['duplicates']} duplicates collapsed, {saved / 1048576:.1f} MB saved by recompression"
+        )
         return screenshots
         
-    def __del__(self):
-        """Clean up WebDriver when done."""
+    def _wait_for_reflow(self, driver: webdriver.Chrome, url_pattern: str) -> None:
+        """
+        Wait for the page to lay itself out again after a window resize.
+        
+        Waits for two animation frames, then re-applies the page's readiness
+        strategy so that content loaded in response to the resize (responsive
+        images, media queries) has settled too.
+        """
+        driver.execute_async_script(_REFLOW_SCRIPT)
+        self.readiness.strategy_for(url_pattern).wait(driver)
+            
+    def _fingerprint(self, url: str) -> Optional[str]:
+        """
+        Fingerprint the page served at a URL without rendering it.
+        
+        The page is fetched over plain HTTP with the session cookies of the
+        capture, so it is the page the authenticated drivers see.
+        
+        Returns:
+            Page fingerprint, or None if the page could not be fetched
+        """
+        try:
+            status, headers, body = fetch(url, cookies=self.cookies)
+        except (urllib.error.URLError, OSError):
+            return None
+        return ScreenshotCache.fingerprint(status, headers, body)
+            
+    @staticmethod
+    def _new_worker_stats(worker_id: int) -> Dict[str, Any]:
+        """Create an empty throughput record for a worker."""
+        return {
+            'worker': worker_id,
+            'captured': 0,
+            'failed': 0,
+            'started': time.monotonic(),
+            'elapsed': 0.0,
+        }
+        
+    def _report_worker_stats(self) -> None:
+        """Print per-worker throughput."""
+        for stats in self.worker_stats:
+            elapsed = stats['elapsed']
+            rate = stats['captured'] / elapsed if elapsed > 0 else 0.0
+            print(
+                f"Worker {stats['worker']}: {stats['captured']} captured, "
+                f"{stats['failed']} failed in {elapsed:.1f}s ({rate:.2f} pages/s)"
+            )
+        ready_times = self.readiness.ready_times
+        if ready_times:
+            average = sum(ready_times.values()) / len(ready_times)
+            slowest = max(ready_times, key=ready_times.get)
+            print(
+                f"Page readiness over {len(ready_times)} pages: {average:.2f}s average, "
+                f"slowest {slowest} ({ready_times[slowest]:.2f}s)"
+            )
+        
+    def capture(self, urls: List[Dict[str, str]]) -> Dict[str, str]:
+        """Capture screenshots; see capture_screenshots()."""
+        return self.capture_screenshots(urls)
+        
+    def close(self) -> None:
+        """Quit the WebDriver."""
         if self.driver:
             try:
                 self.driver.quit()
             except Exception:
-                pass 
\ No newline at end of file
+                pass
+            self.driver = None
+            
+    def __del__(self):
+        """Clean up WebDriver when done."""
+        self.close() 
\ No newline at end of file
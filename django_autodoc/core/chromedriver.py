@@ -0,0 +1,64 @@
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+# Environment variable naming a chromedriver binary to use as is
+CHROMEDRIVER_ENV = 'CHROMEDRIVER'
+
+_resolved: Dict[Optional[str], str] = {}
+_lock = threading.Lock()
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+def resolve_chromedriver(cache_file: Optional[str] = None, refresh: bool = False) -> str:
+    """
+    Return the path of the chromedriver binary to start Chrome with.
+
+    ``ChromeDriverManager().install()`` looks up the latest driver release
+    over the network on every call, so its result is remembered for the
+    process and, with a cache file, across runs for as long as the binary
+    exists. $CHROMEDRIVER, if set, is used without any lookup.
+
+    Args:
+        cache_file: JSON file to remember the resolved path in (optional)
+        refresh: Resolve again with webdriver_manager, e.g. after the cached
+            driver failed to start the installed Chrome
+
+    Returns:
+        Path of the chromedriver binary
+    """
+    override = os.environ.get(CHROMEDRIVER_ENV)
+    if override:
+        return override
+
+    with _lock:
+        if not refresh:
+            path = _resolved.get(cache_file)
+            if _is_executable(path):
+                return path
+            if cache_file:
+                try:
+                    with open(cache_file) as f:
+                        path = json.load(f).get('path')
+                except (OSError, ValueError, AttributeError):
+                    path = None
+                if _is_executable(path):
+                    _resolved[cache_file] = path
+                    return path
+
+        # Imported here, since it is only needed when no driver is cached
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        _resolved[cache_file] = path
+        if cache_file:
+            try:
+                os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+                tmp_path = f"{cache_file}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump({'path': path}, f)
+                os.replace(tmp_path, cache_file)
+            except OSError:
+                pass
+        return path
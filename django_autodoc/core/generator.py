@@ -1,150 +1,483 @@
+import hashlib
+import html
 import os
-from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-import markdown
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from .manifest import BuildManifest
+from .schema import ProjectInfo
+from .search_index import SEARCH_SCRIPT, SearchIndex
+from ..utils.profiling import Profiler
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# One Jinja2 environment per process, keyed by bytecode cache directory.
+_environments: Dict[Optional[str], Environment] = {}
+
+# Markdown converter reused (via reset()) for every page converted in this process.
+_markdown_converter: Optional['markdown.Markdown'] = None
+
+# Relative links to other pages of the documentation, e.g. 'models/blog.md#post'
+_PAGE_LINK_RE = re.compile(r'href="(?![a-zA-Z][a-zA-Z0-9+.-]*:|/)([^"#?]*)\.md([#?][^"]*)?"')
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: system-ui, -apple-system, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 2rem; }}
+        img {{ max-width: 100%; height: auto; }}
+        code {{ background: #f4f4f4; padding: 0.2em 0.4em; border-radius: 3px; }}
+        pre {{ background: #f4f4f4; padding: 1em; overflow-x: auto; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f4f4f4; }}
+        .search {{ position: relative; margin-bottom: 1rem; }}
+        .search input {{ width: 100%; padding: 0.4em; box-sizing: border-box; }}
+        .search ul {{ position: absolute; z-index: 1; width: 100%; max-height: 60vh; overflow-y: auto; margin: 0; padding: 0; list-style: none; background: #fff; box-shadow: 0 2px 6px rgba(0, 0, 0, 0.2); }}
+        .search li {{ padding: 0.3em 0.6em; }}
+        .search ul:empty {{ display: none; }}
+    </style>
+</head>
+<body>
+    <form class="search" role="search" onsubmit="return false">
+        <input type="search" id="autodoc-search" placeholder="Search models, fields, URLs and views" autocomplete="off" data-root="{root}">
+        <ul id="autodoc-results"></ul>
+    </form>
+    {body}
+    <script src="{root}search.js" defer></script>
+</body>
+</html>
+"""
+
+def _get_environment(cache_dir: Optional[str] = None) -> Environment:
+    """
+    Return the Jinja2 environment for this process.
+    
+    Args:
+        cache_dir: Directory for the persistent bytecode cache (optional)
+    """
+    env = _environments.get(cache_dir)
+    if env is None:
+        bytecode_cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        env = _environments[cache_dir] = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            autoescape=select_autoescape(['html', 'xml']),
+            bytecode_cache=bytecode_cache,
+        )
+    return env
+
+def markdown_to_html(content: str, title: str, root: str = '') -> str:
+    """
+    Convert a Markdown page to a standalone HTML page in memory.
+    
+    Relative links to '.md' pages are rewritten to the '.html' pages
+    written alongside.
+    
+    Args:
+        content: Markdown source
+        title: Page title
+        root: Relative path from the page to the output directory, for the
+            search script and index
+        
+    Returns:
+        Complete HTML document
+    """
+    global _markdown_converter
+    if _markdown_converter is None:
+        # Only HTML output needs Markdown, so it is imported on first use
+        import markdown
+        _markdown_converter = markdown.Markdown(extensions=['tables', 'fenced_code', 'toc'])
+    body = _markdown_converter.reset().convert(content)
+    # Pages link to each other by their Markdown names; point them at the HTML pages
+    body = _PAGE_LINK_RE.sub(lambda match: f'href="{match.group(1)}.html{match.group(2) or ""}"', body)
+    return HTML_TEMPLATE.format(title=title, body=body, root=root)
+
+def _converted_headings() -> List[Tuple[int, str, str]]:
+    """
+    List the headings of the page markdown_to_html() converted last.
+    
+    Returns:
+        (level, anchor id, text) tuples in document order
+    """
+    headings = []
+    pending = list(reversed(_markdown_converter.toc_tokens)) if _markdown_converter else []
+    while pending:
+        token = pending.pop()
+        headings.append((token['level'], token['id'], html.unescape(token['name'])))
+        pending.extend(reversed(token['children']))
+    return headings
+
+def _render_page(
+    template_name: str,
+    context: Dict[str, Any],
+    output_path: str,
+    cache_dir: Optional[str] = None,
+    html_title: Optional[str] = None,
+    html_root: str = '',
+) -> Tuple[float, str, int, List[Tuple[str, str, float, float, int]], List[Tuple[int, str, str]]]:
+    """
+    Render a page template to a temporary file; runs in the generator's
+    worker processes.
+    
+    Markdown output is streamed to ``output_path + '.tmp'`` as it renders and
+    hashed on the way, so the caller can decide whether to keep it. Timings
+    are returned as spans for the parent process to record, since a worker
+    has no profiler of its own.
+    
+    Args:
+        template_name: Markdown template to render
+        context: Template context
+        output_path: Final path of the page
+        cache_dir: Jinja2 bytecode cache directory (optional)
+        html_title: When given, the page is converted to HTML with this title
+        html_root: Relative path from the page to the output directory
+        
+    Returns:
+        Tuple of (render time in seconds, content hash, size in bytes, spans,
+        headings), where spans are (name, category, start, duration, pid)
+        tuples and headings are the (level, anchor id, text) of HTML pages
+    """
+    started = time.perf_counter()
+    spans = []
+    headings = []
+    template = _get_environment(cache_dir).get_template(template_name)
+    if html_title is None:
+        chunks = template.generate(**context)
+    else:
+        content = template.render(**context)
+        converting = time.perf_counter()
+        chunks = [markdown_to_html(content, html_title, html_root)]
+        headings = _converted_headings()
+        spans.append(('markdown_to_html', 'render', converting, time.perf_counter() - converting, os.getpid()))
+        
+    digest = hashlib.sha256()
+    size = 0
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(f"{output_path}.tmp", 'wb') as f:
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+            f.write(data)
+    elapsed = time.perf_counter() - started
+    spans.insert(0, ('render', 'render', started, elapsed, os.getpid()))
+    return elapsed, digest.hexdigest(), size, spans, headings
+
+def _templates_digest(include_search: bool = False) -> str:
+    """
+    Fingerprint the bundled templates and the HTML page wrapper.
+    
+    Args:
+        include_search: Also fingerprint the search script, which only
+            HTML output ships
+    """
+    digest = hashlib.sha256(HTML_TEMPLATE.encode())
+    paths = [os.path.join(TEMPLATES_DIR, filename) for filename in sorted(os.listdir(TEMPLATES_DIR))]
+    if include_search:
+        paths.append(SEARCH_SCRIPT)
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
 
 class DocumentationGenerator:
     """Generates documentation from project analysis and screenshots."""
     
+    SHARD_MODES = ('none', 'app', 'model')
+    
     def __init__(
         self,
         output_dir: str,
-        project_info: Dict[str, Any],
+        project_info: Union[ProjectInfo, Dict[str, Any]],
         screenshots: Optional[Dict[str, str]] = None,
-        format: str = 'md'
+        format: str = 'md',
+        cache_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+        shard: str = 'none',
+        pages: Optional[Dict[str, Dict[str, Any]]] = None,
+        screenshot_variants: Optional[Dict[str, Dict[str, str]]] = None,
+        thumbnails: Optional[Dict[str, str]] = None,
+        profiler: Optional[Profiler] = None,
+        apps: Optional[Iterable[str]] = None,
     ):
         """
         Initialize the documentation generator.
         
         Args:
             output_dir: Directory to save documentation
-            project_info: Project information from ProjectAnalyzer
+            project_info: Project information from ProjectAnalyzer, as
+                returned by analyze() or in its typed ProjectInfo form
             screenshots: Screenshot paths from ScreenshotCapturer (optional)
             format: Output format ('md' or 'html')
+            cache_dir: Directory for the Jinja2 bytecode cache (optional)
+            workers: Number of processes rendering pages concurrently;
+                1 renders in-process (defaults to the CPU count)
+            shard: Split the models reference and admin guide into one page
+                per 'app' or per 'model' ('none' keeps single pages)
+            pages: Page data from HTTPSnapshotBackend, keyed by URL pattern (optional)
+            screenshot_variants: Screenshot paths per viewport name, keyed by
+                URL pattern, from ScreenshotCapturer.variants (optional)
+            thumbnails: Thumbnail paths keyed by URL pattern; screenshots with
+                a thumbnail are shown as a thumbnail linking to the full image (optional)
+            profiler: Profiler to record page render and Markdown conversion
+                times with (optional)
+            apps: Labels of the apps whose pages may have changed; shard
+                pages of the other apps are kept from the previous build
+                without comparing their inputs (optional; all apps by default)
         """
+        if shard not in self.SHARD_MODES:
+            raise ValueError(f"Unknown shard mode: {shard}")
+            
         self.output_dir = output_dir
-        self.project_info = project_info
+        self.project_info = ProjectInfo.from_dict(project_info)
         self.screenshots = screenshots or {}
+        self.pages = pages or {}
+        self.screenshot_variants = screenshot_variants or {}
+        self.thumbnails = thumbnails or {}
+        self.profiler = profiler or Profiler(enabled=False)
         self.format = format.lower()
+        self.cache_dir = os.path.join(cache_dir, 'jinja') if cache_dir else None
+        self.workers = workers
+        self.shard = shard
+        self.apps = None if apps is None else set(apps)
+        self.timings: Dict[str, float] = {}
+        self.stats = {'written': 0, 'skipped': 0, 'deleted': 0}
         
         # Set up Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        self.env = _get_environment(self.cache_dir)
         
     def generate(self) -> None:
-        """Generate complete documentation."""
+        """
+        Generate complete documentation.
+        
+        Pages whose rendering inputs or rendered content did not change since
+        the previous build are not rewritten, and files from previous builds
+        that are no longer produced are removed. Counts are left in
+        ``self.stats``. HTML output also gets a sharded search index, built
+        up as each page finishes rendering.
+        """
         os.makedirs(self.output_dir, exist_ok=True)
+        self.timings = {}
+        manifest = BuildManifest(self.output_dir)
+        templates_digest = _templates_digest(include_search=self.format == 'html')
         
-        # Generate main sections
-        self._generate_index()
-        self._generate_models_reference()
-        self._generate_views_reference()
-        self._generate_user_guide()
-        self._generate_admin_guide()
+        # With HTML output, pages are indexed for search as they finish
+        search_index = SearchIndex() if self.format == 'html' else None
         
-        # Convert to HTML if needed
-        if self.format == 'html':
-            self._convert_markdown_to_html()
-    
-    def _generate_index(self) -> None:
-        """Generate main index/overview page."""
-        template = self.env.get_template('index.md.j2')
-        content = template.render(
-            apps=self.project_info['apps'],
-            models_count=len(self.project_info['models']),
-            urls_count=len(self.project_info['urls']),
-        )
+        jobs = []
+        for section, filename, template_name, context in self._pages():
+            relpath, html_title = self._page_target(filename)
+            if self._unaffected_shard(template_name, context) and manifest.keep(relpath):
+                current = True
+            else:
+                inputs_key = BuildManifest.inputs_key(templates_digest, template_name, html_title, context)
+                current = manifest.is_current(relpath, inputs_key)
+            if current:
+                self._record_timing(section, 0.0)
+                if search_index is not None:
+                    self._index_page(search_index, section, relpath, html_title, context, manifest.headings(relpath))
+                continue
+            html_root = '../' * relpath.count('/')
+            args = (template_name, context, os.path.join(self.output_dir, relpath), self.cache_dir, html_title, html_root)
+            jobs.append((section, relpath, inputs_key, args))
         
-        with open(os.path.join(self.output_dir, 'index.md'), 'w') as f:
-            f.write(content)
-    
-    def _generate_models_reference(self) -> None:
-        """Generate models reference documentation."""
-        template = self.env.get_template('models.md.j2')
-        content = template.render(models=self.project_info['models'])
+        def finish(section: str, relpath: str, inputs_key: str, args: Tuple[Any, ...], result: Tuple[Any, ...]) -> None:
+            elapsed, digest, size, spans, headings = result
+            for name, category, started, duration, pid in spans:
+                self.profiler.record(name, category, started, duration, pid=pid, tid=pid, page=relpath)
+            tmp_path = os.path.join(self.output_dir, relpath) + '.tmp'
+            manifest.commit(relpath, tmp_path, digest, size, inputs_key, headings)
+            if search_index is not None:
+                _, context, _, _, html_title, _ = args
+                with self.profiler.span('search_index', category='search', page=relpath):
+                    self._index_page(search_index, section, relpath, html_title, context, headings)
+            self._record_timing(section, elapsed)
         
-        with open(os.path.join(self.output_dir, 'models.md'), 'w') as f:
-            f.write(content)
+        # Render pages concurrently; each worker writes its own page, and with
+        # --format html converts it without a Markdown file round-trip
+        if self.workers == 1 or len(jobs) <= 1:
+            for section, relpath, inputs_key, args in jobs:
+                finish(section, relpath, inputs_key, args, _render_page(*args))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(_render_page, *args): (section, relpath, inputs_key, args)
+                    for section, relpath, inputs_key, args in jobs
+                }
+                for future in as_completed(futures):
+                    finish(*futures[future], future.result())
+                    
+        if search_index is not None:
+            with self.profiler.span('search_index.write', category='search'):
+                search_index.write(self.output_dir, manifest.commit)
+        manifest.finalize()
+        self.stats = manifest.stats
     
-    def _generate_views_reference(self) -> None:
-        """Generate views reference documentation."""
-        template = self.env.get_template('views.md.j2')
-        content = template.render(
-            urls=self.project_info['urls'],
-            views=self.project_info['views'],
-            screenshots=self.screenshots
-        )
+    def _index_page(
+        self,
+        search_index: SearchIndex,
+        section: str,
+        relpath: str,
+        page_title: str,
+        context: Dict[str, Any],
+        headings: List[Tuple[int, str, str]],
+    ) -> None:
+        """
+        Add a rendered page to the search index.
         
-        with open(os.path.join(self.output_dir, 'views.md'), 'w') as f:
-            f.write(content)
-    
-    def _generate_user_guide(self) -> None:
-        """Generate user-focused documentation."""
-        template = self.env.get_template('user_guide.md.j2')
-        content = template.render(
-            urls=self.project_info['urls'],
-            screenshots=self.screenshots
-        )
+        Headings link to their anchors. On model reference pages, headings
+        of models are indexed as models with their fields; on the views
+        reference, headings of URL patterns are indexed with the pattern,
+        name and view.
+        """
+        models = context.get('models', {}) if section == 'models' else {}
+        urls = {}
+        if section == 'views':
+            urls = {url['name'] or url['pattern']: url for url in context['urls']}
+        views = context.get('views', {})
+        page_title = next((text for level, _, text in headings if level == 1), page_title)
+        
+        entries = []
+        found = set()
+        for level, anchor, text in headings:
+            target = f"{relpath}#{anchor}"
+            if text in models and text not in found:
+                found.add(text)
+                entries.extend(self._model_entries(text, models[text], target))
+            elif text in urls and text not in found:
+                found.add(text)
+                entries.append(self._url_entry(urls[text], views.get(urls[text]['pattern']), target))
+            else:
+                entries.append((text, target, 'page' if level == 1 else 'heading', ''))
+                
+        # Headings whose text the Markdown conversion changed still get an
+        # entry, linking to the page
+        for label, model_info in models.items():
+            if label not in found:
+                entries.extend(self._model_entries(label, model_info, relpath))
+        for key, url in urls.items():
+            if key not in found:
+                entries.append(self._url_entry(url, views.get(url['pattern']), relpath))
+        search_index.add_page(relpath, page_title, entries)
+        
+    @staticmethod
+    def _model_entries(label: str, model_info: Any, target: str) -> List[Tuple[str, str, str, str]]:
+        """Search entries of a model and its fields."""
+        meta = model_info['meta']
+        entries = [(label, target, 'model', f"{meta.get('verbose_name', '')} {meta.get('verbose_name_plural', '')}")]
+        for field in model_info['fields']:
+            entries.append((f"{label}.{field['name']}", target, 'field', field['type']))
+        return entries
         
-        with open(os.path.join(self.output_dir, 'user_guide.md'), 'w') as f:
-            f.write(content)
+    @staticmethod
+    def _url_entry(url: Any, view: Optional[Dict[str, Any]], target: str) -> Tuple[str, str, str, str]:
+        """Search entry of a URL pattern and the view serving it."""
+        text = [url['pattern'], url['name'] or '', url['view_class'] or '', url['view_name'] or '']
+        if view:
+            text += [view.get('view') or '', view.get('template') or '']
+        return (url['name'] or url['pattern'], target, 'url', ' '.join(text))
+        
+    def _page_target(self, filename: str) -> Tuple[str, Optional[str]]:
+        """Return the output path (relative to the output directory) and HTML title of a page."""
+        if self.format == 'html':
+            return filename[:-3] + '.html', os.path.basename(filename)[:-3].title()
+        return filename, None
     
-    def _generate_admin_guide(self) -> None:
-        """Generate admin documentation."""
-        template = self.env.get_template('admin_guide.md.j2')
-        content = template.render(
-            models=self.project_info['models'],
-            screenshots=self.screenshots
-        )
+    def _unaffected_shard(self, template_name: str, context: Dict[str, Any]) -> bool:
+        """Check whether a page is a shard holding only models of unaffected apps."""
+        if self.apps is None or template_name not in ('models_shard.md.j2', 'admin_shard.md.j2'):
+            return False
+        return all(label.split('.', 1)[0] not in self.apps for label in context['models'])
+    
+    def _record_timing(self, section: str, elapsed: float) -> None:
+        """Accumulate render time per section."""
+        self.timings[section] = self.timings.get(section, 0.0) + elapsed
+    
+    def _pages(self) -> Iterator[Tuple[str, str, str, Dict[str, Any]]]:
+        """
+        Describe every documentation page.
         
-        with open(os.path.join(self.output_dir, 'admin_guide.md'), 'w') as f:
-            f.write(content)
+        Yields:
+            Tuples of (section name, output filename, template name, context)
+        """
+        models = self.project_info['models']
+        model_shards = self._model_shards('models')
+        admin_shards = self._model_shards('admin')
+        
+        yield 'index', 'index.md', 'index.md.j2', {
+            'apps': self.project_info['apps'],
+            'models_count': len(models),
+            'urls_count': len(self.project_info['urls']),
+        }
+        yield 'models', 'models.md', 'models.md.j2', {
+            'models': {} if model_shards else models,
+            'shards': model_shards,
+        }
+        yield 'views', 'views.md', 'views.md.j2', {
+            'urls': self.project_info['urls'],
+            'views': self.project_info['views'],
+            'forms': self.project_info['forms'],
+            'screenshots': self.screenshots,
+            'variants': self.screenshot_variants,
+            'thumbnails': self.thumbnails,
+            'pages': self.pages,
+        }
+        yield 'user_guide', 'user_guide.md', 'user_guide.md.j2', {
+            'urls': self.project_info['urls'],
+            'views': self.project_info['views'],
+            'forms': self.project_info['forms'],
+            'screenshots': self.screenshots,
+            'variants': self.screenshot_variants,
+            'thumbnails': self.thumbnails,
+            'pages': self.pages,
+        }
+        yield 'admin_guide', 'admin_guide.md', 'admin_guide.md.j2', {
+            'models': {} if admin_shards else models,
+            'shards': admin_shards,
+            'screenshots': self.screenshots,
+        }
+        
+        for section, shards, template_name in (
+            ('models', model_shards, 'models_shard.md.j2'),
+            ('admin_guide', admin_shards, 'admin_shard.md.j2'),
+        ):
+            for shard in shards:
+                yield section, shard['path'], template_name, {
+                    'title': shard['title'],
+                    'models': {label: models[label] for label in shard['models']},
+                    'root': '../' * shard['path'].count('/'),
+                }
     
-    def _convert_markdown_to_html(self) -> None:
-        """Convert all Markdown files to HTML if format is html."""
-        if self.format != 'html':
-            return
+    def _model_shards(self, directory: str) -> List[Dict[str, Any]]:
+        """
+        Split the project's models into shard pages.
+        
+        Args:
+            directory: Output subdirectory for the shard pages
             
-        for filename in os.listdir(self.output_dir):
-            if filename.endswith('.md'):
-                md_path = os.path.join(self.output_dir, filename)
-                html_path = os.path.join(self.output_dir, filename[:-3] + '.html')
-                
-                with open(md_path, 'r') as md_file:
-                    md_content = md_file.read()
-                    html_content = markdown.markdown(
-                        md_content,
-                        extensions=['tables', 'fenced_code', 'toc']
-                    )
-                    
-                    # Add basic styling
-                    html_content = f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <meta charset="utf-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1">
-                        <title>{filename[:-3].title()}</title>
-                        <style>
-                            body {{ font-family: system-ui, -apple-system, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 2rem; }}
-                            img {{ max-width: 100%; height: auto; }}
-                            code {{ background: #f4f4f4; padding: 0.2em 0.4em; border-radius: 3px; }}
-                            pre {{ background: #f4f4f4; padding: 1em; overflow-x: auto; }}
-                            table {{ border-collapse: collapse; width: 100%; }}
-                            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                            th {{ background-color: #f4f4f4; }}
-                        </style>
-                    </head>
-                    <body>
-                        {html_content}
-                    </body>
-                    </html>
-                    """
-                    
-                    with open(html_path, 'w') as html_file:
-                        html_file.write(html_content)
-                        
-                # Remove markdown file
-                os.remove(md_path) 
\ No newline at end of file
+        Returns:
+            List of shards with 'title', 'path' and 'models' (model labels);
+            empty when sharding is disabled
+        """
+        if self.shard == 'none':
+            return []
+            
+        shards: Dict[str, Dict[str, Any]] = {}
+        for label in self.project_info['models']:
+            app_label, model_name = label.split('.', 1)
+            if self.shard == 'app':
+                key, path = app_label, f"{directory}/{app_label}.md"
+            else:
+                key, path = label, f"{directory}/{app_label}/{model_name}.md"
+            shards.setdefault(key, {'title': key, 'path': path, 'models': []})['models'].append(label)
+        return list(shards.values())
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional
+
+def _encode(value: Any) -> Any:
+    """Serialize analysis records by their content and anything else by str()."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+class BuildManifest:
+    """Tracks generated output files so unchanged pages are not rewritten."""
+    
+    FILENAME = '.autodoc-manifest.json'
+    VERSION = 3
+    
+    def __init__(self, output_dir: str):
+        """
+        Initialize the build manifest.
+        
+        Args:
+            output_dir: Documentation output directory the manifest lives in
+        """
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.previous: Dict[str, Dict[str, Any]] = {}
+        self.current: Dict[str, Dict[str, Any]] = {}
+        self.stats = {'written': 0, 'skipped': 0, 'deleted': 0}
+        self._load()
+        
+    def _load(self) -> None:
+        """Load the manifest of the previous build, ignoring unreadable files."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.previous = data.get('files', {})
+            
+    @staticmethod
+    def inputs_key(*parts: Any) -> str:
+        """
+        Digest everything a page is rendered from.
+        
+        Args:
+            parts: JSON-serializable inputs (template name, context, ...);
+                mappings such as analysis records are serialized by content
+            
+        Returns:
+            Hex digest of the inputs
+        """
+        payload = json.dumps(parts, sort_keys=True, default=_encode, separators=(',', ':'))
+        return hashlib.sha256(payload.encode()).hexdigest()
+        
+    def _exists(self, relpath: str, entry: Dict[str, Any]) -> bool:
+        """Check that a previously generated file is still on disk unchanged in size."""
+        try:
+            return os.path.getsize(os.path.join(self.output_dir, relpath)) == entry['size']
+        except OSError:
+            return False
+            
+    def is_current(self, relpath: str, inputs_key: str) -> bool:
+        """
+        Check whether a page can be reused without rendering it.
+        
+        A current page is recorded as skipped.
+        
+        Args:
+            relpath: Output path relative to the output directory
+            inputs_key: Digest of the page's current rendering inputs
+        """
+        entry = self.previous.get(relpath)
+        if entry and entry.get('inputs') == inputs_key and self._exists(relpath, entry):
+            self.current[relpath] = entry
+            self.stats['skipped'] += 1
+            return True
+        return False
+        
+    def keep(self, relpath: str) -> bool:
+        """
+        Reuse a page from the previous build without checking its inputs.
+        
+        For pages the caller knows are unaffected by a change. A kept page
+        is recorded as skipped.
+        
+        Args:
+            relpath: Output path relative to the output directory
+            
+        Returns:
+            bool: True if the page was kept, False if it has to be rendered
+        """
+        entry = self.previous.get(relpath)
+        if entry and self._exists(relpath, entry):
+            self.current[relpath] = entry
+            self.stats['skipped'] += 1
+            return True
+        return False
+        
+    def headings(self, relpath: str) -> List[Any]:
+        """Return the headings recorded for a current page."""
+        return (self.current.get(relpath) or {}).get('headings', [])
+        
+    def commit(
+        self,
+        relpath: str,
+        tmp_path: str,
+        digest: str,
+        size: int,
+        inputs_key: Optional[str] = None,
+        headings: Optional[List[Any]] = None,
+    ) -> bool:
+        """
+        Move a rendered page into place if its content changed.
+        
+        Args:
+            relpath: Output path relative to the output directory
+            tmp_path: Temporary file holding the rendered page
+            digest: Content hash of the rendered page
+            size: Size of the rendered page in bytes
+            inputs_key: Digest of the page's rendering inputs (optional)
+            headings: Headings of the page, kept so a skipped page can still
+                be indexed for search (optional)
+            
+        Returns:
+            bool: True if the file was written, False if it was unchanged
+        """
+        entry = self.previous.get(relpath)
+        self.current[relpath] = {'hash': digest, 'size': size, 'inputs': inputs_key}
+        if headings:
+            self.current[relpath]['headings'] = headings
+        if entry and entry.get('hash') == digest and self._exists(relpath, entry):
+            os.remove(tmp_path)
+            self.stats['skipped'] += 1
+            return False
+        os.replace(tmp_path, os.path.join(self.output_dir, relpath))
+        self.stats['written'] += 1
+        return True
+        
+    def finalize(self) -> None:
+        """Delete files left over from previous builds and save the manifest."""
+        for relpath in set(self.previous) - set(self.current):
+            path = os.path.join(self.output_dir, relpath)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.stats['deleted'] += 1
+            
+            # Remove directories emptied by the deletion, e.g. old shards
+            directory = os.path.dirname(path)
+            while os.path.abspath(directory) != os.path.abspath(self.output_dir):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+                directory = os.path.dirname(directory)
+                
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'files': self.current}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,329 @@
+import hashlib
+import importlib.util
+import json
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Chunks that, with the image data, determine how a PNG looks. Metadata such
+# as tEXt or tIME is left out of the pixel digest.
+_DIGESTED_CHUNKS = {b'IHDR', b'PLTE', b'tRNS'}
+
+def read_png_chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    """
+    Split PNG file contents into (chunk type, chunk data) pairs.
+
+    Raises:
+        ValueError: If the data is not a well-formed PNG file
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG file")
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + 8 > len(data):
+            raise ValueError("Truncated PNG chunk header")
+        length, chunk_type = struct.unpack('>I4s', data[offset:offset + 8])
+        chunk_data = data[offset + 8:offset + 8 + length]
+        if len(chunk_data) != length:
+            raise ValueError("Truncated PNG chunk")
+        chunks.append((chunk_type, chunk_data))
+        offset += 12 + length
+        if chunk_type == b'IEND':
+            break
+    return chunks
+
+def write_png_chunks(chunks: Iterable[Tuple[bytes, bytes]]) -> bytes:
+    """Assemble PNG file contents from (chunk type, chunk data) pairs."""
+    parts = [PNG_SIGNATURE]
+    for chunk_type, chunk_data in chunks:
+        parts.append(struct.pack('>I4s', len(chunk_data), chunk_type))
+        parts.append(chunk_data)
+        parts.append(struct.pack('>I', zlib.crc32(chunk_type + chunk_data)))
+    return b''.join(parts)
+
+def optimize_png(data: bytes, level: int = 9) -> Tuple[str, bytes]:
+    """
+    Fingerprint a PNG by its pixels and recompress it losslessly.
+
+    The digest covers the header and the decompressed image data, so two
+    screenshots with identical pixels match even when their zlib streams
+    differ. The image data is recompressed into a single IDAT chunk at the
+    given level; ancillary chunks are kept as they are.
+
+    Args:
+        data: PNG file contents
+        level: zlib compression level
+
+    Returns:
+        Tuple of (pixel digest, recompressed PNG contents)
+
+    Raises:
+        ValueError: If the data is not a well-formed PNG file
+    """
+    chunks = read_png_chunks(data)
+    try:
+        pixels = zlib.decompress(b''.join(chunk_data for chunk_type, chunk_data in chunks if chunk_type == b'IDAT'))
+    except zlib.error as e:
+        raise ValueError(f"Corrupt PNG image data: {e}")
+
+    digest = hashlib.sha256()
+    for chunk_type, chunk_data in chunks:
+        if chunk_type in _DIGESTED_CHUNKS:
+            digest.update(chunk_type + chunk_data)
+    digest.update(pixels)
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS, 9)
+    idat = compressor.compress(pixels) + compressor.flush()
+    optimized = []
+    for chunk_type, chunk_data in chunks:
+        if chunk_type != b'IDAT':
+            optimized.append((chunk_type, chunk_data))
+        elif idat is not None:
+            optimized.append((b'IDAT', idat))
+            idat = None
+    return digest.hexdigest(), write_png_chunks(optimized)
+
+def _optimize_file(path: str, recompress: bool) -> Dict[str, Any]:
+    """
+    Digest a screenshot and, if that makes it smaller, rewrite it recompressed.
+
+    Files that cannot be parsed as PNG are digested byte for byte and left
+    untouched. Runs in a worker process.
+
+    Returns:
+        Dict with the pixel 'digest', the 'before' and 'after' sizes, and
+        the file's 'mtime_ns' once processed
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        digest, optimized = optimize_png(data)
+    except ValueError:
+        digest, optimized = hashlib.sha256(data).hexdigest(), data
+    size = len(data)
+    if recompress and len(optimized) < size:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(optimized)
+        os.replace(tmp_path, path)
+        size = len(optimized)
+    return {
+        'digest': digest,
+        'before': len(data),
+        'after': size,
+        'mtime_ns': os.stat(path).st_mtime_ns,
+    }
+
+def _make_thumbnail(path: str, thumbnail_path: str, width: int) -> str:
+    """
+    Write a downscaled copy of a screenshot with Pillow.
+
+    Runs in a worker process.
+
+    Returns:
+        Path of the thumbnail
+    """
+    from PIL import Image
+
+    with Image.open(path) as image:
+        if image.width > width:
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+        image.save(f"{thumbnail_path}.tmp", format='PNG', optimize=True)
+    os.replace(f"{thumbnail_path}.tmp", thumbnail_path)
+    return thumbnail_path
+
+class ScreenshotProcessor:
+    """Deduplicates, recompresses and thumbnails captured screenshots."""
+
+    STATE_FILENAME = '.postprocess.json'
+    VERSION = 1
+    SHARED_DIR = '_shared'
+    THUMBNAILS_DIR = 'thumbnails'
+
+    def __init__(
+        self,
+        output_dir: str,
+        workers: Optional[int] = None,
+        recompress: bool = True,
+        thumbnail_width: Optional[int] = None,
+    ):
+        """
+        Initialize the screenshot processor.
+
+        Args:
+            output_dir: Screenshots directory
+            workers: Number of processes to process images with (defaults to the CPU count)
+            recompress: Recompress PNG image data losslessly at the highest zlib level
+            thumbnail_width: Also write thumbnails of this width, which needs
+                Pillow (optional)
+        """
+        self.output_dir = output_dir
+        self.workers = workers
+        self.recompress = recompress
+        self.thumbnail_width = thumbnail_width
+        self.state_path = os.path.join(output_dir, self.STATE_FILENAME)
+        self.state: Dict[str, Dict[str, Any]] = {}
+        self.thumbnails: Dict[str, str] = {}
+        self.stats = {'processed': 0, 'duplicates': 0, 'bytes_before': 0, 'bytes_after': 0}
+        self._load()
+
+    def _load(self) -> None:
+        """Load digests of already processed files, ignoring unreadable state."""
+        try:
+            with open(self.state_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.state = data.get('files', {})
+
+    def _save(self) -> None:
+        """Write the processing state atomically, forgetting files that no longer exist."""
+        self.state = {path: entry for path, entry in self.state.items() if os.path.exists(path)}
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'files': self.state}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _is_processed(self, path: str) -> bool:
+        """Check whether a file is unchanged since it was last processed."""
+        entry = self.state.get(path)
+        if not entry:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['after']
+
+    def process(self, paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Process screenshots.
+
+        Files are digested by their pixels and recompressed in a process pool;
+        files processed by an earlier run and unchanged since are not read
+        again. Screenshots with identical pixels are collapsed onto one file
+        in the shared subdirectory, named by its digest, and the duplicates
+        are deleted. Shared files are never overwritten by a later capture,
+        so references to them stay valid across runs.
+
+        Args:
+            paths: Screenshot paths to process
+
+        Returns:
+            Dict mapping each processed path to the path it should now be
+            referred to by (the path itself unless it was a duplicate)
+        """
+        paths = sorted({path for path in paths if os.path.exists(path)})
+        self.stats = {'processed': 0, 'duplicates': 0, 'bytes_before': 0, 'bytes_after': 0}
+        pending = [path for path in paths if not self._is_processed(path)]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(_optimize_file, pending, [self.recompress] * len(pending))
+            for path, result in zip(pending, results):
+                self.state[path] = result
+                self.stats['processed'] += 1
+                self.stats['bytes_before'] += result['before']
+                self.stats['bytes_after'] += result['after']
+
+            by_digest: Dict[str, List[str]] = {}
+            for path in paths:
+                by_digest.setdefault(self.state[path]['digest'], []).append(path)
+            path_map = {}
+            for digest, group in by_digest.items():
+                target = group[0]
+                if len(group) > 1:
+                    target = self._share(digest, group)
+                    self.stats['duplicates'] += len(group) - 1
+                for path in group:
+                    path_map[path] = target
+
+            if self.thumbnail_width:
+                self.thumbnails = self._make_thumbnails(executor, sorted(set(path_map.values())))
+
+        self._save()
+        return path_map
+
+    def _share(self, digest: str, group: List[str]) -> str:
+        """Move one of a group of identical screenshots to the shared directory and delete the rest."""
+        shared_dir = os.path.join(self.output_dir, self.SHARED_DIR)
+        shared_path = os.path.join(shared_dir, f"{digest[:32]}.png")
+        os.makedirs(shared_dir, exist_ok=True)
+        for path in group:
+            if path == shared_path:
+                continue
+            if os.path.exists(shared_path):
+                os.remove(path)
+            else:
+                os.replace(path, shared_path)
+                self.state[shared_path] = dict(self.state[path], mtime_ns=os.stat(shared_path).st_mtime_ns)
+            self.state.pop(path, None)
+        return shared_path
+
+    def _make_thumbnails(self, executor: ProcessPoolExecutor, paths: List[str]) -> Dict[str, str]:
+        """
+        Write thumbnails for screenshots that do not have an up-to-date one.
+
+        Returns:
+            Dict mapping screenshot paths to thumbnail paths
+        """
+        if importlib.util.find_spec('PIL') is None:
+            print("Warning: Pillow is not installed, thumbnails were not generated")
+            return {}
+        thumbnails_dir = os.path.join(self.output_dir, self.THUMBNAILS_DIR)
+        jobs = {}
+        thumbnails = {}
+        for path in paths:
+            thumbnail_path = os.path.join(thumbnails_dir, os.path.relpath(path, self.output_dir))
+            entry = self.state.get(path, {})
+            if entry.get('thumbnail') == [self.thumbnail_width, entry['mtime_ns']] and os.path.exists(thumbnail_path):
+                thumbnails[path] = thumbnail_path
+            else:
+                jobs[path] = executor.submit(_make_thumbnail, path, thumbnail_path, self.thumbnail_width)
+
+        for path, future in jobs.items():
+            thumbnails[path] = future.result()
+            self.state[path]['thumbnail'] = [self.thumbnail_width, self.state[path]['mtime_ns']]
+        return thumbnails
+
+    def prune(self, referenced: Iterable[str]) -> int:
+        """
+        Delete shared screenshots and thumbnails that nothing refers to any more.
+
+        Args:
+            referenced: Screenshot paths still in use, e.g. by the current
+                mapping and the screenshot cache
+
+        Returns:
+            Number of deleted files
+        """
+        referenced = set(referenced)
+        deleted = 0
+        shared_dir = os.path.join(self.output_dir, self.SHARED_DIR)
+        thumbnails_dir = os.path.join(self.output_dir, self.THUMBNAILS_DIR)
+        candidates = []
+        if os.path.isdir(shared_dir):
+            candidates += [(os.path.join(shared_dir, name), None) for name in os.listdir(shared_dir)]
+        for root, _, files in os.walk(thumbnails_dir):
+            for name in files:
+                thumbnail_path = os.path.join(root, name)
+                source = os.path.join(self.output_dir, os.path.relpath(thumbnail_path, thumbnails_dir))
+                candidates.append((thumbnail_path, source))
+        for path, source in candidates:
+            if (source or path) in referenced:
+                continue
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError:
+                pass
+            if source is None:
+                self.state.pop(path, None)
+        self._save()
+        return deleted
@@ -0,0 +1,202 @@
+import fnmatch
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+class ReadinessStrategy(ABC):
+    """Decides when a loaded page is ready to be captured."""
+
+    # Page load strategy the WebDriver should use with this readiness check;
+    # 'eager' returns from driver.get() at DOMContentLoaded.
+    page_load_strategy = 'eager'
+
+    # Whether a page that never becomes ready is still captured.
+    capture_on_timeout = False
+
+    def __init__(self, timeout: float = 10.0, poll_interval: float = 0.05):
+        """
+        Initialize the readiness strategy.
+
+        Args:
+            timeout: Maximum time to wait for the page, in seconds
+            poll_interval: Time between readiness checks, in seconds
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    @abstractmethod
+    def is_ready(self, driver) -> bool:
+        """Check whether the current page is ready."""
+
+    def wait(self, driver) -> bool:
+        """
+        Wait until the current page is ready.
+
+        Returns:
+            bool: True if the page became ready, False if it timed out but
+            should be captured anyway
+
+        Raises:
+            TimeoutException: If the page did not become ready in time
+        """
+        try:
+            WebDriverWait(driver, self.timeout, poll_frequency=self.poll_interval).until(self.is_ready)
+            return True
+        except TimeoutException:
+            if self.capture_on_timeout:
+                return False
+            raise
+
+class DocumentReadyStrategy(ReadinessStrategy):
+    """Waits for ``document.readyState == 'complete'``."""
+
+    page_load_strategy = 'normal'
+
+    def is_ready(self, driver) -> bool:
+        return driver.execute_script('return document.readyState') == 'complete'
+
+class NetworkIdleStrategy(ReadinessStrategy):
+    """
+    Waits until the page has loaded and no resource (XHR, fetch, images, ...)
+    has finished loading for ``idle_time`` seconds, according to the
+    Resource Timing performance entries.
+    """
+
+    capture_on_timeout = True
+
+    SCRIPT = """
+        if (document.readyState !== 'complete') { return -1; }
+        var last = 0;
+        var entries = performance.getEntriesByType('resource');
+        for (var i = 0; i < entries.length; i++) {
+            last = Math.max(last, entries[i].responseEnd);
+        }
+        var navigation = performance.getEntriesByType('navigation')[0];
+        if (navigation) { last = Math.max(last, navigation.loadEventEnd); }
+        return performance.now() - last;
+    """
+
+    def __init__(self, idle_time: float = 0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.idle_time = idle_time
+
+    def is_ready(self, driver) -> bool:
+        return driver.execute_script(self.SCRIPT) >= self.idle_time * 1000
+
+class DOMStableStrategy(ReadinessStrategy):
+    """
+    Waits until the DOM has not changed for ``stable_time`` seconds.
+
+    A MutationObserver installed on the first check records the time of the
+    last mutation on the page itself, so no state is kept between checks.
+    """
+
+    capture_on_timeout = True
+
+    SCRIPT = """
+        if (document.readyState === 'loading' || !document.body) { return -1; }
+        if (window.__autodocLastMutation === undefined) {
+            window.__autodocLastMutation = performance.now();
+            new MutationObserver(function () {
+                window.__autodocLastMutation = performance.now();
+            }).observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true, characterData: true
+            });
+            return 0;
+        }
+        return performance.now() - window.__autodocLastMutation;
+    """
+
+    def __init__(self, stable_time: float = 0.3, **kwargs):
+        super().__init__(**kwargs)
+        self.stable_time = stable_time
+
+    def is_ready(self, driver) -> bool:
+        return driver.execute_script(self.SCRIPT) >= self.stable_time * 1000
+
+class SelectorStrategy(ReadinessStrategy):
+    """Waits until an element matching a CSS selector is present."""
+
+    SCRIPT = "return document.querySelector(arguments[0]) !== null"
+
+    def __init__(self, selector: str, **kwargs):
+        super().__init__(**kwargs)
+        self.selector = selector
+
+    def is_ready(self, driver) -> bool:
+        return bool(driver.execute_script(self.SCRIPT, self.selector))
+
+STRATEGIES = {
+    'load': DocumentReadyStrategy,
+    'network-idle': NetworkIdleStrategy,
+    'dom-stable': DOMStableStrategy,
+}
+
+class ReadinessPolicy:
+    """Chooses the readiness strategy for each URL and records readiness times."""
+
+    def __init__(
+        self,
+        default: Optional[ReadinessStrategy] = None,
+        selectors: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the readiness policy.
+
+        Args:
+            default: Strategy for URLs without a configured selector
+                (defaults to DocumentReadyStrategy)
+            selectors: CSS selectors to wait for, keyed by URL pattern; keys
+                may use shell-style wildcards such as 'blog/*'
+        """
+        self.default = default or DocumentReadyStrategy()
+        self.selectors = {
+            pattern: SelectorStrategy(selector, timeout=self.default.timeout)
+            for pattern, selector in (selectors or {}).items()
+        }
+        # Seconds until each captured page was ready, keyed by the path
+        # visited, so samples of one pattern are recorded separately
+        self.ready_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def page_load_strategy(self) -> str:
+        """Page load strategy for drivers used with this policy."""
+        return self.default.page_load_strategy
+
+    def strategy_for(self, pattern: str) -> ReadinessStrategy:
+        """Return the strategy for a URL pattern."""
+        if pattern in self.selectors:
+            return self.selectors[pattern]
+        for selector_pattern, strategy in self.selectors.items():
+            if fnmatch.fnmatchcase(pattern, selector_pattern):
+                return strategy
+        return self.default
+
+    def wait(self, driver, pattern: str, started: float, path: Optional[str] = None) -> float:
+        """
+        Wait until the page for a URL pattern is ready and record how long it took.
+
+        Safe to call from several capture workers at once.
+
+        Args:
+            driver: WebDriver showing the page
+            pattern: URL pattern of the page
+            started: time.monotonic() value from before the page was requested
+            path: Concrete path visited, if it differs from the pattern (optional)
+
+        Returns:
+            Seconds until the page was ready
+
+        Raises:
+            TimeoutException: If the page did not become ready in time
+        """
+        if not self.strategy_for(pattern).wait(driver):
+            print(f"Page {path or pattern} did not settle in time, capturing anyway")
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self.ready_times[path or pattern] = elapsed
+        return elapsed
@@ -0,0 +1,362 @@
+import gzip
+import json
+import os
+import sys
+from collections.abc import Mapping
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Header of analysis dumps; bump the version when records change shape
+ANALYSIS_FORMAT = 'django-autodoc-analysis'
+ANALYSIS_VERSION = 1
+
+def _intern(value: Any) -> Any:
+    """Intern strings repeated across many records, such as field types."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def to_plain(value: Any) -> Any:
+    """Convert records nested in lists and dicts to plain JSON-serializable values."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+class Record(Mapping):
+    """
+    Base class of the typed analysis records.
+
+    Records keep their attributes in ``__slots__`` rather than a per-instance
+    dict, which makes them several times smaller than the dicts the analyzers
+    produce. They are also mappings of their attributes, so code and
+    templates written against those dicts work with either. The mapping is
+    read-only (there is no ``__setitem__``), but the attributes themselves
+    can be assigned, e.g. while records are being loaded.
+    """
+
+    __slots__ = ()
+
+    # Attributes left out of the mapping while they are None
+    OPTIONAL: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None and key in self.OPTIONAL:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__slots__:
+            if key not in self.OPTIONAL or getattr(self, key) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(f'{key}={value!r}' for key, value in self.items())})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record, and the records it contains, to plain dicts."""
+        return {key: to_plain(value) for key, value in self.items()}
+
+class FieldInfo(Record):
+    """A model field."""
+
+    __slots__ = ('name', 'type', 'required')
+
+    def __init__(self, name: str, type: str, required: bool = True):
+        self.name = name
+        self.type = _intern(type)
+        self.required = required
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FieldInfo':
+        return cls(data['name'], data['type'], data.get('required', True))
+
+class MethodInfo(Record):
+    """A public model method and the class defining it."""
+
+    __slots__ = ('name', 'defined_in')
+
+    def __init__(self, name: str, defined_in: str):
+        self.name = _intern(name)
+        self.defined_in = _intern(defined_in)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MethodInfo':
+        return cls(data['name'], data['defined_in'])
+
+class ModelMeta(Record):
+    """The Meta options of a model that are documented."""
+
+    __slots__ = ('verbose_name', 'verbose_name_plural', 'ordering')
+
+    def __init__(self, verbose_name: str = '', verbose_name_plural: str = '', ordering: Iterable[str] = ()):
+        self.verbose_name = verbose_name
+        self.verbose_name_plural = verbose_name_plural
+        self.ordering = list(ordering)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelMeta':
+        return cls(data.get('verbose_name', ''), data.get('verbose_name_plural', ''), data.get('ordering') or ())
+
+class ModelInfo(Record):
+    """A model's fields, methods and Meta options."""
+
+    __slots__ = ('fields', 'methods', 'meta')
+
+    def __init__(self, fields: List[FieldInfo], methods: List[MethodInfo], meta: ModelMeta):
+        self.fields = fields
+        self.methods = methods
+        self.meta = meta
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelInfo':
+        return cls(
+            [FieldInfo.from_dict(field) for field in data.get('fields') or ()],
+            [MethodInfo.from_dict(method) for method in data.get('methods') or ()],
+            ModelMeta.from_dict(data.get('meta') or {}),
+        )
+
+class AppInfo(Record):
+    """An installed app and the names of its models."""
+
+    __slots__ = ('name', 'label', 'path', 'models')
+
+    def __init__(self, name: str, label: str, path: Optional[str], models: List[str]):
+        self.name = name
+        self.label = label
+        self.path = path
+        self.models = models
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AppInfo':
+        return cls(data['name'], data['label'], data.get('path'), list(data.get('models') or ()))
+
+class URLInfo(Record):
+    """
+    A URL pattern and the view it routes to.
+
+    Capture targets sampled for parameterized patterns also carry the
+    concrete 'path' to visit and the index of the 'sample' it was filled from.
+    """
+
+    __slots__ = ('pattern', 'name', 'view_name', 'view_class', 'model', 'path', 'sample')
+    OPTIONAL = ('path', 'sample')
+
+    def __init__(
+        self,
+        pattern: str,
+        name: Optional[str] = None,
+        view_name: Optional[str] = None,
+        view_class: Optional[str] = None,
+        model: Optional[str] = None,
+        path: Optional[str] = None,
+        sample: Optional[int] = None,
+    ):
+        self.pattern = pattern
+        self.name = name
+        self.view_name = _intern(view_name)
+        self.view_class = _intern(view_class)
+        self.model = _intern(model)
+        self.path = path
+        self.sample = sample
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'URLInfo':
+        return cls(
+            data['pattern'], data.get('name'), data.get('view_name'),
+            data.get('view_class'), data.get('model'), data.get('path'), data.get('sample'),
+        )
+
+class ProjectInfo(Record):
+    """
+    Typed form of the project information returned by ProjectAnalyzer.analyze().
+
+    The views, forms and templates sections are kept as returned by the analyzer.
+    """
+
+    __slots__ = ('apps', 'models', 'urls', 'views', 'forms', 'templates')
+
+    def __init__(
+        self,
+        apps: Optional[List[AppInfo]] = None,
+        models: Optional[Dict[str, ModelInfo]] = None,
+        urls: Optional[List[URLInfo]] = None,
+        views: Optional[Dict[str, Any]] = None,
+        forms: Optional[Dict[str, Any]] = None,
+        templates: Optional[Dict[str, Any]] = None,
+    ):
+        self.apps = apps or []
+        self.models = models or {}
+        self.urls = urls or []
+        self.views = views or {}
+        self.forms = forms or {}
+        self.templates = templates or {}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'ProjectInfo':
+        """
+        Build the typed form of analyzer output.
+
+        Args:
+            data: Dict returned by ProjectAnalyzer.analyze() or
+                StaticProjectAnalyzer.analyze()
+        """
+        if isinstance(data, ProjectInfo):
+            return data
+        return cls(
+            [AppInfo.from_dict(app) for app in data.get('apps') or ()],
+            {label: ModelInfo.from_dict(model) for label, model in (data.get('models') or {}).items()},
+            [URLInfo.from_dict(url) for url in data.get('urls') or ()],
+            data.get('views'),
+            data.get('forms'),
+            data.get('templates'),
+        )
+
+def _open(path: str, mode: str, compressed: bool) -> IO[str]:
+    """Open a dump for text I/O."""
+    if compressed:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def iter_analysis_records(
+    project: ProjectInfo,
+    capture_urls: Optional[Iterable[Mapping]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Describe a project as a stream of self-contained records.
+
+    Args:
+        project: Project information
+        capture_urls: Capture targets; only those that are not project URL
+            patterns, such as sampled parameterized URLs, are written
+
+    Yields:
+        A header record, then one record per app, model, URL pattern,
+        extra capture target and untyped section
+    """
+    yield {'format': ANALYSIS_FORMAT, 'version': ANALYSIS_VERSION}
+    for app in project.apps:
+        yield dict(to_plain(app), kind='app')
+    for label, model in project.models.items():
+        yield dict(to_plain(model), kind='model', label=label)
+    for url in project.urls:
+        yield dict(to_plain(url), kind='url')
+    pattern_ids = {id(url) for url in project.urls}
+    for url in capture_urls or ():
+        if id(url) not in pattern_ids:
+            yield dict(to_plain(url), kind='capture')
+    for section in ('views', 'forms', 'templates'):
+        yield {'kind': 'section', 'name': section, 'data': to_plain(project[section])}
+
+def write_analysis(
+    path: str,
+    project: ProjectInfo,
+    capture_urls: Optional[Iterable[Mapping]] = None,
+) -> int:
+    """
+    Write project information as JSON lines, one record per line.
+
+    The file is replaced atomically, and gzip-compressed if its name ends in .gz.
+
+    Args:
+        path: File to write
+        project: Project information
+        capture_urls: Capture targets, including sampled parameterized URLs (optional)
+
+    Returns:
+        Number of records written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+    count = 0
+    with _open(tmp_path, 'w', path.endswith('.gz')) as f:
+        for record in iter_analysis_records(project, capture_urls):
+            f.write(json.dumps(record, separators=(',', ':')))
+            f.write('\n')
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+def load_analysis_records(
+    records: Iterable[Dict[str, Any]],
+    source: str = 'analysis',
+) -> Tuple[ProjectInfo, List[URLInfo]]:
+    """
+    Build project information from records produced by iter_analysis_records().
+
+    Records are consumed one at a time, so they can be decoded from a file
+    or received from another process as they arrive.
+
+    Args:
+        records: Header record followed by the project's records
+        source: Where the records come from, for error messages
+
+    Returns:
+        Tuple of (project information, capture targets); the capture
+        targets are the URL patterns followed by any extra targets
+
+    Raises:
+        ValueError: If the records are not an analysis of a supported version
+    """
+    records = iter(records)
+    header = next(records, None)
+    if not isinstance(header, dict) or header.get('format') != ANALYSIS_FORMAT:
+        raise ValueError(f"{source} is not a django-autodoc analysis dump")
+    if header.get('version') != ANALYSIS_VERSION:
+        raise ValueError(f"{source} has unsupported analysis format version {header.get('version')}")
+
+    project = ProjectInfo()
+    captures: List[URLInfo] = []
+    for number, record in enumerate(records, start=2):
+        try:
+            kind = record.pop('kind')
+            if kind == 'app':
+                project.apps.append(AppInfo.from_dict(record))
+            elif kind == 'model':
+                project.models[record.pop('label')] = ModelInfo.from_dict(record)
+            elif kind == 'url':
+                project.urls.append(URLInfo.from_dict(record))
+            elif kind == 'capture':
+                captures.append(URLInfo.from_dict(record))
+            elif kind == 'section' and record['name'] in ('views', 'forms', 'templates'):
+                setattr(project, record['name'], record['data'] or {})
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"{source}:{number}: invalid record: {e}")
+    return project, project.urls + captures
+
+def read_analysis(path: str) -> Tuple[ProjectInfo, List[URLInfo]]:
+    """
+    Read project information written by write_analysis().
+
+    Records are decoded one line at a time, so the plain form of the whole
+    project is never held in memory.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Tuple of (project information, capture targets)
+
+    Raises:
+        ValueError: If the file is not an analysis dump of a supported version
+    """
+    def decode(f: IO[str]) -> Iterator[Dict[str, Any]]:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                if number == 1:
+                    raise ValueError(f"{path} is not a django-autodoc analysis dump")
+                raise ValueError(f"{path}:{number}: invalid record: {e}")
+
+    with _open(path, 'r', path.endswith('.gz')) as f:
+        return load_analysis_records(decode(f), path)
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+# Django renders a fresh CSRF token into every form, which would otherwise
+# make identical pages hash differently on each request.
+_CSRF_TOKEN_RE = re.compile(rb'(name=["\']csrfmiddlewaretoken["\']\s+value=["\'])[^"\']*')
+
+class ScreenshotCache:
+    """Persistent cache mapping page fingerprints to stored screenshots."""
+    
+    FILENAME = '.screenshot_cache.json'
+    VERSION = 1
+    
+    def __init__(
+        self,
+        directory: str,
+        max_age: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the screenshot cache.
+        
+        Args:
+            directory: Screenshots directory the cache file lives in
+            max_age: Evict entries unused for this many seconds (optional)
+            max_entries: Keep at most this many entries, least recently used first out (optional)
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, self.FILENAME)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self._load()
+        
+    def _load(self) -> None:
+        """Load cache entries from disk, ignoring unreadable caches."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.entries = data.get('entries', {})
+            
+    @staticmethod
+    def fingerprint(status: int, headers: Mapping[str, str], body: bytes) -> str:
+        """
+        Compute a fingerprint for a served page.
+        
+        The body is hashed with CSRF tokens blanked out; when the response has
+        no body the ETag is used instead.
+        
+        Args:
+            status: HTTP status code
+            headers: Lower-cased response headers
+            body: Response body
+            
+        Returns:
+            Hex digest identifying the page content
+        """
+        digest = hashlib.sha256(str(status).encode())
+        if body:
+            digest.update(_CSRF_TOKEN_RE.sub(rb'\1', body))
+        else:
+            digest.update(headers.get('etag', '').encode())
+        return digest.hexdigest()
+        
+    def lookup(self, url: str, fingerprint: str) -> Optional[str]:
+        """
+        Return the stored screenshot for a URL if its fingerprint still matches.
+        
+        Args:
+            url: Full URL of the page
+            fingerprint: Current fingerprint of the page
+            
+        Returns:
+            Path of the cached screenshot, or None on a cache miss
+        """
+        with self._lock:
+            entry = self.entries.get(url)
+            if (
+                entry and entry['fingerprint'] == fingerprint
+                and all(os.path.exists(path) for path in self._entry_paths(entry))
+            ):
+                entry['last_used'] = time.time()
+                self.hits += 1
+                return entry['path']
+            self.misses += 1
+            return None
+            
+    def variants(self, url: str) -> Dict[str, str]:
+        """Return the per-viewport screenshots stored for a URL, keyed by viewport name."""
+        with self._lock:
+            entry = self.entries.get(url)
+            return dict(entry.get('variants', {})) if entry else {}
+            
+    def store(
+        self,
+        url: str,
+        fingerprint: str,
+        path: str,
+        variants: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Record the screenshot captured for a URL.
+        
+        Args:
+            url: Full URL of the page
+            fingerprint: Fingerprint of the captured page
+            path: Path of the primary screenshot
+            variants: Screenshots per viewport name, including the primary one (optional)
+        """
+        now = time.time()
+        with self._lock:
+            self.entries[url] = {
+                'fingerprint': fingerprint,
+                'path': path,
+                'variants': dict(variants or {}),
+                'captured_at': now,
+                'last_used': now,
+            }
+            
+    def remap_paths(self, path_map: Mapping[str, str]) -> None:
+        """Point entries at new screenshot paths, e.g. after deduplication."""
+        with self._lock:
+            for entry in self.entries.values():
+                entry['path'] = path_map.get(entry['path'], entry['path'])
+                entry['variants'] = {
+                    name: path_map.get(path, path)
+                    for name, path in entry.get('variants', {}).items()
+                }
+                
+    def paths(self) -> Set[str]:
+        """Return every screenshot path referenced by the cache."""
+        with self._lock:
+            return {path for entry in self.entries.values() for path in self._entry_paths(entry)}
+            
+    @staticmethod
+    def _entry_paths(entry: Dict[str, Any]) -> List[str]:
+        """List every screenshot file an entry refers to."""
+        return [entry['path'], *entry.get('variants', {}).values()]
+                
+    def evict(self) -> int:
+        """
+        Apply the age and size eviction policy.
+        
+        Screenshots of evicted entries are deleted unless they were used by
+        the current run or are still referenced by another entry.
+        
+        Returns:
+            Number of evicted entries
+        """
+        with self._lock:
+            evicted = {}
+            if self.max_age is not None:
+                cutoff = time.time() - self.max_age
+                for url, entry in list(self.entries.items()):
+                    if entry['last_used'] < cutoff:
+                        evicted[url] = self.entries.pop(url)
+                        
+            if self.max_entries is not None and len(self.entries) > self.max_entries:
+                by_age = sorted(self.entries.items(), key=lambda item: item[1]['last_used'])
+                for url, entry in by_age[:len(self.entries) - self.max_entries]:
+                    evicted[url] = self.entries.pop(url)
+                    
+            live_paths = {path for entry in self.entries.values() for path in self._entry_paths(entry)}
+            for entry in evicted.values():
+                if entry['last_used'] >= self._started:
+                    continue
+                for path in self._entry_paths(entry):
+                    if path in live_paths:
+                        continue
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            return len(evicted)
+            
+    def save(self) -> None:
+        """Write the cache to disk atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, f)
+        os.replace(tmp_path, self.path)
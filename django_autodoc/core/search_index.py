@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Bump whenever the layout of the index files changes; search.js checks it.
+INDEX_VERSION = 1
+
+# Output subdirectory holding the index files
+INDEX_DIRECTORY = 'search'
+
+# Terms are sharded by their first characters, so a lookup only loads the
+# shards its query words start with
+PREFIX_LENGTH = 2
+
+# Documents per document-table shard
+DOCS_PER_SHARD = 500
+
+SEARCH_SCRIPT = os.path.join(os.path.dirname(__file__), 'assets', 'search.js')
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lower-case search terms.
+
+    Identifiers are split at punctuation, so 'blog.post', 'post_list' and
+    '/blog/<int:pk>/' are found by their parts.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+def shard_name(term: str) -> str:
+    """Name the shard a term is stored in; non-ASCII prefixes are hex encoded."""
+    prefix = term[:PREFIX_LENGTH]
+    if prefix.isascii() and prefix.isalnum():
+        return prefix
+    return 'x' + prefix.encode('utf-8').hex()
+
+def _delta_encode(ids: List[int]) -> List[int]:
+    """Store ascending document ids as gaps, which are small and compress well."""
+    return [current - previous for previous, current in zip([0] + ids, ids)]
+
+class SearchIndex:
+    """
+    Inverted index of the generated documentation, for search.js.
+
+    Each page's documents are tokenized and indexed as soon as the page has
+    rendered. ``files()`` then merges the pages in path order, so document
+    ids do not depend on which page finished first, and lays the index out
+    as small JSON files:
+
+    - ``search/index.json``: version, shard names and the document count
+    - ``search/terms-<prefix>.json``: term -> delta-encoded document ids,
+      for every term starting with <prefix>
+    - ``search/docs-<n>.json``: [title, url, kind, page] of documents
+      n * DOCS_PER_SHARD onwards
+
+    A lookup loads the manifest, the term shards of the query words and the
+    document shards of the matches, never the whole index.
+    """
+
+    def __init__(self):
+        # Per page: its documents and term -> ids of its documents
+        self.pages: Dict[str, Tuple[List[Tuple[str, str, str, str]], Dict[str, List[int]]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(documents) for documents, _ in self.pages.values())
+
+    def add_page(self, relpath: str, page_title: str, entries: Iterable[Tuple[str, str, str, str]]) -> None:
+        """
+        Index the documents of one page, replacing any earlier ones.
+
+        Args:
+            relpath: Page path relative to the output directory
+            page_title: Title of the page, shown with its results
+            entries: (title, url, kind, text) tuples, where url is relative
+                to the output directory (e.g. 'models.html#blogpost'), kind
+                says what the document is (e.g. 'model', 'field',
+                'heading') and text is further text to find it by
+        """
+        documents = []
+        postings: Dict[str, List[int]] = {}
+        for doc_id, (title, url, kind, text) in enumerate(entries):
+            documents.append((title, url, kind, page_title))
+            for term in dict.fromkeys(tokenize(f"{title} {text}")):
+                postings.setdefault(term, []).append(doc_id)
+        self.pages[relpath] = (documents, postings)
+
+    def files(self) -> Iterator[Tuple[str, bytes]]:
+        """
+        Serialize the index.
+
+        Files are written in a stable order with sorted keys, so an
+        unchanged index produces identical files.
+
+        Yields:
+            Tuples of (path relative to the output directory, file content)
+        """
+        all_documents: List[Tuple[str, str, str, str]] = []
+        all_postings: Dict[str, List[int]] = {}
+        for relpath in sorted(self.pages):
+            documents, postings = self.pages[relpath]
+            offset = len(all_documents)
+            all_documents.extend(documents)
+            for term, ids in postings.items():
+                all_postings.setdefault(term, []).extend(offset + doc_id for doc_id in ids)
+
+        shards: Dict[str, Dict[str, List[int]]] = {}
+        for term in sorted(all_postings):
+            shards.setdefault(shard_name(term), {})[term] = _delta_encode(all_postings[term])
+
+        for name, terms in shards.items():
+            yield f"{INDEX_DIRECTORY}/terms-{name}.json", _dump(terms)
+
+        for number, start in enumerate(range(0, len(all_documents), DOCS_PER_SHARD)):
+            documents = [list(document) for document in all_documents[start:start + DOCS_PER_SHARD]]
+            yield f"{INDEX_DIRECTORY}/docs-{number}.json", _dump(documents)
+
+        yield f"{INDEX_DIRECTORY}/index.json", _dump({
+            'version': INDEX_VERSION,
+            'prefix_length': PREFIX_LENGTH,
+            'docs_per_shard': DOCS_PER_SHARD,
+            'documents': len(all_documents),
+            'shards': sorted(shards),
+        })
+
+        with open(SEARCH_SCRIPT, 'rb') as f:
+            yield 'search.js', f.read()
+
+    def write(self, output_dir: str, commit: Callable[[str, str, str, int], Any]) -> None:
+        """
+        Write the index files through a commit callback.
+
+        Each file is written to ``<path>.tmp`` and handed to ``commit`` with
+        its relative path, temporary path, content hash and size, e.g.
+        BuildManifest.commit, which keeps unchanged shards untouched.
+        """
+        for relpath, data in self.files():
+            path = os.path.join(output_dir, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            commit(relpath, tmp_path, hashlib.sha256(data).hexdigest(), len(data))
+
+def _dump(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+def default_session_file(base_url: str, username: Optional[str]) -> str:
+    """
+    Return the default file for the session of a site and user.
+
+    Sessions are kept in the user's cache directory ($XDG_CACHE_HOME, or
+    ~/.cache) rather than in the project tree, where they could end up in
+    a repository or archive.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    key = hashlib.sha256(f"{base_url.rstrip('/')}\n{username or ''}".encode()).hexdigest()[:16]
+    return os.path.join(cache_home, 'django-autodoc', 'sessions', f"{key}.json")
+
+class SessionStore:
+    """Persists authenticated session cookies between capture runs and backends."""
+    
+    def __init__(self, path: Optional[str], base_url: str, username: Optional[str]):
+        """
+        Initialize the session store.
+        
+        Args:
+            path: File to keep the session in (None disables persistence)
+            base_url: Base URL the session belongs to
+            username: User the session belongs to
+        """
+        self.path = path
+        self.base_url = base_url
+        self.username = username
+        
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """Load saved session cookies for this base URL and user."""
+        if not self.path:
+            return None
+        try:
+            with open(self.path, 'r') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if session.get('base_url') != self.base_url or session.get('username') != self.username:
+            return None
+        return session.get('cookies')
+        
+    def save(self, cookies: List[Dict[str, Any]]) -> None:
+        """Save session cookies, readable only by the current user."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # The mode given to os.open only applies to new files, so a leftover
+        # temporary file is narrowed too before the session is written
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'base_url': self.base_url, 'username': self.username, 'cookies': cookies}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,465 @@
+import ast
+import importlib.util
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .url_tree import flatten_urlconf, route_segment
+from ..utils.profiling import Profiler
+from ..utils.settings_discovery import find_settings_module
+
+# Call names that declare model fields but do not end in "Field".
+_RELATION_FIELDS = {'ForeignKey', 'OneToOneField', 'ManyToManyField', 'GenericForeignKey', 'GenericRelation'}
+
+# Call names that declare URL patterns.
+_URL_FUNCTIONS = {'path', 're_path', 'url'}
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    """Return the trailing name of a call target, e.g. 'CharField' for models.CharField."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    """
+    Evaluate a literal expression, unwrapping gettext-style calls.
+
+    Returns:
+        The literal value, or None if the expression is not a literal
+    """
+    if node is None:
+        return None
+    if isinstance(node, ast.Call) and node.args and not node.keywords:
+        # _('Blog post'), gettext_lazy('Blog post')
+        return _literal(node.args[0])
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+def _keyword(call: ast.Call, name: str) -> Optional[ast.AST]:
+    """Return the value node of a keyword argument."""
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+def _camel_case_to_spaces(value: str) -> str:
+    """Mirror django.utils.text.camel_case_to_spaces for default verbose names."""
+    return re.sub(r'(((?<=[a-z])[A-Z])|([A-Z](?![A-Z]|$)))', r' \1', value).strip().lower()
+
+def _parse_file(path: str) -> Optional[ast.Module]:
+    """Parse a Python file, returning None if it cannot be read or parsed."""
+    try:
+        with open(path, 'rb') as f:
+            return ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+def parse_settings_file(path: str) -> Dict[str, Any]:
+    """
+    Extract literal settings from a settings module.
+
+    Handles plain assignments, ``+=`` and concatenation of literal lists.
+
+    Args:
+        path: Path to settings.py
+
+    Returns:
+        Dict of setting names to literal values
+    """
+    tree = _parse_file(path)
+    values: Dict[str, Any] = {}
+    if tree is None:
+        return values
+
+    def evaluate(node: ast.AST) -> Any:
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left, right = evaluate(node.left), evaluate(node.right)
+            if isinstance(left, (list, tuple)) and isinstance(right, (list, tuple)):
+                return list(left) + list(right)
+            return None
+        if isinstance(node, ast.Name):
+            return values.get(node.id)
+        return _literal(node)
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            value = evaluate(node.value)
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.isupper():
+                    values[target.id] = value
+        elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+            current = values.get(node.target.id)
+            extra = evaluate(node.value)
+            if isinstance(current, (list, tuple)) and isinstance(extra, (list, tuple)):
+                values[node.target.id] = list(current) + list(extra)
+    return values
+
+def parse_models_files(modules: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Extract model classes from the models module(s) of one app.
+
+    Runs in a worker process, so it only returns plain data.
+
+    Args:
+        modules: (path, module name) of models.py, or of every module of a
+            models package
+
+    Returns:
+        List of class dictionaries with 'name', 'bases', 'fields', 'methods'
+        and 'meta' keys
+    """
+    classes = []
+    for path, module_name in modules:
+        tree = _parse_file(path)
+        if tree is None:
+            continue
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            class_info = {
+                'name': node.name,
+                'bases': [_call_name(base) for base in node.bases],
+                'fields': [],
+                'methods': [],
+                'meta': {},
+            }
+            for item in node.body:
+                if isinstance(item, ast.Assign) and isinstance(item.value, ast.Call):
+                    field_type = _call_name(item.value)
+                    if not field_type or not (field_type.endswith('Field') or field_type in _RELATION_FIELDS):
+                        continue
+                    for target in item.targets:
+                        if isinstance(target, ast.Name):
+                            class_info['fields'].append({
+                                'name': target.id,
+                                'type': field_type,
+                                'required': _literal(_keyword(item.value, 'null')) is not True,
+                                'primary_key': _literal(_keyword(item.value, 'primary_key')) is True,
+                            })
+                elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if not item.name.startswith('_'):
+                        class_info['methods'].append({
+                            'name': item.name,
+                            'defined_in': f"{module_name}.{node.name}",
+                        })
+                elif isinstance(item, ast.ClassDef) and item.name == 'Meta':
+                    for meta_item in item.body:
+                        if isinstance(meta_item, ast.Assign):
+                            for target in meta_item.targets:
+                                if isinstance(target, ast.Name):
+                                    class_info['meta'][target.id] = _literal(meta_item.value)
+            classes.append(class_info)
+    return classes
+
+def parse_urls_file(path: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Extract URL pattern declarations from a urlconf module.
+
+    Args:
+        path: Path to urls.py
+
+    Returns:
+        Tuple of (the module's app_name, list of entries); included urlconfs
+        carry an 'include' module name and the 'namespace' given to include()
+    """
+    tree = _parse_file(path)
+    entries: List[Dict[str, Any]] = []
+    app_name = None
+    if tree is None:
+        return app_name, entries
+
+    def add_patterns(node: ast.AST) -> None:
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            add_patterns(node.left)
+            add_patterns(node.right)
+            return
+        if not isinstance(node, (ast.List, ast.Tuple)):
+            return
+        for element in node.elts:
+            if not (isinstance(element, ast.Call) and _call_name(element) in _URL_FUNCTIONS and len(element.args) >= 2):
+                continue
+            route = _literal(element.args[0])
+            if not isinstance(route, str):
+                continue
+            view = element.args[1]
+            if isinstance(view, ast.Call) and _call_name(view) == 'include':
+                included = _literal(view.args[0]) if view.args else None
+                namespace = _literal(_keyword(view, 'namespace'))
+                if isinstance(included, tuple) and included:
+                    if len(included) > 1 and not namespace:
+                        namespace = included[1]
+                    included = included[0]
+                if isinstance(included, str):
+                    entries.append({
+                        'pattern': route,
+                        'include': included,
+                        'namespace': namespace if isinstance(namespace, str) else None,
+                    })
+                continue
+            if isinstance(view, ast.Attribute) and view.attr == 'urls':
+                # admin.site.urls and similar URL tuples built at runtime
+                continue
+
+            view_name, view_class = _call_name(view), None
+            if isinstance(view, ast.Call) and _call_name(view) == 'as_view':
+                view_class = _call_name(view.func.value) if isinstance(view.func, ast.Attribute) else None
+                view_name = view_class
+            entries.append({
+                'pattern': route,
+                'name': _literal(_keyword(element, 'name')) if len(element.args) < 3 else _literal(element.args[2]),
+                'view_name': view_name,
+                'view_class': view_class,
+                'model': None,
+            })
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            if any(isinstance(target, ast.Name) and target.id == 'urlpatterns' for target in node.targets):
+                add_patterns(node.value)
+            elif any(isinstance(target, ast.Name) and target.id == 'app_name' for target in node.targets):
+                value = _literal(node.value)
+                app_name = value if isinstance(value, str) else None
+        elif isinstance(node, ast.AugAssign):
+            if isinstance(node.target, ast.Name) and node.target.id == 'urlpatterns':
+                add_patterns(node.value)
+    return app_name, entries
+
+class StaticProjectAnalyzer:
+    """Analyzes a Django project from its sources without executing project code."""
+
+    def __init__(
+        self,
+        project_path: str,
+        settings_module: Optional[str] = None,
+        workers: Optional[int] = None,
+        profiler: Optional[Profiler] = None,
+    ):
+        """
+        Initialize the static project analyzer.
+
+        Args:
+            project_path: Path to the Django project
+            settings_module: Django settings module name (optional)
+            workers: Size of the parsing process pool (defaults to the CPU count)
+            profiler: Profiler to record analysis phases with (optional)
+        """
+        self.project_path = os.path.abspath(project_path)
+        self.settings_module = settings_module
+        self.workers = workers
+        self.profiler = profiler or Profiler(enabled=False)
+        with self.profiler.span('analyze.settings'):
+            self.settings_path = self._find_settings_file()
+            self.settings = parse_settings_file(self.settings_path) if self.settings_path else {}
+
+    def _find_settings_file(self) -> Optional[str]:
+        """Locate the settings module file without importing it."""
+        settings_module = self.settings_module or find_settings_module(self.project_path)
+        return self._module_file(settings_module) if settings_module else None
+
+    def _module_file(self, module_name: str) -> Optional[str]:
+        """
+        Resolve a dotted module name to a source file.
+
+        Modules inside the project are resolved on disk; anything else is
+        looked up on sys.path without being imported.
+        """
+        base = os.path.join(self.project_path, *module_name.split('.'))
+        for candidate in (f"{base}.py", os.path.join(base, '__init__.py')):
+            if os.path.isfile(candidate):
+                return candidate
+
+        # find_spec imports parent packages, so never use it for project code
+        top_level = os.path.join(self.project_path, module_name.split('.')[0])
+        if os.path.exists(top_level) or os.path.exists(f"{top_level}.py"):
+            return None
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError, AttributeError):
+            return None
+        return spec.origin if spec and spec.origin and spec.origin.endswith('.py') else None
+
+    def _resolve_app(self, entry: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Resolve an INSTALLED_APPS entry to (name, label, path).
+
+        AppConfig paths such as 'polls.apps.PollsConfig' are resolved to the
+        app package, honouring a literal ``label`` on the config class.
+        """
+        parts = entry.split('.')
+        config_class = parts[-1] if parts[-1][:1].isupper() else None
+        for end in range(len(parts), 0, -1):
+            name = '.'.join(parts[:end])
+            module_file = self._module_file(name)
+            if module_file and os.path.basename(module_file) == '__init__.py':
+                break
+        else:
+            return None
+
+        path = os.path.dirname(module_file)
+        label = name.rsplit('.', 1)[-1]
+        apps_file = os.path.join(path, 'apps.py')
+        tree = _parse_file(apps_file) if os.path.isfile(apps_file) else None
+        if tree is not None:
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and (config_class is None or node.name == config_class):
+                    for item in node.body:
+                        if isinstance(item, ast.Assign) and any(
+                            isinstance(target, ast.Name) and target.id == 'label' for target in item.targets
+                        ):
+                            label = _literal(item.value) or label
+        return name, label, path
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Analyze the Django project and return structured information.
+
+        The result has the same shape as ProjectAnalyzer.analyze(). Details
+        that only exist at runtime, such as reverse relations and methods
+        inherited from django.db.models.Model, are not included.
+
+        Returns:
+            Dict containing project structure information
+        """
+        app_entries = [
+            app for app in (self._resolve_app(entry) for entry in self.settings.get('INSTALLED_APPS') or [])
+            if app
+        ]
+
+        with self.profiler.span('analyze.parse'), ProcessPoolExecutor(max_workers=self.workers) as executor:
+            model_futures = [
+                executor.submit(parse_models_files, self._models_files(name, path))
+                for name, _, path in app_entries
+            ]
+            with self.profiler.span('analyze.urls'):
+                urls = self._analyze_urls(executor)
+            parsed_models = [future.result() for future in model_futures]
+
+        apps_info = []
+        models_info = {}
+        for (name, label, path), classes in zip(app_entries, parsed_models):
+            app_models = self._build_models(label, classes)
+            models_info.update(app_models)
+            apps_info.append({
+                'name': name,
+                'label': label,
+                'path': path,
+                'models': [key.split('.', 1)[1] for key in app_models],
+            })
+
+        return {
+            'apps': apps_info,
+            'urls': urls,
+            'models': models_info,
+            'views': {},
+            'forms': {},
+            'templates': {},
+        }
+
+    @staticmethod
+    def _models_files(app_name: str, app_path: str) -> List[Tuple[str, str]]:
+        """Return (path, module name) of models.py or of the modules of a models package."""
+        models_file = os.path.join(app_path, 'models.py')
+        if os.path.isfile(models_file):
+            return [(models_file, f"{app_name}.models")]
+        models_dir = os.path.join(app_path, 'models')
+        if os.path.isdir(models_dir):
+            return [
+                (os.path.join(models_dir, filename),
+                 f"{app_name}.models" if filename == '__init__.py' else f"{app_name}.models.{filename[:-3]}")
+                for filename in sorted(os.listdir(models_dir)) if filename.endswith('.py')
+            ]
+        return []
+
+    def _build_models(self, label: str, classes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Turn parsed classes of one app into model entries, resolving abstract bases."""
+        by_name = {class_info['name']: class_info for class_info in classes}
+        auto_field = str(self.settings.get('DEFAULT_AUTO_FIELD') or 'AutoField').rsplit('.', 1)[-1]
+
+        def is_model(class_info: Dict[str, Any], seen=()) -> bool:
+            for base in class_info['bases']:
+                if base in by_name:
+                    if base not in seen and is_model(by_name[base], seen + (base,)):
+                        return True
+                elif base and (base.endswith('Model') or base.startswith('Abstract')):
+                    # Model bases imported from other modules
+                    return True
+            return False
+
+        def inherited(class_info: Dict[str, Any], key: str, seen=()) -> List[Any]:
+            items = []
+            for base in class_info['bases']:
+                if base in by_name and base not in seen and by_name[base]['meta'].get('abstract'):
+                    items.extend(inherited(by_name[base], key, seen + (base,)))
+            return items + class_info[key]
+
+        models_info = {}
+        for class_info in classes:
+            if not is_model(class_info) or class_info['meta'].get('abstract'):
+                continue
+            fields = inherited(class_info, 'fields')
+            if not any(field['primary_key'] for field in fields):
+                fields = [{'name': 'id', 'type': auto_field, 'required': True, 'primary_key': True}] + fields
+            # Later (more derived) definitions override inherited ones
+            methods = {method['name']: method for method in inherited(class_info, 'methods')}
+            verbose_name = class_info['meta'].get('verbose_name') or _camel_case_to_spaces(class_info['name'])
+            models_info[f"{label}.{class_info['name'].lower()}"] = {
+                'fields': [
+                    {'name': field['name'], 'type': field['type'], 'required': field['required']}
+                    for field in fields
+                ],
+                'methods': [methods[name] for name in sorted(methods)],
+                'meta': {
+                    'verbose_name': str(verbose_name),
+                    'verbose_name_plural': str(class_info['meta'].get('verbose_name_plural') or f"{verbose_name}s"),
+                    'ordering': [str(order) for order in class_info['meta'].get('ordering') or []],
+                },
+            }
+        return models_info
+
+    def _analyze_urls(self, executor: ProcessPoolExecutor) -> List[Dict[str, Any]]:
+        """
+        Collect URL patterns, parsing each level of included urlconfs in parallel.
+
+        Each urlconf module is parsed and flattened once, however many times
+        it is included. Patterns carry their full path and namespaced name.
+        """
+        root_urlconf = self.settings.get('ROOT_URLCONF')
+        root_file = self._module_file(root_urlconf) if isinstance(root_urlconf, str) else None
+        if not root_file:
+            return []
+
+        parsed: Dict[str, Tuple[Optional[str], List[Dict[str, Any]]]] = {}
+        pending = [root_file]
+        while pending:
+            futures = {path: executor.submit(parse_urls_file, path) for path in pending}
+            pending = []
+            for path, future in futures.items():
+                parsed[path] = future.result()
+                for entry in parsed[path][1]:
+                    if 'include' not in entry:
+                        continue
+                    included = self._module_file(entry['include'])
+                    if included and included not in parsed and included not in pending and included not in futures:
+                        pending.append(included)
+                    entry['include_file'] = included
+
+        def include_of(entry: Dict[str, Any]) -> Optional[Tuple[str, str, Optional[str]]]:
+            included = entry.get('include_file')
+            if not included:
+                return None
+            return included, route_segment(entry['pattern']), entry['namespace'] or parsed[included][0]
+
+        def leaf_of(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if 'include' in entry:
+                # Urlconfs outside the project contribute no patterns
+                return None
+            return dict(entry, pattern=route_segment(entry['pattern']))
+
+        return flatten_urlconf(root_file, lambda path: parsed[path][1], include_of, leaf_of)
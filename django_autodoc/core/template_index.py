@@ -0,0 +1,299 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Files under template directories that are parsed as Django templates
+TEMPLATE_EXTENSIONS = ('.html', '.htm', '.txt', '.xml')
+
+# Templates parsed per worker task; large directories are split into batches
+BATCH_SIZE = 200
+
+# Below this many templates, parsing in the analysis process is faster than
+# starting a pool
+PARALLEL_THRESHOLD = 200
+
+# Names every template can use without them coming from the view's context
+_BUILTIN_VARIABLES = {'block', 'forloop', 'True', 'False', 'None'}
+
+def _literal(expression: Any) -> Optional[str]:
+    """
+    Return the string a template tag argument always evaluates to.
+
+    Quoted constants are resolved by Django when the template is compiled;
+    variables and filtered expressions have no fixed value.
+    """
+    from django.template.base import Variable
+    if expression is None or getattr(expression, 'filters', None):
+        return None
+    value = getattr(expression, 'var', expression)
+    if isinstance(value, Variable):
+        value = value.literal
+    return str(value) if isinstance(value, str) else None
+
+def _variable_name(expression: Any) -> Optional[str]:
+    """Return the top-level context name a filter expression looks up."""
+    from django.template.base import Variable
+    variable = getattr(expression, 'var', None)
+    if isinstance(variable, Variable) and variable.lookups:
+        return variable.lookups[0]
+    return None
+
+def parse_template(engine: Any, name: str, path: str) -> Dict[str, Any]:
+    """
+    Parse a template with Django's template engine and describe it.
+
+    The compiled node tree is walked once to collect the parent template,
+    included templates, blocks, reversed URL names and the context variables
+    the template reads. Only literal template names and URL names are
+    recorded.
+
+    Args:
+        engine: django.template.Engine to compile the template with
+        name: Template name, relative to its template directory
+        path: Path of the template file
+
+    Returns:
+        Dict with 'name', 'path', 'extends', 'includes', 'blocks', 'urls',
+        'context' and, if the template does not compile, 'error'
+    """
+    from django.template import Origin, Template
+    from django.template.base import Node, VariableNode
+    from django.template.defaulttags import ForNode, URLNode, WithNode
+    from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+
+    info: Dict[str, Any] = {
+        'name': name,
+        'path': path,
+        'extends': None,
+        'includes': [],
+        'blocks': [],
+        'urls': [],
+        'context': [],
+    }
+    try:
+        with open(path, encoding=engine.file_charset) as f:
+            source = f.read()
+        template = Template(source, origin=Origin(path, name), name=name, engine=engine)
+    except Exception as e:
+        info['error'] = f"{e.__class__.__name__}: {e}"
+        return info
+
+    includes, blocks, urls = {}, {}, {}
+    variables, local_names = {}, set()
+    for node in template.nodelist.get_nodes_by_type(Node):
+        if isinstance(node, ExtendsNode):
+            info['extends'] = _literal(node.parent_name)
+        elif isinstance(node, IncludeNode):
+            included = _literal(node.template)
+            if included:
+                includes[included] = None
+        elif isinstance(node, BlockNode):
+            blocks[node.name] = None
+        elif isinstance(node, URLNode):
+            url_name = _literal(node.view_name)
+            if url_name:
+                urls[url_name] = None
+        elif isinstance(node, VariableNode):
+            variables[_variable_name(node.filter_expression)] = None
+        elif isinstance(node, ForNode):
+            variables[_variable_name(node.sequence)] = None
+            local_names.update(node.loopvars)
+        elif isinstance(node, WithNode):
+            local_names.update(node.extra_context)
+
+    info['includes'] = list(includes)
+    info['blocks'] = list(blocks)
+    info['urls'] = list(urls)
+    info['context'] = sorted(
+        variable for variable in variables
+        if variable and variable not in local_names and variable not in _BUILTIN_VARIABLES
+    )
+    return info
+
+def _parse_batch(engine_alias: str, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Parse a batch of (name, path) templates with one of the project's engines."""
+    from django.template import engines
+    engine = engines[engine_alias].engine
+    return [parse_template(engine, name, path) for name, path in files]
+
+def _loader_dirs(loader: Any) -> Iterator[str]:
+    """Yield the directories a template loader (or cached loader) reads from."""
+    if hasattr(loader, 'loaders'):
+        for child in loader.loaders:
+            yield from _loader_dirs(child)
+    elif hasattr(loader, 'get_dirs'):
+        yield from (os.path.normpath(str(directory)) for directory in loader.get_dirs())
+
+def template_directories() -> List[Tuple[str, str]]:
+    """
+    List the template directories of the project's Django template engines.
+
+    Returns:
+        (engine alias, directory) pairs in lookup order
+    """
+    from django.template import engines
+    from django.template.backends.django import DjangoTemplates
+
+    directories = []
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for loader in backend.engine.template_loaders:
+            for directory in _loader_dirs(loader):
+                directories.append((backend.name, directory))
+    return directories
+
+class TemplateIndex:
+    """
+    Parsed templates of a project with their extends and include graph.
+
+    Every template is compiled once, by Django's own engine so custom tag
+    libraries are honoured; views, forms and the generated pages all read
+    from the same index. Template directories are parsed in parallel, and
+    with a cache, only templates whose file changed are parsed again.
+    """
+
+    def __init__(self, cache: Any = None, cache_key: str = '', workers: Optional[int] = None):
+        """
+        Initialize the template index.
+
+        Args:
+            cache: AnalysisCache to reuse unchanged templates from (optional)
+            cache_key: Key covering what parsing depends on besides the
+                template files, such as the settings and tag libraries
+            workers: Size of the parsing process pool (defaults to the CPU count)
+        """
+        self.cache = cache
+        self.cache_key = cache_key
+        self.workers = workers
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.parsed = 0
+
+    def build(self) -> 'TemplateIndex':
+        """Find and parse the project's templates, then link them."""
+        found: Dict[str, Tuple[str, str, str, List[int]]] = {}
+        for engine_alias, directory in template_directories():
+            for name, path, signature in self._template_files(directory):
+                # The first directory providing a name is the one Django loads
+                found.setdefault(name, (engine_alias, directory, path, signature))
+
+        cached: Dict[str, Any] = {}
+        if self.cache and found:
+            cached = self.cache.load('templates', self.cache_key) or {}
+
+        templates: Dict[str, Dict[str, Any]] = {}
+        batches: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for name, (engine_alias, directory, path, signature) in found.items():
+            entry = cached.get(name)
+            if entry and entry['path'] == path and entry['signature'] == signature:
+                templates[name] = entry['info']
+            else:
+                batches.setdefault((engine_alias, directory), []).append((name, path))
+
+        for info in self._parse(batches):
+            templates[info['name']] = info
+            self.parsed += 1
+
+        if self.cache and found and (self.parsed or len(cached) != len(found)):
+            self.cache.store('templates', self.cache_key, {
+                name: {'path': path, 'signature': signature, 'info': templates[name]}
+                for name, (_, _, path, signature) in found.items()
+            })
+
+        self.templates = {name: templates[name] for name in sorted(templates)}
+        self._link()
+        return self
+
+    @staticmethod
+    def _template_files(directory: str) -> Iterator[Tuple[str, str, List[int]]]:
+        """Yield (name, path, [mtime_ns, size]) for the templates under a directory."""
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames[:] = sorted(dirname for dirname in dirnames if not dirname.startswith('.'))
+            for filename in sorted(filenames):
+                if not filename.endswith(TEMPLATE_EXTENSIONS):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                name = os.path.relpath(path, directory).replace(os.sep, '/')
+                yield name, path, [stat.st_mtime_ns, stat.st_size]
+
+    def _parse(self, batches: Dict[Tuple[str, str], List[Tuple[str, str]]]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse templates, one pool task per directory (or slice of a large one).
+
+        Workers are forked from the analysis process, so they share its
+        configured Django settings and loaded tag libraries.
+        """
+        tasks = [
+            (engine_alias, files[start:start + BATCH_SIZE])
+            for (engine_alias, _), files in batches.items()
+            for start in range(0, len(files), BATCH_SIZE)
+        ]
+        total = sum(len(files) for _, files in tasks)
+        if (
+            total >= PARALLEL_THRESHOLD and len(tasks) > 1 and self.workers != 1
+            and 'fork' in multiprocessing.get_all_start_methods()
+        ):
+            try:
+                context = multiprocessing.get_context('fork')
+                with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+                    for infos in executor.map(_parse_batch, *zip(*tasks)):
+                        yield from infos
+                return
+            except (AssertionError, OSError) as e:
+                # e.g. analysis running in a daemonic process
+                print(f"Warning: Parsing templates serially: {e}")
+
+        for engine_alias, files in tasks:
+            yield from _parse_batch(engine_alias, files)
+
+    def _link(self) -> None:
+        """Add the reverse 'extended_by' and 'included_by' edges to every template."""
+        for info in self.templates.values():
+            info['extended_by'] = []
+            info['included_by'] = []
+        for name, info in self.templates.items():
+            parent = self.templates.get(info['extends'] or '')
+            if parent is not None:
+                parent['extended_by'].append(name)
+            for included in info['includes']:
+                if included in self.templates:
+                    self.templates[included]['included_by'].append(name)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a template's information, or None if the project has no such template."""
+        return self.templates.get(name)
+
+    def ancestors(self, name: str) -> List[str]:
+        """
+        Return the chain of templates a template extends, nearest first.
+
+        Parents missing from the index end the chain; so does a cycle.
+        """
+        chain: List[str] = []
+        seen = {name}
+        info = self.templates.get(name)
+        while info and info['extends'] and info['extends'] not in seen:
+            chain.append(info['extends'])
+            seen.add(info['extends'])
+            info = self.templates.get(info['extends'])
+        return chain
+
+    def includes(self, name: str) -> List[str]:
+        """Return every template included by a template or the templates it extends."""
+        included: Dict[str, None] = {}
+        pending = [name] + self.ancestors(name)
+        seen = set()
+        while pending:
+            current = pending.pop(0)
+            if current in seen:
+                continue
+            seen.add(current)
+            for child in (self.templates.get(current) or {}).get('includes', []):
+                included[child] = None
+                pending.append(child)
+        return list(included)
@@ -0,0 +1,122 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+from django.urls.converters import get_converters
+
+# Matches path converters such as <int:pk>, <slug:slug> or <username>.
+_CONVERTER_RE = re.compile(r'<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>')
+
+def pattern_parameters(pattern: str) -> List[Tuple[str, str]]:
+    """
+    List the (converter, parameter) pairs of a route pattern.
+
+    Parameters without an explicit converter use 'str', as in Django.
+    """
+    return [
+        (match.group('converter') or 'str', match.group('parameter'))
+        for match in _CONVERTER_RE.finditer(pattern)
+    ]
+
+def fill_pattern(pattern: str, values: Dict[str, Any]) -> Optional[str]:
+    """
+    Substitute parameter values into a route pattern.
+
+    Args:
+        pattern: Route pattern such as 'articles/<int:pk>/'
+        values: Values keyed by parameter name
+
+    Returns:
+        The concrete path, or None if a value is missing or does not match
+        its converter
+    """
+    converters = get_converters()
+    failed = False
+
+    def substitute(match: 're.Match[str]') -> str:
+        nonlocal failed
+        converter = converters.get(match.group('converter') or 'str')
+        value = values.get(match.group('parameter'))
+        text = '' if value is None else str(value)
+        if converter is None or not re.fullmatch(converter.regex, text):
+            failed = True
+            return ''
+        return text
+
+    path = _CONVERTER_RE.sub(substitute, pattern)
+    return None if failed else path
+
+def _parameter_field(model: Any, parameter: str) -> Optional[str]:
+    """
+    Map a URL parameter to the model field that supplies its value.
+
+    'pk', 'id', '<model>_pk' and '<model>_id' map to the primary key; any
+    other parameter must name a concrete field of the model.
+    """
+    model_name = model._meta.model_name
+    if parameter in ('pk', 'id', f'{model_name}_pk', f'{model_name}_id'):
+        return 'pk'
+    try:
+        field = model._meta.get_field(parameter)
+    except Exception:
+        return None
+    return field.attname if getattr(field, 'concrete', False) else None
+
+def resolve_parameterized_urls(urls: List[Dict[str, Any]], samples: int = 1) -> List[Dict[str, Any]]:
+    """
+    Turn parameterized URL patterns into concrete URLs using existing objects.
+
+    Patterns are grouped by the model their view is associated with, and each
+    model is sampled with a single ``values_list()`` query covering every
+    field its patterns need, limited to ``samples`` rows.
+
+    Args:
+        urls: URL dictionaries from ProjectAnalyzer, with a 'model' label
+        samples: Number of objects to sample per model
+
+    Returns:
+        Capture targets: URL dictionaries with the concrete 'path' to visit
+        and the index of the object it was filled from as 'sample'. Every
+        sample keeps the URL pattern as its 'pattern' key, so screenshots,
+        readiness timings and the generated pages map back to the pattern.
+    """
+    by_model: Dict[str, List[Tuple[Dict[str, Any], Dict[str, str]]]] = {}
+    for url_info in urls:
+        label = url_info.get('model')
+        parameters = pattern_parameters(url_info['pattern'])
+        if not label or not parameters or '?' in url_info['pattern']:
+            continue
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        fields = {parameter: _parameter_field(model, parameter) for _, parameter in parameters}
+        if all(fields.values()):
+            by_model.setdefault(label, []).append((url_info, fields))
+
+    targets = []
+    for label, entries in by_model.items():
+        model = apps.get_model(label)
+        columns = sorted({field for _, fields in entries for field in fields.values()})
+        try:
+            rows = list(model._default_manager.values_list(*columns)[:samples])
+        except (DatabaseError, ImproperlyConfigured) as e:
+            print(f"Failed to sample {label} objects: {str(e)}")
+            continue
+
+        for url_info, fields in entries:
+            for index, row in enumerate(rows):
+                row_values = dict(zip(columns, row))
+                path = fill_pattern(
+                    url_info['pattern'],
+                    {parameter: row_values[field] for parameter, field in fields.items()}
+                )
+                if path is None:
+                    continue
+                if url_info['name']:
+                    name = url_info['name'] if index == 0 else f"{url_info['name']}-{index + 1}"
+                else:
+                    name = re.sub(r'[^\w-]+', '_', path).strip('_')
+                targets.append(dict(url_info, name=name, path=path, sample=index))
+    return targets
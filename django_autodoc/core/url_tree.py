@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# (child urlconf key, route prefix, namespace) describing an include()
+Include = Tuple[Hashable, str, Optional[str]]
+
+# Flattened route relative to its urlconf: (route, namespaced name, leaf details)
+_Route = Tuple[str, Optional[str], Dict[str, Any]]
+
+def route_segment(route: str, is_regex: bool = False) -> str:
+    """
+    Normalize one level of a URL pattern for composition with its parents.
+
+    Regular expression anchors are dropped, so that '^blog/' and '^(?P<pk>\\d+)/$'
+    compose to 'blog/(?P<pk>\\d+)/', the way Django itself joins them.
+
+    Args:
+        route: Route or regular expression of the pattern
+        is_regex: Whether the pattern is a regular expression
+
+    Returns:
+        The route without anchors
+    """
+    if is_regex or route.startswith('^'):
+        if route.startswith('^'):
+            route = route[1:]
+        if route.endswith('\\Z'):
+            route = route[:-2]
+        elif route.endswith('$') and not route.endswith('\\$'):
+            route = route[:-1]
+    return route
+
+def flatten_urlconf(
+    root: Hashable,
+    patterns_of: Callable[[Hashable], Sequence[Any]],
+    include_of: Callable[[Any], Optional[Include]],
+    leaf_of: Callable[[Any], Optional[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Flatten a tree of urlconfs into full routes with namespaced names.
+
+    The tree is walked iteratively in post-order, so arbitrarily deep or
+    wide urlconfs do not hit the recursion limit, and each urlconf is
+    flattened once however many times it is included; including it again
+    only prepends the prefix and namespace to its flattened routes. Include
+    cycles are reported and skipped.
+
+    Args:
+        root: Key of the root urlconf
+        patterns_of: Returns the patterns of the urlconf with a given key
+        include_of: Returns (child key, route prefix, namespace) if a pattern
+            is an include(), otherwise None
+        leaf_of: Returns the details of a view pattern, with its relative
+            'pattern' and 'name', or None to leave the pattern out
+
+    Returns:
+        Leaf details with 'pattern' set to the full path, starting with '/',
+        and 'name' to the namespaced URL name
+    """
+    flattened: Dict[Hashable, List[_Route]] = {}
+    # Urlconfs expanded but not yet flattened: the current include path
+    on_path = set()
+    stack: List[Tuple[Hashable, bool]] = [(root, False)]
+    while stack:
+        key, expanded = stack.pop()
+        if key in flattened or (not expanded and key in on_path):
+            continue
+        patterns = patterns_of(key)
+        if not expanded:
+            # Flatten every included urlconf before the one including it
+            on_path.add(key)
+            stack.append((key, True))
+            for pattern in patterns:
+                include = include_of(pattern)
+                if include is None:
+                    continue
+                child = include[0]
+                if child in flattened:
+                    continue
+                if child in on_path:
+                    print(f"Skipping recursive include of {child}")
+                    continue
+                stack.append((child, False))
+            continue
+
+        routes: List[_Route] = []
+        for pattern in patterns:
+            include = include_of(pattern)
+            if include is None:
+                leaf = leaf_of(pattern)
+                if leaf is not None:
+                    routes.append((leaf['pattern'], leaf['name'], leaf))
+                continue
+            child, prefix, namespace = include
+            for route, name, leaf in flattened.get(child, ()):
+                if namespace and name:
+                    name = f"{namespace}:{name}"
+                routes.append((prefix + route, name, leaf))
+        flattened[key] = routes
+        on_path.discard(key)
+
+    return [
+        dict(leaf, pattern=f"/{route}", name=name)
+        for route, name, leaf in flattened[root]
+    ]
@@ -0,0 +1,213 @@
+import importlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+# Django modules that import without configured settings. Importing them in
+# the long-lived watch process means each forked analysis only pays for the
+# project's own modules.
+PRELOAD_MODULES = (
+    'django.db.models',
+    'django.urls',
+    'django.forms',
+    'django.template',
+    'django.views.generic',
+    'django.contrib.admin',
+    'django.core.handlers.wsgi',
+    'django.core.management',
+)
+
+def preload_django() -> None:
+    """Import the settings-independent parts of Django ahead of analysis."""
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+def run_isolated(function: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a function in a process forked from the current one and return its result.
+
+    Django's app registry can only be populated once per process, so code
+    changes to models or URLconfs are picked up by analyzing in a fresh fork
+    of the warm watch process instead of reloading modules in place.
+
+    Args:
+        function: Module-level function to run
+        args: Picklable arguments
+
+    Returns:
+        The function's (picklable) return value
+    """
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(function, *args).result()
+
+def _owner(path: str, app_paths: Dict[str, str]) -> Optional[str]:
+    """Return the label of the app whose directory holds a path, innermost first."""
+    owners = [label for label, app_path in app_paths.items() if path.startswith(app_path + os.sep)]
+    return max(owners, key=lambda label: len(app_paths[label]), default=None)
+
+def affected_apps(changed: Iterable[str], project_info: Mapping, previous_info: Mapping) -> Optional[Set[str]]:
+    """
+    Work out which apps a set of changed files can affect.
+
+    A file inside an app's directory affects that app. So does a change to
+    an app's analyzed models, e.g. through an abstract base class defined
+    in another app. Any other file, such as the settings, the root URLconf
+    or a project-level template, may affect every page.
+
+    Args:
+        changed: Paths of the changed files
+        project_info: Analysis of the project after the change
+        previous_info: Analysis of the project before the change
+
+    Returns:
+        Labels of the affected apps, or None if every app may be affected
+    """
+    if [app['label'] for app in project_info['apps']] != [app['label'] for app in previous_info['apps']]:
+        return None
+    app_paths = {app['label']: os.path.abspath(app['path']) for app in project_info['apps'] if app['path']}
+    apps = set()
+    for path in changed:
+        owner = _owner(os.path.abspath(path), app_paths)
+        if owner is None:
+            return None
+        apps.add(owner)
+    models, previous_models = project_info['models'], previous_info['models']
+    for label in models.keys() | previous_models.keys():
+        if models.get(label) != previous_models.get(label):
+            apps.add(label.split('.', 1)[0])
+    return apps
+
+def url_affected(url_info: Mapping, project_info: Mapping, apps: Set[str], project_path: str) -> bool:
+    """
+    Check whether a page may look different after changes to some apps.
+
+    A page is unaffected only if its view is defined in an unaffected app,
+    its model (if any) belongs to one, and none of the templates it renders
+    lies in an affected app. Views defined outside the project's apps, such
+    as the admin's, show data of any app and are always affected.
+
+    Args:
+        url_info: URL dictionary with 'pattern' and 'model' keys
+        project_info: Analysis of the project
+        apps: Labels of the affected apps, from affected_apps()
+        project_path: Path to the Django project
+    """
+    view = project_info['views'].get(url_info['pattern'])
+    if not view:
+        return True
+    root = os.path.abspath(project_path) + os.sep
+    app_names = {
+        app['name']: app['label'] for app in project_info['apps']
+        if app['path'] and os.path.abspath(app['path']).startswith(root)
+    }
+    owner = max(
+        (name for name in app_names if view['view'].startswith(name + '.')), key=len, default=None
+    )
+    if owner is None or app_names[owner] in apps:
+        return True
+    if url_info.get('model') and url_info['model'].split('.', 1)[0] in apps:
+        return True
+    app_paths = {app['label']: os.path.abspath(app['path']) for app in project_info['apps'] if app['path']}
+    templates = project_info['templates']
+    for name in [view.get('template')] + list(view.get('template_chain') or ()) + list(view.get('includes') or ()):
+        template = templates.get(name or '')
+        if template and _owner(os.path.abspath(template['path']), app_paths) in apps:
+            return True
+    return False
+
+class ProjectWatcher:
+    """Polls a project's sources and templates for changes."""
+
+    WATCHED_EXTENSIONS = ('.py', '.html', '.txt', '.xml', '.json')
+    IGNORED_DIRECTORIES = {'__pycache__', 'node_modules', '.git', '.hg', '.tox', '.venv', 'venv', 'static', 'media'}
+
+    def __init__(
+        self,
+        root: str,
+        ignore: Iterable[str] = (),
+        interval: float = 0.5,
+        debounce: float = 0.2,
+    ):
+        """
+        Initialize the project watcher.
+
+        Args:
+            root: Project directory to watch
+            ignore: Directories not to watch, e.g. the output and cache directories
+            interval: Time between polls, in seconds
+            debounce: Quiet period to wait for after a change, so that a burst
+                of saves triggers a single rebuild, in seconds
+        """
+        self.root = os.path.abspath(root)
+        self.ignore = {os.path.abspath(path) for path in ignore if path}
+        self.interval = interval
+        self.debounce = debounce
+        self._state = self.snapshot()
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Record the modification time and size of every watched file."""
+        state = {}
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        entry.name not in self.IGNORED_DIRECTORIES
+                        and not entry.name.startswith('.')
+                        and entry.path not in self.ignore
+                    ):
+                        stack.append(entry.path)
+                elif entry.name.endswith(self.WATCHED_EXTENSIONS):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self) -> Set[str]:
+        """
+        Return the files added, modified or removed since the last poll.
+        """
+        state = self.snapshot()
+        changed = {
+            path for path in state.keys() | self._state.keys()
+            if state.get(path) != self._state.get(path)
+        }
+        self._state = state
+        return changed
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Block until files change and then stay unchanged for the debounce period.
+
+        Args:
+            timeout: Give up after this many seconds (optional)
+
+        Returns:
+            Changed files, or an empty set on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: Set[str] = set()
+        while not changed:
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+            changed = self.poll()
+        while True:
+            time.sleep(self.debounce)
+            more = self.poll()
+            if not more:
+                return changed
+            changed |= more
@@ -0,0 +1,56 @@
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Redirect handler that surfaces 3xx responses instead of following them."""
+    
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+def cookie_header(cookies: List[Dict[str, str]]) -> str:
+    """
+    Build a Cookie header from Selenium-style cookie dictionaries.
+    
+    Args:
+        cookies: List of dictionaries with 'name' and 'value' keys
+        
+    Returns:
+        Value for the HTTP Cookie header
+    """
+    return '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+
+def fetch(
+    url: str,
+    cookies: Optional[List[Dict[str, str]]] = None,
+    timeout: float = 10.0,
+    follow_redirects: bool = True,
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Perform a plain HTTP GET request.
+    
+    Args:
+        url: URL to fetch
+        cookies: Selenium-style cookies to send with the request (optional)
+        timeout: Socket timeout in seconds
+        follow_redirects: Whether 3xx responses should be followed
+        
+    Returns:
+        Tuple of (status code, lower-cased response headers, body)
+        
+    Raises:
+        urllib.error.URLError: If the server cannot be reached
+    """
+    request = urllib.request.Request(url)
+    if cookies:
+        request.add_header('Cookie', cookie_header(cookies))
+        
+    handlers = [] if follow_redirects else [_NoRedirectHandler()]
+    opener = urllib.request.build_opener(*handlers)
+    try:
+        with opener.open(request, timeout=timeout) as response:
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            return response.status, headers, response.read()
+    except urllib.error.HTTPError as e:
+        headers = {key.lower(): value for key, value in e.headers.items()}
+        return e.code, headers, e.read()
@@ -0,0 +1,230 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Return a percentile of a list of values by linear interpolation.
+
+    Args:
+        values: Sample values
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _latency(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize the durations of URL spans as count, p50, p95 and max."""
+    latencies = [event['duration'] for event in events]
+    return {
+        'count': len(latencies),
+        'p50': percentile(latencies, 0.5),
+        'p95': percentile(latencies, 0.95),
+        'max': max(latencies, default=0.0),
+    }
+
+class Profiler:
+    """
+    Records timed spans of a documentation build.
+
+    Spans are timed with time.perf_counter(), which is system-wide on the
+    platforms we run on, so spans measured in worker processes can be
+    recorded in the parent and still line up. A disabled profiler records
+    nothing and costs one attribute check per span.
+    """
+
+    # Category of per-URL capture spans, summarized as page latency.
+    URL_CATEGORY = 'url'
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Record spans; a disabled profiler ignores them
+        """
+        self.enabled = enabled
+        self.events: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = 'phase', **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block.
+
+        Args:
+            name: Span name, e.g. 'django.setup' or a URL pattern
+            category: Span category ('phase', 'url', 'render', ...)
+            args: Extra details to attach to the span
+
+        Yields:
+            The span's args dictionary, which the block may add details to
+        """
+        if not self.enabled:
+            yield args
+            return
+        started = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.record(name, category, started, time.perf_counter() - started, **args)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        started: float,
+        duration: float,
+        pid: Optional[int] = None,
+        tid: Optional[int] = None,
+        **args: Any
+    ) -> None:
+        """
+        Record a span measured elsewhere, e.g. in a worker process.
+
+        Args:
+            name: Span name
+            category: Span category
+            started: time.perf_counter() value at the start of the span
+            duration: Span duration in seconds
+            pid: Process the span ran in (defaults to the current one)
+            tid: Thread the span ran in (defaults to the current one)
+            args: Extra details to attach to the span
+        """
+        if not self.enabled:
+            return
+        event = {
+            'name': name,
+            'cat': category,
+            'start': started - self.origin,
+            'duration': duration,
+            'pid': pid or os.getpid(),
+            'tid': tid or threading.get_ident(),
+            'args': args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self, slowest: int = 10) -> Dict[str, Any]:
+        """
+        Summarize recorded spans.
+
+        Args:
+            slowest: Number of slowest URLs to list
+
+        URL spans marked 'cached' (screenshot cache hits) are summarized
+        separately under 'cached_urls', so they do not pull the page latency
+        of captured URLs down.
+
+        Returns:
+            Dict with per-phase 'phases' totals, 'urls' and 'cached_urls'
+            latency percentiles and the 'slowest_urls' captured
+        """
+        with self._lock:
+            events = list(self.events)
+
+        phases: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            if event['cat'] == self.URL_CATEGORY:
+                continue
+            phase = phases.setdefault(event['name'], {'category': event['cat'], 'count': 0, 'total': 0.0})
+            phase['count'] += 1
+            phase['total'] += event['duration']
+
+        url_events, cached_events = [], []
+        for event in events:
+            if event['cat'] == self.URL_CATEGORY:
+                (cached_events if event['args'].get('cached') else url_events).append(event)
+        return {
+            'phases': phases,
+            'urls': _latency(url_events),
+            'cached_urls': _latency(cached_events),
+            'slowest_urls': [
+                {'name': event['name'], 'duration': event['duration'], **event['args']}
+                for event in sorted(url_events, key=lambda event: -event['duration'])[:slowest]
+            ],
+        }
+
+    def report(self, echo: Callable[[str], Any] = print, slowest: int = 10) -> None:
+        """
+        Print a summary table of phases, page latency, cache hits and the slowest URLs.
+
+        Args:
+            echo: Function to print each line with
+            slowest: Number of slowest URLs to list
+        """
+        summary = self.summary(slowest)
+        echo(f"{'Phase':<40} {'Count':>6} {'Total':>9}")
+        for name, phase in sorted(summary['phases'].items(), key=lambda item: -item[1]['total']):
+            echo(f"{name[:40]:<40} {phase['count']:>6} {phase['total']:>8.2f}s")
+
+        urls = summary['urls']
+        if urls['count']:
+            echo(
+                f"Page latency over {urls['count']} URLs: p50 {urls['p50']:.2f}s, "
+                f"p95 {urls['p95']:.2f}s, max {urls['max']:.2f}s"
+            )
+        cached = summary['cached_urls']
+        if cached['count']:
+            echo(
+                f"Cached pages: {cached['count']} URLs, p50 {cached['p50']:.2f}s, "
+                f"p95 {cached['p95']:.2f}s, max {cached['max']:.2f}s"
+            )
+        if urls['count']:
+            echo("Slowest URLs:")
+            for entry in summary['slowest_urls']:
+                details = ', '.join(
+                    f"{key}={value}" for key, value in entry.items() if key not in ('name', 'duration')
+                )
+                echo(f"  {entry['duration']:>7.2f}s  {entry['name']}" + (f"  ({details})" if details else ''))
+
+    def write_trace(self, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write the spans as a Chrome trace, loadable in chrome://tracing or Perfetto.
+
+        The summary and any metadata are stored under 'otherData', so runs
+        can also be compared by reading the JSON directly.
+
+        Args:
+            path: Trace file to write
+            metadata: Extra details about the run (optional)
+        """
+        with self._lock:
+            events = list(self.events)
+
+        trace_events = [
+            {
+                'name': event['name'],
+                'cat': event['cat'],
+                'ph': 'X',
+                'ts': round(event['start'] * 1e6, 3),
+                'dur': round(event['duration'] * 1e6, 3),
+                'pid': event['pid'],
+                'tid': event['tid'],
+                'args': event['args'],
+            }
+            for event in sorted(events, key=lambda event: event['start'])
+        ]
+        data = {
+            'traceEvents': trace_events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'summary': self.summary(), **(metadata or {})},
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
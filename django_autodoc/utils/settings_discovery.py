@@ -0,0 +1,189 @@
+import fnmatch
+import json
+import os
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Directories that never hold a project's settings module.
+IGNORED_DIRECTORIES = {
+    '__pycache__', 'node_modules', 'bower_components', '.git', '.hg', '.svn', '.tox', '.nox',
+    '.venv', 'venv', 'env', 'site-packages', 'static', 'staticfiles', 'media', 'templates',
+    'locale', 'migrations', 'build', 'dist', 'htmlcov',
+}
+
+# Levels below the project directory searched for a settings module.
+MAX_DEPTH = 4
+
+CACHE_FILENAME = 'settings.json'
+
+# os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings') in manage.py, wsgi.py or asgi.py
+_SETTINGS_DEFAULT_RE = re.compile(
+    r'''DJANGO_SETTINGS_MODULE['"]\s*,\s*['"](?P<module>[\w.]+)['"]'''
+)
+
+_discovered: Dict[str, str] = {}
+
+def settings_module_file(project_path: str, module: str) -> Optional[str]:
+    """
+    Locate a settings module inside the project without importing it.
+
+    Returns:
+        Path of the module file or package __init__.py, or None if the
+        project does not contain it
+    """
+    base = os.path.join(project_path, *module.split('.'))
+    for path in (f"{base}.py", os.path.join(base, '__init__.py')):
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _ignore_patterns(project_path: str) -> List[str]:
+    """Read the directory patterns of the project's top-level .gitignore."""
+    patterns = []
+    try:
+        with open(os.path.join(project_path, '.gitignore')) as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return patterns
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith(('#', '!')):
+            patterns.append(line.strip('/'))
+    return patterns
+
+def _is_ignored(name: str, relative_path: str, patterns: List[str]) -> bool:
+    """Check a directory against the built-in ignore list and .gitignore patterns."""
+    if name in IGNORED_DIRECTORIES or name.startswith('.'):
+        return True
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative_path, pattern)
+        for pattern in patterns
+    )
+
+def _declaring_files(project_path: str) -> List[str]:
+    """List the files that may declare the settings module: manage.py and the packages' wsgi.py/asgi.py."""
+    candidates = [os.path.join(project_path, 'manage.py')]
+    try:
+        entries = sorted(os.scandir(project_path), key=lambda entry: entry.name)
+    except OSError:
+        return candidates
+    for entry in entries:
+        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, '__init__.py')):
+            candidates += [os.path.join(entry.path, 'wsgi.py'), os.path.join(entry.path, 'asgi.py')]
+    return candidates
+
+def _declaring_signature(project_path: str) -> Dict[str, List[int]]:
+    """Map the declaring files that exist to their [mtime_ns, size]."""
+    signature = {}
+    for path in _declaring_files(project_path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature[os.path.relpath(path, project_path)] = [stat.st_mtime_ns, stat.st_size]
+    return signature
+
+def _declared_settings(project_path: str) -> Optional[str]:
+    """Read the settings module manage.py (or the WSGI/ASGI module) defaults to."""
+    for path in _declaring_files(project_path):
+        try:
+            with open(path) as f:
+                match = _SETTINGS_DEFAULT_RE.search(f.read())
+        except OSError:
+            continue
+        if match and settings_module_file(project_path, match.group('module')):
+            return match.group('module')
+    return None
+
+def search_settings_module(project_path: str) -> Optional[str]:
+    """
+    Search the project's packages breadth-first for a settings module.
+
+    Only Python packages are descended into, since the settings module has
+    to be importable from the project directory, and ignored directories
+    (virtualenvs, node_modules, VCS and media directories, .gitignore
+    entries) are skipped without being listed.
+    """
+    patterns = _ignore_patterns(project_path)
+    queue = deque([(project_path, '', 0)])
+    while queue:
+        directory, module_prefix, depth = queue.popleft()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            if entry.name == 'settings.py' and entry.is_file():
+                return f"{module_prefix}settings"
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            relative_path = os.path.relpath(entry.path, project_path)
+            if _is_ignored(entry.name, relative_path, patterns):
+                continue
+            if not os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                continue
+            if entry.name == 'settings':
+                return f"{module_prefix}settings"
+            subdirectories.append(entry)
+        if depth < MAX_DEPTH:
+            for entry in subdirectories:
+                queue.append((entry.path, f"{module_prefix}{entry.name}.", depth + 1))
+    return None
+
+def find_settings_module(project_path: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Find a project's settings module without importing any of its code.
+
+    The module manage.py (or the WSGI/ASGI module) declares is preferred;
+    otherwise the shallowest settings.py or settings package is used. The
+    result is remembered for the process and, with a cache directory, on
+    disk for as long as the module still exists and manage.py, wsgi.py and
+    asgi.py are unchanged.
+
+    Args:
+        project_path: Path to the Django project
+        cache_dir: Directory of the incremental build caches (optional)
+
+    Returns:
+        Dotted settings module name, or None if none was found
+    """
+    project_path = os.path.abspath(project_path)
+    if project_path in _discovered:
+        return _discovered[project_path]
+
+    cache_file = os.path.join(cache_dir, CACHE_FILENAME) if cache_dir else None
+    cached: Dict[str, Any] = {}
+    signature = _declaring_signature(project_path)
+    if cache_file:
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(cached, dict):
+            cached = {}
+        entry = cached.get(project_path)
+        if (
+            isinstance(entry, dict) and entry.get('sources') == signature
+            and entry.get('module') and settings_module_file(project_path, entry['module'])
+        ):
+            _discovered[project_path] = entry['module']
+            return entry['module']
+
+    module = _declared_settings(project_path) or search_settings_module(project_path)
+    if not module:
+        return None
+    _discovered[project_path] = module
+    if cache_file:
+        cached[project_path] = {'module': module, 'sources': signature}
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_file}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            pass
+    return module
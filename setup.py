@@ -3,7 +3,10 @@ from setuptools import setup, find_packages
 setup(
     name="django-autodoc",
     version="0.1.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
+    package_data={
+        "django_autodoc.core": ["templates/*.j2", "assets/*.js"],
+    },
     install_requires=[
         "Django>=3.2",
         "selenium>=4.0.0",
@@ -12,9 +15,13 @@ setup(
         "Jinja2>=3.0.0",
         "click>=8.0.0",
     ],
+    extras_require={
+        "thumbnails": ["Pillow>=8.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "django-autodoc=django_autodoc.cli.main:main",
+            "django-autodoc-batch=django_autodoc.cli.batch:main",
         ],
     },
     author="Your Name",
@@ -43,6 +43,35 @@ SECRET_KEY = 'test-key'
         self.assertIn('django.contrib.admin', app_names)
         self.assertIn('django.contrib.auth', app_names)
     
+    def test_model_methods_record_defining_class(self):
+        analyzer = ProjectAnalyzer(self.project_dir, 'settings')
+        methods = {
+            method['name']: method['defined_in']
+            for method in analyzer.analyze()['models']['auth.user']['methods']
+        }
+        
+        self.assertEqual(methods['save'], 'django.contrib.auth.base_user.AbstractBaseUser')
+        self.assertEqual(methods['delete'], 'django.db.models.base.Model')
+        self.assertEqual(methods['get_full_name'], 'django.contrib.auth.models.AbstractUser')
+        self.assertNotIn('DoesNotExist', methods)
+        self.assertNotIn('objects', methods)
+    
+    def test_incremental_analysis_cache(self):
+        import shutil
+        import tempfile
+        cache_dir = tempfile.mkdtemp()
+        try:
+            first = ProjectAnalyzer(self.project_dir, 'settings', cache_dir=cache_dir)
+            result = first.analyze()
+            self.assertEqual(first.cache.hits, 0)
+            
+            second = ProjectAnalyzer(self.project_dir, 'settings', cache_dir=cache_dir)
+            self.assertEqual(second.analyze(), result)
+            self.assertEqual(second.cache.misses, 0)
+            self.assertEqual(second.cache.hits, len(result['apps']))
+        finally:
+            shutil.rmtree(cache_dir)
+    
     def tearDown(self):
         # Clean up test project directory
         import shutil
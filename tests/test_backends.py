@@ -0,0 +1,161 @@
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from django_autodoc.core.backends import CaptureBackend, HTTPSnapshotBackend, parse_page
+from django_autodoc.core.session import SessionStore
+
+PAGE = """
+<html><head><title>Post list</title></head>
+<body>
+  <h1>Posts</h1>
+  <h2>Recent <em>posts</em></h2>
+  <form method="post" action="/posts/search/">
+    <input type="hidden" name="csrfmiddlewaretoken" value="token">
+    <input type="text" name="q" required>
+    <select name="category"></select>
+    <input type="submit" value="Search">
+  </form>
+</body></html>
+"""
+
+LOGIN_PAGE = '<form method="post"><input type="hidden" name="csrfmiddlewaretoken" value="abc"></form>'
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    logins = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        logged_in = 'sessionid=s1' in (self.headers.get('Cookie') or '')
+        if self.path == '/admin/login/':
+            self._send(200, LOGIN_PAGE.encode(), [('Set-Cookie', 'csrftoken=abc; Path=/')])
+        elif self.path == '/admin/':
+            self._send(200 if logged_in else 302, b'', [('Location', '/admin/login/')])
+        elif self.path == '/chunked/':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in (b'<title>Chun', b'ked</title>'):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        elif self.path.startswith('/posts/'):
+            self._send(200 if logged_in else 403, PAGE.encode())
+        else:
+            self._send(404, b'<title>Not found</title>')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        if 'csrfmiddlewaretoken=abc' in body and 'password=secret' in body:
+            type(self).logins += 1
+            self._send(302, b'', [('Location', '/admin/'), ('Set-Cookie', 'sessionid=s1; Path=/')])
+        else:
+            self._send(200, LOGIN_PAGE.encode())
+
+class TestParsePage(unittest.TestCase):
+    def test_parse_page(self):
+        page = parse_page(PAGE)
+        self.assertEqual(page['title'], 'Post list')
+        self.assertEqual(page['headings'], [
+            {'level': 1, 'text': 'Posts'},
+            {'level': 2, 'text': 'Recent posts'},
+        ])
+        self.assertEqual(page['forms'], [{
+            'action': '/posts/search/',
+            'method': 'post',
+            'fields': [
+                {'name': 'q', 'type': 'text', 'required': True},
+                {'name': 'category', 'type': 'select', 'required': False},
+            ],
+        }])
+
+class TestCaptureBackend(unittest.TestCase):
+    def test_incomplete_backend_cannot_be_created(self):
+        class NoCapture(CaptureBackend):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoCapture()
+
+class TestHTTPSnapshotBackend(unittest.TestCase):
+    def setUp(self):
+        Handler.connections = 0
+        Handler.logins = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+        self.cache_dir = tempfile.mkdtemp()
+        self.urls = [
+            {'pattern': f'/posts/{i}/', 'name': f'post-{i}'} for i in range(20)
+        ] + [
+            {'pattern': '/chunked/', 'name': 'chunked'},
+            {'pattern': '/posts/<int:pk>/', 'name': 'detail'},
+        ]
+
+    def _backend(self):
+        return HTTPSnapshotBackend(
+            self.base_url, username='admin', password='secret',
+            session_file=f'{self.cache_dir}/session.json', concurrency=4,
+        )
+
+    def test_capture_with_login_and_pooled_connections(self):
+        pages = self._backend().capture(self.urls)
+
+        self.assertEqual(len(pages), 21)
+        self.assertEqual(pages['/posts/3/']['status'], 200)
+        self.assertEqual(pages['/posts/3/']['title'], 'Post list')
+        self.assertEqual(pages['/chunked/']['title'], 'Chunked')
+        self.assertEqual(Handler.logins, 1)
+        self.assertLessEqual(Handler.connections, 4)
+
+    def test_saved_session_is_reused(self):
+        self._backend().capture(self.urls[:1])
+        pages = self._backend().capture(self.urls[:1])
+
+        self.assertEqual(pages['/posts/0/']['status'], 200)
+        self.assertEqual(Handler.logins, 1)
+
+    def test_saved_session_is_private(self):
+        session_file = f'{self.cache_dir}/session.json'
+        with open(session_file, 'w') as f:
+            f.write('{}')
+        os.chmod(session_file, 0o644)
+        self._backend().capture(self.urls[:1])
+
+        self.assertEqual(stat.S_IMODE(os.stat(session_file).st_mode), 0o600)
+        cookies = SessionStore(session_file, self.base_url.rstrip('/'), 'admin').load()
+        self.assertIn('sessionid', [cookie['name'] for cookie in cookies])
+
+    def test_unreachable_server_does_not_abort_capture(self):
+        self.server.shutdown()
+        self.server.server_close()
+        pages = self._backend().capture(self.urls[:2])
+
+        self.assertEqual(pages, {})
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
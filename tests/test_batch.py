@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks.synthetic import generate_project
+from django_autodoc.core.batch import run_batch
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def write_project(self, name, settings_source):
+        project_dir = os.path.join(self.work_dir, name)
+        os.makedirs(os.path.join(project_dir, name))
+        with open(os.path.join(project_dir, name, '__init__.py'), 'w') as f:
+            f.write('')
+        with open(os.path.join(project_dir, name, 'settings.py'), 'w') as f:
+            f.write(settings_source)
+        return {'project': project_dir, 'settings': f'{name}.settings'}
+
+    def test_failed_projects_do_not_affect_the_batch(self):
+        project = generate_project(os.path.join(self.work_dir, 'synthetic'), apps=2, models_per_app=3)
+        jobs = [
+            self.write_project('crashing', 'import os\nos._exit(3)\n'),
+            {'project': project['path'], 'settings': project['settings_module']},
+            self.write_project('broken', 'INSTALLED_APPS = ["missing_app"]\n'),
+            {'project': project['path'], 'settings': project['settings_module'], 'static': True},
+        ]
+        results = {result['index']: result for result in run_batch(jobs, parallel=2)}
+
+        self.assertEqual(sorted(results), [0, 1, 2, 3])
+        self.assertEqual(results[0]['status'], 'failed')
+        self.assertEqual(results[0]['exitcode'], 3)
+        self.assertEqual(results[2]['status'], 'failed')
+        self.assertIn('missing_app', results[2]['error'])
+        for index in (1, 3):
+            self.assertEqual(results[index]['status'], 'ok', results[index]['error'])
+            models = [label for label in results[index]['project'].models if label.startswith('app')]
+            self.assertEqual(len(models), project['models'])
+            self.assertEqual(
+                len([url for url in results[index]['capture_urls'] if url['pattern'].startswith('/app')]),
+                project['urls'],
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
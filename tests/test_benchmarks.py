@@ -0,0 +1,41 @@
+import shutil
+import tempfile
+import unittest
+from benchmarks.run import compare
+from benchmarks.synthetic import generate_project
+from django_autodoc.core.static_analyzer import StaticProjectAnalyzer
+
+class TestSyntheticProject(unittest.TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+
+    def test_generated_project_matches_its_description(self):
+        project = generate_project(self.project_dir, apps=3, models_per_app=4, fields_per_model=6, include_depth=2)
+        result = StaticProjectAnalyzer(project['path'], project['settings_module'], workers=1).analyze()
+
+        models = {label: info for label, info in result['models'].items() if label.startswith('app')}
+        self.assertEqual(len(models), project['models'])
+        self.assertEqual(len(models['app0.model1']['fields']), 6 + 2)
+        self.assertEqual(
+            len([url for url in result['urls'] if '/model' in url['pattern']]),
+            project['urls'],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.project_dir, ignore_errors=True)
+
+class TestCompare(unittest.TestCase):
+    def test_regressions_are_reported(self):
+        def results(seconds):
+            return {'results': [{'size': 'small', 'stages': {
+                'analysis': {'min': seconds},
+                'generate_md': {'min': 1.0},
+            }}]}
+
+        self.assertEqual(compare(results(1.0), results(1.05)), [])
+        regressions = compare(results(1.0), results(1.5))
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('small/analysis'))
+
+if __name__ == '__main__':
+    unittest.main()
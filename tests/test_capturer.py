@@ -0,0 +1,292 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+from selenium.common.exceptions import WebDriverException
+from django_autodoc.core.capturer import ScreenshotCapturer, parse_viewports
+from django_autodoc.core.readiness import (
+    DocumentReadyStrategy, DOMStableStrategy, ReadinessPolicy, ReadinessStrategy, SelectorStrategy
+)
+from django_autodoc.core.screenshot_cache import ScreenshotCache
+from django_autodoc.core.session import SessionStore
+
+class FakeDriver:
+    """Minimal stand-in for a Selenium WebDriver."""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = fail_on
+        self.current_url = None
+        self.visited = []
+        self.cookies = []
+        self.window_sizes = []
+
+    def get(self, url):
+        if any(url.endswith(pattern) for pattern in self.fail_on):
+            raise WebDriverException(f"cannot load {url}")
+        self.current_url = url
+        self.visited.append(url)
+
+    def get_cookies(self):
+        # Like a browser, only report cookies while on a page of the site
+        return list(self.cookies) if self.current_url else []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cookies.append({'name': params['name'], 'value': params['value']})
+
+    def execute_script(self, script, *args):
+        return 'complete'
+
+    def execute_async_script(self, script, *args):
+        return self.window_sizes[-1][0]
+
+    def set_window_size(self, width, height):
+        self.window_sizes.append((width, height))
+
+    def save_screenshot(self, path):
+        with open(path, 'wb') as f:
+            f.write(b'png')
+        return True
+
+    def quit(self):
+        pass
+
+class FakeCapturer(ScreenshotCapturer):
+    fail_on = ()
+
+    def _create_driver(self):
+        return FakeDriver(self.fail_on)
+
+    def _fingerprint(self, url):
+        return f'fp:{url}'
+
+class SessionCapturer(FakeCapturer):
+    logins = 0
+    session_is_valid = False
+    drivers = []
+
+    def _create_driver(self):
+        driver = super()._create_driver()
+        self.drivers.append(driver)
+        return driver
+
+    def _login(self, driver=None):
+        type(self).logins += 1
+        self.driver.get(f"{self.base_url}{self.login_url}")
+        self.driver.cookies = [{'name': 'sessionid', 'value': 'abc'}]
+        return True
+
+    def _session_valid(self, cookies):
+        return self.session_is_valid
+
+class TestScreenshotCapturer(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.urls = [
+            {'pattern': f'/page{i}/', 'name': f'page{i}'} for i in range(10)
+        ] + [{'pattern': '/items/<int:pk>/', 'name': 'item'}]
+
+    def test_sequential_capture(self):
+        capturer = FakeCapturer('http://testserver/', self.output_dir)
+        screenshots = capturer.capture_screenshots(self.urls)
+
+        self.assertEqual(len(screenshots), 10)
+        self.assertNotIn('/items/<int:pk>/', screenshots)
+        self.assertTrue(os.path.exists(screenshots['/page0/']))
+
+    def test_parallel_capture_matches_sequential(self):
+        capturer = FakeCapturer('http://testserver/', self.output_dir, workers=3)
+        screenshots = capturer.capture_screenshots(self.urls)
+
+        self.assertEqual(
+            screenshots,
+            {f'/page{i}/': os.path.join(self.output_dir, f'page{i}.png') for i in range(10)}
+        )
+        self.assertEqual(len(capturer.worker_stats), 3)
+        self.assertEqual(sum(stats['captured'] for stats in capturer.worker_stats), 10)
+
+    def test_failed_pages_do_not_abort_workers(self):
+        FailingCapturer = type('FailingCapturer', (FakeCapturer,), {'fail_on': ('/page3/',)})
+        capturer = FailingCapturer('http://testserver/', self.output_dir, workers=2)
+        screenshots = capturer.capture_screenshots(self.urls)
+
+        self.assertEqual(len(screenshots), 9)
+        self.assertEqual(sum(stats['failed'] for stats in capturer.worker_stats), 1)
+
+    def test_unchanged_pages_are_not_recaptured(self):
+        FakeCapturer('http://testserver', self.output_dir).capture_screenshots(self.urls)
+
+        capturer = FakeCapturer('http://testserver', self.output_dir)
+        screenshots = capturer.capture_screenshots(self.urls)
+        self.assertEqual(len(screenshots), 10)
+        self.assertEqual(capturer.driver.visited, [])
+        self.assertEqual(capturer.cache.hits, 10)
+
+        capturer = FakeCapturer('http://testserver', self.output_dir, force_recapture=True)
+        capturer.capture_screenshots(self.urls)
+        self.assertEqual(len(capturer.driver.visited), 10)
+
+    def test_viewports_share_one_page_load(self):
+        viewports = parse_viewports('desktop,phone=390x844')
+        capturer = FakeCapturer('http://testserver', self.output_dir, viewports=viewports)
+        screenshots = capturer.capture_screenshots(self.urls)
+
+        self.assertEqual(len(capturer.driver.visited), 10)
+        self.assertEqual(screenshots['/page0/'], os.path.join(self.output_dir, 'page0.png'))
+        self.assertEqual(capturer.variants['/page0/'], {
+            'desktop': os.path.join(self.output_dir, 'page0.png'),
+            'phone': os.path.join(self.output_dir, 'page0@phone.png'),
+        })
+        self.assertTrue(os.path.exists(capturer.variants['/page9/']['phone']))
+        self.assertEqual(capturer.driver.window_sizes[:2], [(1920, 1080), (390, 844)])
+
+        capturer = FakeCapturer('http://testserver', self.output_dir, viewports=viewports)
+        capturer.capture_screenshots(self.urls)
+        self.assertEqual(capturer.driver.visited, [])
+        self.assertEqual(capturer.variants['/page0/']['phone'], os.path.join(self.output_dir, 'page0@phone.png'))
+
+        with self.assertRaises(ValueError):
+            parse_viewports('desktop,watch')
+
+    def test_cached_captures_at_other_viewports_are_not_reused(self):
+        FakeCapturer('http://testserver', self.output_dir).capture_screenshots(self.urls)
+
+        capturer = FakeCapturer('http://testserver', self.output_dir, viewports=parse_viewports('mobile'))
+        screenshots = capturer.capture_screenshots(self.urls)
+        self.assertEqual(len(capturer.driver.visited), 10)
+        self.assertEqual(screenshots['/page0/'], os.path.join(self.output_dir, 'page0.png'))
+        self.assertEqual(list(capturer.variants['/page0/']), ['mobile'])
+
+    def test_samples_are_variants_of_their_pattern(self):
+        samples = [
+            {'pattern': '/items/<int:pk>/', 'name': 'item' if index == 0 else f'item-{index + 1}',
+             'path': f'/items/{index + 1}/', 'sample': index}
+            for index in range(3)
+        ]
+        viewports = parse_viewports('desktop,phone=390x844')
+        for workers in (1, 3):
+            capturer = FakeCapturer(
+                'http://testserver', self.output_dir, workers=workers, viewports=viewports, force_recapture=True
+            )
+            screenshots = capturer.capture_screenshots(self.urls + samples[::-1])
+
+            self.assertEqual(screenshots['/items/<int:pk>/'], os.path.join(self.output_dir, 'item.png'))
+            self.assertEqual(list(capturer.variants['/items/<int:pk>/'].items()), [
+                ('desktop', os.path.join(self.output_dir, 'item.png')),
+                ('phone', os.path.join(self.output_dir, 'item@phone.png')),
+                ('sample 2', os.path.join(self.output_dir, 'item-2.png')),
+                ('phone (sample 2)', os.path.join(self.output_dir, 'item-2@phone.png')),
+                ('sample 3', os.path.join(self.output_dir, 'item-3.png')),
+                ('phone (sample 3)', os.path.join(self.output_dir, 'item-3@phone.png')),
+            ])
+            self.assertEqual(len(capturer.readiness.ready_times), 13)
+
+    def test_session_is_shared_and_reused(self):
+        session_file = os.path.join(self.output_dir, 'session.json')
+        SessionCapturer.drivers = []
+        capturer = SessionCapturer(
+            'http://testserver', self.output_dir, username='admin', password='secret',
+            workers=3, session_file=session_file,
+        )
+        capturer.capture_screenshots(self.urls)
+
+        self.assertEqual(SessionCapturer.logins, 1)
+        self.assertTrue(os.path.exists(session_file))
+        self.assertEqual(len(SessionCapturer.drivers), 3)
+        for driver in SessionCapturer.drivers:
+            self.assertEqual(driver.cookies, [{'name': 'sessionid', 'value': 'abc'}])
+
+        SessionCapturer.session_is_valid = True
+        SessionCapturer.drivers = []
+        capturer = SessionCapturer(
+            'http://testserver', self.output_dir, username='admin', password='secret',
+            session_file=session_file,
+        )
+        capturer.capture_screenshots(self.urls)
+        self.assertEqual(SessionCapturer.logins, 1)
+        self.assertEqual(capturer.driver.cookies, [{'name': 'sessionid', 'value': 'abc'}])
+
+    def test_pages_are_fingerprinted_with_the_session(self):
+        session_file = os.path.join(self.output_dir, 'session.json')
+        SessionStore(session_file, 'http://testserver', 'admin').save([{'name': 'sessionid', 'value': 'abc'}])
+        SessionCapturer.session_is_valid = True
+        capturer_class = type('FingerprintCapturer', (SessionCapturer,), {'_fingerprint': ScreenshotCapturer._fingerprint})
+        sent = []
+
+        def fake_fetch(url, cookies=None, **kwargs):
+            sent.append([cookie['name'] for cookie in cookies or ()])
+            return 200, {}, b'page' if sent[-1] else b'login form'
+
+        for workers in (1, 3):
+            sent.clear()
+            capturer = capturer_class(
+                'http://testserver', self.output_dir, username='admin', password='secret',
+                workers=workers, session_file=session_file,
+            )
+            with mock.patch('django_autodoc.core.capturer.fetch', fake_fetch):
+                capturer.capture_screenshots(self.urls)
+            self.assertEqual(sent, [['sessionid']] * 10)
+
+    def tearDown(self):
+        SessionCapturer.session_is_valid = False
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+class TestReadinessPolicy(unittest.TestCase):
+    def test_strategy_selection(self):
+        policy = ReadinessPolicy(DOMStableStrategy(), {'/reports/*': '#chart', '/': 'main'})
+
+        self.assertIsInstance(policy.strategy_for('/reports/sales/'), SelectorStrategy)
+        self.assertEqual(policy.strategy_for('/reports/sales/').selector, '#chart')
+        self.assertEqual(policy.strategy_for('/').selector, 'main')
+        self.assertIsInstance(policy.strategy_for('/blog/'), DOMStableStrategy)
+        self.assertEqual(policy.page_load_strategy, 'eager')
+        self.assertEqual(ReadinessPolicy().page_load_strategy, 'normal')
+
+    def test_incomplete_strategy_cannot_be_created(self):
+        class NoCheck(ReadinessStrategy):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoCheck()
+
+    def test_ready_times_are_recorded(self):
+        policy = ReadinessPolicy(DocumentReadyStrategy())
+        policy.wait(FakeDriver(), '/blog/', time.monotonic())
+        self.assertIn('/blog/', policy.ready_times)
+
+        for pk in (1, 2):
+            policy.wait(FakeDriver(), '/blog/<int:pk>/', time.monotonic(), f'/blog/{pk}/')
+        self.assertEqual(sorted(policy.ready_times), ['/blog/', '/blog/1/', '/blog/2/'])
+
+class TestScreenshotCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def test_fingerprint_ignores_csrf_tokens(self):
+        page = '<input type="hidden" name="csrfmiddlewaretoken" value="{}">'
+        first = ScreenshotCache.fingerprint(200, {}, page.format('abc').encode())
+        second = ScreenshotCache.fingerprint(200, {}, page.format('xyz').encode())
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, ScreenshotCache.fingerprint(404, {}, page.format('abc').encode()))
+
+    def test_eviction_by_age_and_size(self):
+        cache = ScreenshotCache(self.directory, max_age=3600, max_entries=2)
+        for i in range(4):
+            path = os.path.join(self.directory, f'{i}.png')
+            open(path, 'wb').close()
+            cache.store(f'/page{i}/', 'fp', path)
+        cache.entries['/page0/']['last_used'] = time.time() - 7200
+
+        self.assertEqual(cache.evict(), 2)
+        self.assertEqual(sorted(cache.entries), ['/page2/', '/page3/'])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, '0.png')))
+
+        cache.save()
+        self.assertEqual(ScreenshotCache(self.directory).entries.keys(), cache.entries.keys())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
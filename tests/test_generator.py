@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+import unittest
+from django_autodoc.core.generator import DocumentationGenerator
+
+PROJECT_INFO = {
+    'apps': [
+        {'name': 'blog', 'label': 'blog', 'path': '/src/blog', 'models': ['post']},
+    ],
+    'models': {
+        'blog.post': {
+            'fields': [
+                {'name': 'id', 'type': 'AutoField', 'required': True},
+                {'name': 'title', 'type': 'CharField', 'required': True},
+            ],
+            'methods': [{'name': 'publish', 'defined_in': 'blog.models.Post'}],
+            'meta': {'verbose_name': 'post', 'verbose_name_plural': 'posts', 'ordering': ['-id']},
+        },
+    },
+    'urls': [
+        {'pattern': '/posts/', 'name': 'post-list', 'view_name': 'PostList', 'view_class': None},
+    ],
+    'views': {},
+    'forms': {},
+    'templates': {},
+}
+
+SECTIONS = ['index.md', 'models.md', 'views.md', 'user_guide.md', 'admin_guide.md']
+
+class TestDocumentationGenerator(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def _read(self, filename):
+        with open(os.path.join(self.output_dir, filename)) as f:
+            return f.read()
+
+    def test_sections_render_in_process_and_concurrently(self):
+        DocumentationGenerator(self.output_dir, PROJECT_INFO, workers=1).generate()
+        serial = {filename: self._read(filename) for filename in SECTIONS}
+        shutil.rmtree(self.output_dir)
+
+        generator = DocumentationGenerator(
+            self.output_dir, PROJECT_INFO, cache_dir=self.cache_dir, workers=2
+        )
+        generator.generate()
+
+        self.assertEqual({filename: self._read(filename) for filename in SECTIONS}, serial)
+        self.assertEqual(
+            set(generator.timings), {'index', 'models', 'views', 'user_guide', 'admin_guide'}
+        )
+        self.assertIn('`publish` (defined in `blog.models.Post`)', serial['models.md'])
+        self.assertTrue(os.listdir(os.path.join(self.cache_dir, 'jinja')))
+
+    def test_html_output_is_converted_in_memory(self):
+        for workers in (1, 2):
+            DocumentationGenerator(self.output_dir, PROJECT_INFO, format='html', workers=workers).generate()
+
+            self.assertEqual(
+                sorted(name for name in os.listdir(self.output_dir) if not name.startswith('.')),
+                sorted([filename[:-3] + '.html' for filename in SECTIONS] + ['search', 'search.js'])
+            )
+            models_html = self._read('models.html')
+            self.assertIn('<title>Models</title>', models_html)
+            self.assertIn('<h1 id="models-reference">Models Reference</h1>', models_html)
+
+    def test_sharded_output(self):
+        project_info = dict(PROJECT_INFO, models=dict(PROJECT_INFO['models']))
+        project_info['models']['shop.order'] = PROJECT_INFO['models']['blog.post']
+
+        DocumentationGenerator(self.output_dir, project_info, shard='app', workers=1).generate()
+        self.assertIn('[blog](models/blog.md) (1 models)', self._read('models.md'))
+        self.assertNotIn('## blog.post', self._read('models.md'))
+        self.assertIn('## shop.order', self._read('models/shop.md'))
+        self.assertIn('[Back to Index](../index.md)', self._read('models/shop.md'))
+        self.assertIn('### blog.post', self._read('admin/blog.md'))
+
+        DocumentationGenerator(self.output_dir, project_info, shard='model', workers=2).generate()
+        self.assertIn('[blog.post](models/blog/post.md)', self._read('models.md'))
+        self.assertIn('[Back to Index](../../index.md)', self._read('models/blog/post.md'))
+        self.assertIn('### shop.order', self._read('admin/shop/order.md'))
+
+        DocumentationGenerator(self.output_dir, project_info, format='html', shard='app', workers=1).generate()
+        self.assertIn('<a href="models/blog.html">blog</a>', self._read('models.html'))
+        self.assertIn('<a href="admin/shop.html">shop</a>', self._read('admin_guide.html'))
+        self.assertIn('<a href="../index.html">Back to Index</a>', self._read('models/shop.html'))
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'models', 'blog.html')))
+
+    def test_html_search_index(self):
+        import json
+        DocumentationGenerator(self.output_dir, PROJECT_INFO, format='html', shard='model', workers=2).generate()
+
+        with open(os.path.join(self.output_dir, 'search', 'index.json')) as f:
+            manifest = json.load(f)
+        self.assertIn('ti', manifest['shards'])
+        with open(os.path.join(self.output_dir, 'search', 'terms-ti.json')) as f:
+            title_ids = f.read()
+        with open(os.path.join(self.output_dir, 'search', 'docs-0.json')) as f:
+            documents = json.load(f)
+        self.assertEqual(len(documents), manifest['documents'])
+
+        ids, doc_id = [], 0
+        for gap in json.loads(title_ids)['title']:
+            doc_id += gap
+            ids.append(doc_id)
+        self.assertIn(
+            ['blog.post.title', 'models/blog/post.html#blogpost', 'field', 'Models Reference: blog.post'],
+            [documents[i] for i in ids]
+        )
+        self.assertIn(['post-list', 'views.html#post-list', 'url', 'Views Reference'], documents)
+        self.assertIn('src="../../search.js"', self._read('models/blog/post.html'))
+
+        generator = DocumentationGenerator(self.output_dir, PROJECT_INFO, format='html', shard='model', workers=1)
+        generator.generate()
+        self.assertEqual(generator.stats['written'], 0)
+        with open(os.path.join(self.output_dir, 'search', 'terms-ti.json')) as f:
+            self.assertEqual(f.read(), title_ids)
+
+    def test_markdown_output_does_not_need_search_script(self):
+        from unittest import mock
+        with mock.patch('django_autodoc.core.generator.SEARCH_SCRIPT', os.path.join(self.cache_dir, 'missing.js')):
+            DocumentationGenerator(self.output_dir, PROJECT_INFO, workers=1).generate()
+        self.assertIn('Models Reference', self._read('models.md'))
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, 'search.js')))
+
+    def test_unchanged_pages_are_not_rewritten(self):
+        generator = DocumentationGenerator(self.output_dir, PROJECT_INFO, shard='app', workers=1)
+        generator.generate()
+        self.assertEqual(generator.stats, {'written': 7, 'skipped': 0, 'deleted': 0})
+        mtime = os.stat(os.path.join(self.output_dir, 'views.md')).st_mtime_ns
+
+        generator = DocumentationGenerator(self.output_dir, PROJECT_INFO, shard='app', workers=1)
+        generator.generate()
+        self.assertEqual(generator.stats, {'written': 0, 'skipped': 7, 'deleted': 0})
+        self.assertEqual(os.stat(os.path.join(self.output_dir, 'views.md')).st_mtime_ns, mtime)
+
+        # Shards of apps that are not affected by a change are kept as they are
+        project_info = dict(PROJECT_INFO, models={'blog.post': dict(PROJECT_INFO['models']['blog.post'], methods=[])})
+        generator = DocumentationGenerator(self.output_dir, project_info, shard='app', workers=1, apps=[])
+        generator.generate()
+        self.assertEqual(generator.stats, {'written': 0, 'skipped': 7, 'deleted': 0})
+        self.assertIn('publish', self._read('models/blog.md'))
+        generator = DocumentationGenerator(self.output_dir, project_info, shard='app', workers=1, apps=['blog'])
+        generator.generate()
+        self.assertEqual(generator.stats, {'written': 1, 'skipped': 6, 'deleted': 0})
+        self.assertNotIn('publish', self._read('models/blog.md'))
+
+        generator = DocumentationGenerator(self.output_dir, PROJECT_INFO, workers=1)
+        generator.generate()
+        self.assertEqual(generator.stats, {'written': 2, 'skipped': 3, 'deleted': 2})
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, 'models')))
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
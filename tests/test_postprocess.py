@@ -0,0 +1,70 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+from django_autodoc.core.postprocess import (
+    ScreenshotProcessor, optimize_png, read_png_chunks, write_png_chunks
+)
+
+def make_png(color, level=1, size=64):
+    """Build an RGB PNG filled with one color, compressed at the given zlib level."""
+    row = b'\x00' + bytes(color) * size
+    return write_png_chunks([
+        (b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)),
+        (b'tEXt', b'Software\x00test'),
+        (b'IDAT', zlib.compress(row * size, level)),
+        (b'IEND', b''),
+    ])
+
+def pixels(data):
+    return zlib.decompress(b''.join(body for kind, body in read_png_chunks(data) if kind == b'IDAT'))
+
+class TestOptimizePNG(unittest.TestCase):
+    def test_digest_ignores_compression_and_metadata(self):
+        fast_digest, optimized = optimize_png(make_png((255, 0, 0), level=0))
+        slow_digest, _ = optimize_png(make_png((255, 0, 0), level=9))
+        other_digest, _ = optimize_png(make_png((0, 0, 255)))
+
+        self.assertEqual(fast_digest, slow_digest)
+        self.assertNotEqual(fast_digest, other_digest)
+        self.assertEqual(pixels(optimized), pixels(make_png((255, 0, 0))))
+        self.assertLess(len(optimized), len(make_png((255, 0, 0), level=0)))
+
+class TestScreenshotProcessor(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.paths = {}
+        for name, color in (('login', (1, 2, 3)), ('redirect', (1, 2, 3)), ('home', (9, 9, 9))):
+            self.paths[name] = os.path.join(self.directory, f'{name}.png')
+            with open(self.paths[name], 'wb') as f:
+                f.write(make_png(color, level=0))
+
+    def test_duplicates_are_collapsed(self):
+        processor = ScreenshotProcessor(self.directory, workers=2)
+        path_map = processor.process(self.paths.values())
+
+        shared = path_map[self.paths['login']]
+        self.assertEqual(path_map[self.paths['redirect']], shared)
+        self.assertTrue(shared.startswith(os.path.join(self.directory, '_shared')))
+        self.assertTrue(os.path.exists(shared))
+        self.assertFalse(os.path.exists(self.paths['login']))
+        self.assertFalse(os.path.exists(self.paths['redirect']))
+        self.assertEqual(path_map[self.paths['home']], self.paths['home'])
+        self.assertEqual(processor.stats['processed'], 3)
+        self.assertEqual(processor.stats['duplicates'], 1)
+        self.assertLess(processor.stats['bytes_after'], processor.stats['bytes_before'])
+
+        processor = ScreenshotProcessor(self.directory, workers=2)
+        self.assertEqual(processor.process(set(path_map.values())), {shared: shared, self.paths['home']: self.paths['home']})
+        self.assertEqual(processor.stats['processed'], 0)
+
+        self.assertEqual(processor.prune([self.paths['home']]), 1)
+        self.assertFalse(os.path.exists(shared))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
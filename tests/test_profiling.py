@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from django_autodoc.utils.profiling import Profiler, percentile
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def test_percentile(self):
+        self.assertEqual(percentile([], 0.5), 0.0)
+        self.assertEqual(percentile([3.0, 1.0, 2.0], 0.5), 2.0)
+        self.assertAlmostEqual(percentile([1.0, 2.0], 0.95), 1.95)
+
+    def test_summary_and_trace(self):
+        profiler = Profiler()
+        with profiler.span('django.setup'):
+            pass
+        for i, duration in enumerate((0.1, 0.2, 0.3, 4.0)):
+            profiler.record(f'/page{i}/', Profiler.URL_CATEGORY, time.perf_counter(), duration, cached=False)
+        for i in range(3):
+            profiler.record(f'/cached{i}/', Profiler.URL_CATEGORY, time.perf_counter(), 0.01, cached=True)
+        with profiler.span('/failing/', Profiler.URL_CATEGORY) as span:
+            span['failed'] = True
+
+        summary = profiler.summary(slowest=2)
+        self.assertEqual(summary['phases']['django.setup']['count'], 1)
+        self.assertEqual(summary['urls']['count'], 5)
+        self.assertEqual(summary['urls']['max'], 4.0)
+        self.assertAlmostEqual(summary['urls']['p50'], 0.2)
+        self.assertEqual(summary['cached_urls']['count'], 3)
+        self.assertEqual(summary['cached_urls']['max'], 0.01)
+        self.assertEqual([entry['name'] for entry in summary['slowest_urls']], ['/page3/', '/page2/'])
+
+        lines = []
+        profiler.report(lines.append)
+        self.assertTrue(any(line.startswith('Page latency over 5 URLs') for line in lines))
+        self.assertTrue(any(line.startswith('Cached pages: 3 URLs') for line in lines))
+
+        path = os.path.join(self.directory, 'trace.json')
+        profiler.write_trace(path, metadata={'workers': 2})
+        with open(path) as f:
+            trace = json.load(f)
+        self.assertEqual(len(trace['traceEvents']), 9)
+        self.assertEqual({event['ph'] for event in trace['traceEvents']}, {'X'})
+        self.assertEqual(trace['otherData']['workers'], 2)
+        failing = [event for event in trace['traceEvents'] if event['name'] == '/failing/']
+        self.assertEqual(failing[0]['args'], {'failed': True})
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler(enabled=False)
+        with profiler.span('analysis') as span:
+            span['apps'] = 3
+        profiler.record('/page/', Profiler.URL_CATEGORY, 0.0, 1.0)
+        self.assertEqual(profiler.events, [])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from django_autodoc.core.manifest import BuildManifest
+from django_autodoc.core.schema import ProjectInfo, URLInfo, read_analysis, write_analysis
+
+ANALYSIS = {
+    'apps': [{'name': 'blog', 'label': 'blog', 'path': '/src/blog', 'models': ['post']}],
+    'models': {
+        'blog.post': {
+            'fields': [{'name': 'id', 'type': 'BigAutoField', 'required': True},
+                       {'name': 'title', 'type': 'CharField', 'required': True}],
+            'methods': [{'name': 'publish', 'defined_in': 'blog.models.Post'}],
+            'meta': {'verbose_name': 'post', 'verbose_name_plural': 'posts', 'ordering': ['-id']},
+        },
+    },
+    'urls': [
+        {'pattern': '/blog/', 'name': 'blog:index', 'view_name': 'index', 'view_class': None, 'model': None},
+        {'pattern': '/blog/<int:pk>/', 'name': 'blog:detail', 'view_name': 'view',
+         'view_class': 'blog.views.PostDetail', 'model': 'blog.post'},
+    ],
+    'views': {},
+    'forms': {},
+    'templates': {},
+}
+
+class TestProjectInfo(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def test_records_read_like_analyzer_dicts(self):
+        project = ProjectInfo.from_dict(ANALYSIS)
+        post = project['models']['blog.post']
+        self.assertEqual(post.fields[1].type, 'CharField')
+        self.assertEqual(post['meta'], ANALYSIS['models']['blog.post']['meta'])
+        self.assertEqual(project.to_dict(), ANALYSIS)
+        self.assertFalse(hasattr(post, '__dict__'))
+
+        url = project.urls[1]
+        self.assertNotIn('path', url)
+        self.assertEqual(url.get('path', url['pattern']), '/blog/<int:pk>/')
+        target = URLInfo.from_dict(dict(url, pattern='/blog/1/', path='/blog/1/'))
+        self.assertEqual(target['path'], '/blog/1/')
+
+    def test_dump_round_trip(self):
+        project = ProjectInfo.from_dict(ANALYSIS)
+        sampled = URLInfo.from_dict(dict(ANALYSIS['urls'][1], path='/blog/1/'))
+        for filename in ('analysis.jsonl', 'analysis.jsonl.gz'):
+            path = os.path.join(self.output_dir, filename)
+            write_analysis(path, project, project.urls + [sampled])
+            loaded, capture_urls = read_analysis(path)
+            self.assertEqual(loaded, project)
+            self.assertEqual(capture_urls, project.urls + [sampled])
+
+    def test_rejects_other_files(self):
+        path = os.path.join(self.output_dir, 'other.jsonl')
+        with open(path, 'w') as f:
+            f.write('{"format": "something-else"}\n')
+        with self.assertRaises(ValueError):
+            read_analysis(path)
+
+    def test_inputs_key_covers_record_content(self):
+        first = ProjectInfo.from_dict(ANALYSIS)
+        second = ProjectInfo.from_dict(ANALYSIS)
+        self.assertEqual(BuildManifest.inputs_key(first.models), BuildManifest.inputs_key(second.models))
+        second.models['blog.post'].fields[1].required = False
+        self.assertNotEqual(BuildManifest.inputs_key(first.models), BuildManifest.inputs_key(second.models))
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from django_autodoc.utils import settings_discovery
+from django_autodoc.utils.settings_discovery import find_settings_module
+
+class TestFindSettingsModule(unittest.TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        settings_discovery._discovered.clear()
+
+    def write(self, relative_path, content=''):
+        path = os.path.join(self.project_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def test_skips_ignored_directories_and_non_packages(self):
+        self.write('.gitignore', '# build output\n/generated/\n')
+        for ignored in ('generated', 'venv/lib', 'node_modules/pkg', 'scripts'):
+            if ignored != 'scripts':
+                self.write(f'{ignored}/__init__.py')
+            self.write(f'{ignored}/settings.py')
+        self.write('src/mysite/__init__.py')
+        self.write('src/mysite/settings.py')
+        self.write('src/__init__.py')
+        self.assertEqual(find_settings_module(self.project_dir), 'src.mysite.settings')
+
+    def test_prefers_manage_py_and_caches_the_result(self):
+        self.write('manage.py', "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.prod')\n")
+        self.write('config/__init__.py')
+        self.write('config/settings/__init__.py')
+        self.write('config/settings/prod.py')
+        self.write('a/__init__.py')
+        self.write('a/settings.py')
+        cache_dir = os.path.join(self.project_dir, '.autodoc_cache')
+        self.assertEqual(find_settings_module(self.project_dir, cache_dir), 'config.settings.prod')
+
+        # The cached module is used while it exists and the declaring files are unchanged
+        settings_discovery._discovered.clear()
+        with mock.patch.object(settings_discovery, 'search_settings_module') as search:
+            self.assertEqual(find_settings_module(self.project_dir, cache_dir), 'config.settings.prod')
+        search.assert_not_called()
+
+        self.write('config/settings/dev.py')
+        self.write('manage.py', "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')\n")
+        settings_discovery._discovered.clear()
+        self.assertEqual(find_settings_module(self.project_dir, cache_dir), 'config.settings.dev')
+
+        self.write('config/wsgi.py', "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'a.settings')\n")
+        os.remove(os.path.join(self.project_dir, 'manage.py'))
+        settings_discovery._discovered.clear()
+        self.assertEqual(find_settings_module(self.project_dir, cache_dir), 'a.settings')
+
+        os.remove(os.path.join(self.project_dir, 'config/wsgi.py'))
+        shutil.rmtree(os.path.join(self.project_dir, 'a'))
+        settings_discovery._discovered.clear()
+        self.assertEqual(find_settings_module(self.project_dir, cache_dir), 'config.settings')
+
+    def tearDown(self):
+        settings_discovery._discovered.clear()
+        shutil.rmtree(self.project_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
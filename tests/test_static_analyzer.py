@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+from django_autodoc.core.static_analyzer import StaticProjectAnalyzer
+
+FILES = {
+    'mysite/__init__.py': '',
+    'mysite/settings.py': """
+        INSTALLED_APPS = [
+            'django.contrib.contenttypes',
+        ]
+        INSTALLED_APPS += ['blog.apps.BlogConfig']
+        ROOT_URLCONF = 'mysite.urls'
+        DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+    """,
+    'mysite/urls.py': """
+        from django.urls import include, path
+        urlpatterns = [
+            path('blog/', include('blog.urls')),
+            path('archive/', include('blog.urls', namespace='archive')),
+        ]
+    """,
+    'blog/__init__.py': 'raise RuntimeError("project code must not be executed")',
+    'blog/apps.py': """
+        from django.apps import AppConfig
+        class BlogConfig(AppConfig):
+            name = 'blog'
+            label = 'weblog'
+    """,
+    'blog/models.py': """
+        from django.db import models
+        from django.utils.translation import gettext_lazy as _
+
+        class Timestamped(models.Model):
+            created = models.DateTimeField(auto_now_add=True)
+
+            class Meta:
+                abstract = True
+
+        class BlogPost(Timestamped):
+            title = models.CharField(max_length=200)
+            author = models.ForeignKey('auth.User', null=True, on_delete=models.SET_NULL)
+
+            class Meta:
+                ordering = ['-created']
+                verbose_name = _('post')
+
+            def publish(self):
+                pass
+
+            def _private(self):
+                pass
+    """,
+    'blog/urls.py': """
+        from django.urls import path
+        from . import views
+        app_name = 'blog'
+        urlpatterns = [
+            path('', views.index, name='index'),
+            path('<int:pk>/', views.PostDetail.as_view(), name='detail'),
+        ]
+    """,
+}
+
+class TestStaticProjectAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        for relative_path, content in FILES.items():
+            path = os.path.join(self.project_dir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(textwrap.dedent(content))
+
+    def test_static_analysis(self):
+        analyzer = StaticProjectAnalyzer(self.project_dir, 'mysite.settings', workers=2)
+        result = analyzer.analyze()
+
+        self.assertEqual(set(result), {'apps', 'urls', 'models', 'views', 'forms', 'templates'})
+        self.assertEqual(
+            [(app['name'], app['label']) for app in result['apps']],
+            [('django.contrib.contenttypes', 'contenttypes'), ('blog', 'weblog')]
+        )
+        self.assertIn('contenttypes.contenttype', result['models'])
+
+        post = result['models']['weblog.blogpost']
+        self.assertEqual(
+            [(field['name'], field['type'], field['required']) for field in post['fields']],
+            [('id', 'BigAutoField', True), ('created', 'DateTimeField', True),
+             ('title', 'CharField', True), ('author', 'ForeignKey', False)]
+        )
+        self.assertEqual(post['methods'], [{'name': 'publish', 'defined_in': 'blog.models.BlogPost'}])
+        self.assertEqual(post['meta'], {
+            'verbose_name': 'post',
+            'verbose_name_plural': 'posts',
+            'ordering': ['-created'],
+        })
+        self.assertNotIn('weblog.timestamped', result['models'])
+
+        # The blog urlconf is included twice, under its app_name and an explicit namespace
+        self.assertEqual(
+            [(url['pattern'], url['name'], url['view_class']) for url in result['urls']],
+            [('/blog/', 'blog:index', None), ('/blog/<int:pk>/', 'blog:detail', 'PostDetail'),
+             ('/archive/', 'archive:index', None), ('/archive/<int:pk>/', 'archive:detail', 'PostDetail')]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.project_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
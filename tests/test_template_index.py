@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import unittest
+from django.template import Engine
+from django_autodoc.core.batch import run_batch
+from django_autodoc.core.template_index import parse_template
+
+PROJECT_FILES = {
+    'shopsite/__init__.py': '',
+    'shopsite/settings.py': """
+import os
+SECRET_KEY = 'test-key'
+INSTALLED_APPS = ['django.contrib.auth', 'django.contrib.contenttypes', 'shop']
+ROOT_URLCONF = 'shopsite.urls'
+TEMPLATES = [{
+    'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    'DIRS': [os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')],
+    'APP_DIRS': True,
+}]
+""",
+    'shopsite/urls.py': """
+from django.urls import include, path
+urlpatterns = [path('shop/', include('shop.urls'))]
+""",
+    'shop/__init__.py': '',
+    'shop/models.py': """
+from django.db import models
+class Product(models.Model):
+    name = models.CharField(max_length=100, help_text='Shown in listings')
+""",
+    'shop/forms.py': """
+from django import forms
+class ContactForm(forms.Form):
+    email = forms.EmailField()
+    message = forms.CharField(widget=forms.Textarea, required=False)
+""",
+    'shop/views.py': """
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.generic import CreateView, FormView, ListView
+from .forms import ContactForm
+from .models import Product
+class ProductList(ListView):
+    '''List all products.'''
+    model = Product
+class ProductCreate(LoginRequiredMixin, CreateView):
+    model = Product
+    fields = ['name']
+class Contact(FormView):
+    form_class = ContactForm
+    template_name = 'shop/contact.html'
+""",
+    'shop/urls.py': """
+from django.urls import path
+from . import views
+app_name = 'shop'
+urlpatterns = [
+    path('', views.ProductList.as_view(), name='list'),
+    path('new/', views.ProductCreate.as_view(), name='create'),
+    path('contact/', views.Contact.as_view(), name='contact'),
+]
+""",
+    'templates/base.html': '{% block content %}{% endblock %}{% include "shop/nav.html" %}',
+    'shop/templates/shop/nav.html': '<a href="{% url "shop:list" %}">{{ user.username }}</a>',
+    'shop/templates/shop/product_list.html': (
+        '{% extends "base.html" %}{% block content %}'
+        '{% for product in object_list %}{{ product.name }}{% endfor %}{% endblock %}'
+    ),
+    'shop/templates/shop/contact.html': '{% extends "base.html" %}{% block content %}{{ form }}{% endblock %}',
+}
+
+class TestTemplateIndex(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def test_parse_template(self):
+        path = os.path.join(self.work_dir, 'page.html')
+        with open(path, 'w') as f:
+            f.write(
+                '{% extends "base.html" %}{% block body %}{% include "nav.html" %}'
+                '{% for item in items %}{{ item.title }}{% endfor %}'
+                '<a href="{% url "blog:index" %}">{{ page.title|upper }}</a>{% endblock %}'
+            )
+        info = parse_template(Engine(), 'page.html', path)
+
+        self.assertEqual(info['extends'], 'base.html')
+        self.assertEqual(info['includes'], ['nav.html'])
+        self.assertEqual(info['blocks'], ['body'])
+        self.assertEqual(info['urls'], ['blog:index'])
+        self.assertEqual(info['context'], ['items', 'page'])
+        self.assertNotIn('error', info)
+
+        with open(path, 'w') as f:
+            f.write('{% load missing_library %}')
+        self.assertIn('TemplateSyntaxError', parse_template(Engine(), 'page.html', path)['error'])
+
+    def test_views_forms_and_templates(self):
+        project_dir = os.path.join(self.work_dir, 'project')
+        for name, source in PROJECT_FILES.items():
+            path = os.path.join(project_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(source)
+        job = {'project': project_dir, 'settings': 'shopsite.settings', 'cache_dir': os.path.join(self.work_dir, 'cache')}
+
+        for _ in range(2):
+            result = next(run_batch([job]))
+            self.assertEqual(result['status'], 'ok', result['error'])
+            project = result['project']
+
+            templates = project.templates
+            self.assertEqual(sorted(templates['base.html']['extended_by']), ['shop/contact.html', 'shop/product_list.html'])
+            self.assertEqual(templates['shop/nav.html']['included_by'], ['base.html'])
+
+            views = project.views
+            self.assertEqual(views['/shop/']['base'], 'django.views.generic.list.ListView')
+            self.assertEqual(views['/shop/']['description'], 'List all products.')
+            self.assertEqual(views['/shop/']['template'], 'shop/product_list.html')
+            self.assertEqual(views['/shop/']['template_chain'], ['base.html'])
+            self.assertEqual(views['/shop/']['includes'], ['shop/nav.html'])
+            self.assertTrue(views['/shop/new/']['login_required'])
+            self.assertFalse(views['/shop/new/']['template_exists'])
+
+            forms = project.forms
+            self.assertEqual(views['/shop/contact/']['form'], 'shop.forms.ContactForm')
+            self.assertEqual(
+                [(field['name'], field['widget'], field['required']) for field in forms['shop.forms.ContactForm']['fields']],
+                [('email', 'EmailInput', True), ('message', 'Textarea', False)],
+            )
+            generated = forms[views['/shop/new/']['form']]
+            self.assertEqual(generated['model'], 'shop.product')
+            self.assertEqual(generated['fields'][0]['help_text'], 'Shown in listings')
+        self.assertEqual(result['cache_misses'], 0)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+import unittest
+from django_autodoc.core.url_sampler import fill_pattern, pattern_parameters
+
+# Django can only be configured once per process, and the other tests set it
+# up without a database, so sampling is tested in a fresh interpreter with an
+# in-memory SQLite database
+SAMPLER_TEST = """
+import sys
+import unittest
+import django
+from django.conf import settings
+settings.configure(
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+    INSTALLED_APPS=['django.contrib.auth', 'django.contrib.contenttypes'],
+)
+django.setup()
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.test.runner import DiscoverRunner
+from django_autodoc.core.url_sampler import resolve_parameterized_urls
+
+def url(pattern, name, model):
+    return {'pattern': pattern, 'name': name, 'view_name': None, 'view_class': None, 'model': model}
+
+class ResolveParameterizedURLs(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editors = Group.objects.create(name='editors')
+        cls.admins = Group.objects.create(name='site admins')
+
+    def test_one_query_per_model(self):
+        urls = [
+            url('/groups/', 'group-list', 'auth.group'),
+            url('/groups/<int:pk>/', 'group', 'auth.group'),
+            url('/groups/<slug:name>/', None, 'auth.group'),
+            url('/types/<int:pk>/', 'type', 'contenttypes.contenttype'),
+            url('/types/<slug:app_label>/<slug:model>/', 'type-model', 'contenttypes.contenttype'),
+            url('/users/<int:pk>/', 'user', 'auth.missing'),
+        ]
+        with self.assertNumQueries(2):
+            targets = resolve_parameterized_urls(urls, samples=3)
+
+        groups = [target for target in targets if target['model'] == 'auth.group']
+        self.assertEqual(
+            sorted((target['pattern'], target['path'], target['name'], target['sample']) for target in groups),
+            [
+                ('/groups/<int:pk>/', f'/groups/{self.editors.pk}/', 'group', 0),
+                ('/groups/<int:pk>/', f'/groups/{self.admins.pk}/', 'group-2', 1),
+                # 'site admins' is not a slug, so it cannot fill this pattern
+                ('/groups/<slug:name>/', '/groups/editors/', 'groups_editors', 0),
+            ],
+        )
+
+        types = [target for target in targets if target['model'] == 'contenttypes.contenttype']
+        self.assertEqual(len(types), 6)
+        self.assertEqual(
+            {target['pattern'] for target in types},
+            {'/types/<int:pk>/', '/types/<slug:app_label>/<slug:model>/'},
+        )
+        self.assertEqual(sorted(target['sample'] for target in types), [0, 0, 1, 1, 2, 2])
+        self.assertIn(
+            '/types/auth/group/', [target['path'] for target in types if target['name'].startswith('type-model')]
+        )
+
+    def test_models_without_rows(self):
+        Group.objects.all().delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_parameterized_urls([url('/groups/<int:pk>/', 'group', 'auth.group')]), [])
+
+runner = DiscoverRunner(verbosity=0)
+runner.setup_test_environment()
+databases = runner.setup_databases()
+result = unittest.TextTestRunner(verbosity=0).run(
+    unittest.defaultTestLoader.loadTestsFromTestCase(ResolveParameterizedURLs)
+)
+runner.teardown_databases(databases)
+sys.exit(not result.wasSuccessful())
+"""
+
+class TestURLSampler(unittest.TestCase):
+    def test_pattern_parameters(self):
+        self.assertEqual(
+            pattern_parameters('blog/<slug:slug>/<int:pk>/<username>/'),
+            [('slug', 'slug'), ('int', 'pk'), ('str', 'username')]
+        )
+        self.assertEqual(pattern_parameters('blog/'), [])
+
+    def test_fill_pattern(self):
+        self.assertEqual(
+            fill_pattern('blog/<slug:slug>/<int:pk>/', {'slug': 'hello-world', 'pk': 42}),
+            'blog/hello-world/42/'
+        )
+
+    def test_fill_pattern_rejects_values_that_do_not_match_converter(self):
+        self.assertIsNone(fill_pattern('blog/<slug:slug>/', {'slug': 'not a slug'}))
+        self.assertIsNone(fill_pattern('blog/<int:pk>/', {'pk': None}))
+        self.assertIsNone(fill_pattern('blog/<int:pk>/', {}))
+
+    def test_resolve_parameterized_urls(self):
+        result = subprocess.run(
+            [sys.executable, '-c', SAMPLER_TEST],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
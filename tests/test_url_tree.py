@@ -0,0 +1,55 @@
+import unittest
+from django_autodoc.core.url_tree import flatten_urlconf, route_segment
+
+class TestFlattenUrlconf(unittest.TestCase):
+    def flatten(self, urlconfs, root='root'):
+        def include_of(entry):
+            if 'include' not in entry:
+                return None
+            return entry['include'], route_segment(entry['pattern']), entry.get('namespace')
+
+        def leaf_of(entry):
+            return dict(entry, pattern=route_segment(entry['pattern']))
+
+        return flatten_urlconf(root, urlconfs.__getitem__, include_of, leaf_of)
+
+    def test_composes_paths_and_namespaces(self):
+        urls = self.flatten({
+            'root': [
+                {'pattern': '', 'name': 'home'},
+                {'pattern': '^blog/', 'include': 'blog', 'namespace': 'blog'},
+                {'pattern': 'old/', 'include': 'blog', 'namespace': 'old'},
+            ],
+            'blog': [
+                {'pattern': r'^(?P<pk>\d+)/$', 'name': 'detail'},
+                {'pattern': 'api/', 'include': 'api', 'namespace': 'api'},
+            ],
+            'api': [{'pattern': 'posts/', 'name': 'posts'}],
+        })
+        self.assertEqual([(url['pattern'], url['name']) for url in urls], [
+            ('/', 'home'),
+            (r'/blog/(?P<pk>\d+)/', 'blog:detail'),
+            ('/blog/api/posts/', 'blog:api:posts'),
+            (r'/old/(?P<pk>\d+)/', 'old:detail'),
+            ('/old/api/posts/', 'old:api:posts'),
+        ])
+
+    def test_deep_and_recursive_urlconfs(self):
+        depth = 5000
+        urlconfs = {level: [{'pattern': 'a/', 'include': level + 1}] for level in range(depth)}
+        urlconfs[0].append({'pattern': 'x/', 'name': 'x'})
+        urlconfs[depth] = [{'pattern': 'leaf/', 'name': 'leaf'}, {'pattern': 'loop/', 'include': 0}]
+        urls = self.flatten(urlconfs, root=0)
+        self.assertEqual([url['name'] for url in urls], ['leaf', 'x'])
+        self.assertEqual(urls[0]['pattern'], '/' + 'a/' * depth + 'leaf/')
+
+    def test_shared_include_is_not_a_cycle(self):
+        urls = self.flatten({
+            'root': [
+                {'pattern': 'c/', 'include': 'c'},
+                {'pattern': 'a/', 'include': 'a'},
+            ],
+            'a': [{'pattern': 'c/', 'include': 'c'}],
+            'c': [{'pattern': 'x/', 'name': 'x'}],
+        })
+        self.assertEqual([url['pattern'] for url in urls], ['/c/x/', '/a/c/x/'])
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+from django_autodoc.core.watcher import ProjectWatcher, affected_apps, run_isolated, url_affected
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+class TestProjectWatcher(unittest.TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        _write(os.path.join(self.project_dir, 'blog', 'models.py'), "# models\n")
+        _write(os.path.join(self.project_dir, 'blog', 'templates', 'blog', 'list.html'), "<ul></ul>\n")
+        _write(os.path.join(self.project_dir, 'docs', 'index.md'), "# Index\n")
+
+    def test_poll_reports_added_modified_and_removed_files(self):
+        watcher = ProjectWatcher(self.project_dir, ignore=[os.path.join(self.project_dir, 'docs')])
+        self.assertEqual(watcher.poll(), set())
+
+        models = os.path.join(self.project_dir, 'blog', 'models.py')
+        template = os.path.join(self.project_dir, 'blog', 'templates', 'blog', 'list.html')
+        views = os.path.join(self.project_dir, 'blog', 'views.py')
+        _write(models, "# models, changed\n")
+        _write(views, "# views\n")
+        os.remove(template)
+        _write(os.path.join(self.project_dir, 'docs', 'models.md'), "# Models\n")
+        _write(os.path.join(self.project_dir, 'blog', '__pycache__', 'models.py'), "")
+
+        self.assertEqual(watcher.poll(), {models, views, template})
+        self.assertEqual(watcher.poll(), set())
+
+    def test_wait_for_changes_times_out(self):
+        watcher = ProjectWatcher(self.project_dir, interval=0.01)
+        self.assertEqual(watcher.wait_for_changes(timeout=0.05), set())
+
+    def test_changes_affect_the_apps_holding_them(self):
+        blog = os.path.join(self.project_dir, 'blog')
+        shop = os.path.join(self.project_dir, 'shop')
+        post = {'fields': [{'name': 'title', 'type': 'CharField', 'required': True}]}
+        previous = {
+            'apps': [
+                {'name': 'blog', 'label': 'blog', 'path': blog},
+                {'name': 'shop', 'label': 'shop', 'path': shop},
+                {'name': 'django.contrib.admin', 'label': 'admin', 'path': '/site-packages/django/contrib/admin'},
+            ],
+            'models': {'blog.post': post, 'shop.product': {'fields': []}},
+            'urls': [
+                {'pattern': '/blog/', 'model': 'blog.post'},
+                {'pattern': '/shop/', 'model': 'shop.product'},
+                {'pattern': '/shop/posts/', 'model': None},
+                {'pattern': '/admin/', 'model': None},
+            ],
+            'views': {
+                '/blog/': {'view': 'blog.views.PostList', 'template': 'blog/list.html'},
+                '/shop/': {'view': 'shop.views.ProductList', 'template': 'shop/list.html'},
+                '/shop/posts/': {'view': 'shop.views.Posts', 'template': 'shop/posts.html', 'includes': ['blog/list.html']},
+                '/admin/': {'view': 'django.contrib.admin.sites.index', 'template': None},
+            },
+            'templates': {
+                'blog/list.html': {'path': os.path.join(blog, 'templates', 'blog', 'list.html')},
+                'shop/list.html': {'path': os.path.join(shop, 'templates', 'shop', 'list.html')},
+                'shop/posts.html': {'path': os.path.join(shop, 'templates', 'shop', 'posts.html')},
+            },
+        }
+
+        apps = affected_apps([os.path.join(blog, 'templates', 'blog', 'list.html')], previous, previous)
+        self.assertEqual(apps, {'blog'})
+        self.assertEqual(
+            [url['pattern'] for url in previous['urls'] if url_affected(url, previous, apps, self.project_dir)],
+            ['/blog/', '/shop/posts/', '/admin/'],
+        )
+
+        # Models changed through code outside the app, e.g. an abstract base in another app
+        current = dict(previous, models={'blog.post': post, 'shop.product': {'fields': [post['fields'][0]]}})
+        self.assertEqual(affected_apps([os.path.join(blog, 'models.py')], current, previous), {'blog', 'shop'})
+
+        self.assertIsNone(affected_apps([os.path.join(self.project_dir, 'settings.py')], previous, previous))
+        self.assertIsNone(affected_apps([], dict(previous, apps=previous['apps'][:2]), previous))
+
+    def test_run_isolated_returns_result(self):
+        self.assertNotEqual(run_isolated(os.getpid), os.getpid())
+
+    def tearDown(self):
+        shutil.rmtree(self.project_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()